@@ -0,0 +1,119 @@
+"""
+Benchmark de arranque en frío de la aplicación
+
+Cada medición corre en un proceso nuevo (como un contenedor recién levantado):
+
+    importacion   tiempo de los imports de nivel superior de app.py
+    primer_render tiempo de la primera ejecución del script (sección Inicio)
+    seccion       tiempo de la primera ejecución de cada sección al elegirla
+
+También informa qué módulos pesados quedaron cargados después de cada
+render, para verificar que solo se importan los de la sección elegida. El
+render incluye la obtención de datos, por lo que conviene medir con la cache
+en disco ya poblada.
+
+Uso:
+    python benchmarks/arranque.py
+    python benchmarks/arranque.py -n 5 --json logs/arranque.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, 'app.py')
+
+SECCIONES = ["🏠 Inicio", "💰 Indicadores Económicos", "🌍 Sismos en Chile",
+             "📈 Análisis Comparativo", "📊 Dashboard Interactivo"]
+
+# Módulos cuya carga interesa seguir
+MODULOS_PESADOS = ['plotly.express', 'plotly.subplots', 'matplotlib', 'seaborn', 'pyarrow',
+                   'utils.comparacion', 'utils.almacen_sismos']
+
+MEDIR_IMPORTACION = """
+import json, time
+inicio = time.perf_counter()
+exec(compile({codigo!r}, 'app.py', 'exec'))
+print(json.dumps({{'segundos': time.perf_counter() - inicio}}))
+"""
+
+MEDIR_RENDER = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+inicio = time.perf_counter()
+at.run()
+segundos = time.perf_counter() - inicio
+if {seccion!r} != {inicio_app!r}:
+    inicio = time.perf_counter()
+    at.sidebar.selectbox[0].select({seccion!r}).run()
+    segundos = time.perf_counter() - inicio
+print(json.dumps({{
+    'segundos': segundos,
+    'excepciones': [str(e.value) for e in at.exception],
+    'modulos': [m for m in {modulos!r} if m in sys.modules],
+}}))
+"""
+
+
+def imports_de_app():
+    """Código con solo los imports de nivel superior de app.py"""
+    with open(APP, encoding='utf-8') as f:
+        arbol = ast.parse(f.read())
+    imports = [nodo for nodo in arbol.body if isinstance(nodo, (ast.Import, ast.ImportFrom))]
+    return ast.unparse(ast.Module(body=imports, type_ignores=[]))
+
+
+def ejecutar(codigo):
+    """Ejecuta el código en un intérprete nuevo y retorna el JSON que imprime"""
+    salida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True,
+                            text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def medir(codigo, repeticiones):
+    """Mediana de los segundos de varias ejecuciones y el detalle de la última"""
+    resultados = [ejecutar(codigo) for _ in range(repeticiones)]
+    detalle = resultados[-1]
+    detalle['segundos'] = statistics.median(r['segundos'] for r in resultados)
+    return detalle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de arranque en frío de app.py")
+    parser.add_argument('-n', '--repeticiones', type=int, default=3, help="ejecuciones por medición")
+    parser.add_argument('--json', help="archivo donde agregar los resultados (una línea JSON por corrida)")
+    args = parser.parse_args(argv)
+
+    resultados = {'fecha': datetime.now().isoformat(timespec='seconds'), 'repeticiones': args.repeticiones}
+
+    print("⏱️  Midiendo imports de app.py...")
+    resultados['importacion'] = medir(MEDIR_IMPORTACION.format(codigo=imports_de_app()), args.repeticiones)
+    print(f"   {resultados['importacion']['segundos'] * 1000:8.1f} ms")
+
+    resultados['secciones'] = {}
+    for seccion in SECCIONES:
+        print(f"⏱️  Primer render de {seccion}...")
+        codigo = MEDIR_RENDER.format(app=APP, seccion=seccion, inicio_app=SECCIONES[0], modulos=MODULOS_PESADOS)
+        medicion = medir(codigo, args.repeticiones)
+        resultados['secciones'][seccion] = medicion
+        print(f"   {medicion['segundos'] * 1000:8.1f} ms  módulos: {', '.join(medicion['modulos']) or '-'}")
+        for excepcion in medicion['excepciones']:
+            print(f"   ❌ {excepcion}")
+    resultados['primer_render'] = resultados['secciones'][SECCIONES[0]]['segundos']
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(resultados, ensure_ascii=False) + '\n')
+        print(f"📁 Resultados agregados a {args.json}")
+
+
+if __name__ == '__main__':
+    main()
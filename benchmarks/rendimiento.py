@@ -0,0 +1,281 @@
+"""
+Benchmark de las rutas de obtención, transformación y visualización
+
+Mide, sobre payloads grabados de tamaño creciente, cada etapa por la que pasan
+los datos en la aplicación:
+
+    indicadores   1 año (un payload) y 10 años (diez payloads concatenados)
+    sismos        1.000, 100.000 y 1.000.000 de eventos
+
+    parseo        json.loads de la respuesta
+    normalizacion normalizar_serie / normalizar_sismos (y concatenación)
+    indexacion    AlmacenSismos (índices ordenados y espacial)
+    filtro        rango de fechas + submuestreo / consulta por magnitud y profundidad
+    estadisticas  ResumenSerie y analítica móvil / estadísticas y agregados espaciales
+    figura        construcción de la figura Plotly (y tamaño serializado en JSON)
+
+De cada etapa se informa la mediana y el mínimo del tiempo y el pico de
+memoria (medido con tracemalloc en una ejecución aparte). De cada escenario se
+informa además la memoria del DataFrame genérico que arma pandas con la
+respuesta frente a la del esquema normalizado (reporte_memoria). Los payloads se
+generan una sola vez con los generadores del servidor simulado y se guardan en
+<DATA_DIR>/benchmarks/, de modo que todas las corridas usan los mismos datos.
+
+Los resultados se guardan en JSON (uno por commit) para comparar entre commits:
+
+    python benchmarks/rendimiento.py
+    python benchmarks/rendimiento.py --rapido --comparar benchmarks/resultados/<commit>.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+import numpy as np
+import pandas as pd
+
+from utils.almacen_sismos import AlmacenSismos
+from utils.analisis import estadisticas_sismos
+from utils.analisis_movil import AnalisisMovil
+from utils.cache_disco import DIRECTORIO_DATOS
+from utils.cache_figuras import CacheFiguras
+from utils.data_processing import normalizar_serie, normalizar_sismos, reporte_memoria
+from utils.resumen import ResumenSerie
+from utils.servidor_simulado import serie_sintetica, sismos_sinteticos
+from utils.submuestreo import submuestrear
+
+DIRECTORIO_PAYLOADS = os.path.join(DIRECTORIO_DATOS, 'benchmarks')
+DIRECTORIO_RESULTADOS = os.path.join(RAIZ, 'benchmarks', 'resultados')
+
+AÑOS_INDICADOR = [str(año) for año in range(2015, 2025)]
+
+# Fecha de referencia fija de los payloads sintéticos: se generan igual en cualquier equipo
+FECHA_PAYLOADS = date(2025, 1, 1)
+TAMAÑOS_SISMOS = [1_000, 100_000, 1_000_000]
+
+# Con --rapido se omite el escenario más grande
+TAMAÑOS_SISMOS_RAPIDO = [1_000, 100_000]
+
+# Una etapa se marca como regresión si su mediana empeora más que esta proporción
+UMBRAL_REGRESION = 0.2
+
+
+def payload(nombre, generar):
+    """Bytes del payload grabado `nombre`; se genera y graba si no existe"""
+    ruta = os.path.join(DIRECTORIO_PAYLOADS, f'{nombre}.json')
+    if not os.path.exists(ruta):
+        os.makedirs(DIRECTORIO_PAYLOADS, exist_ok=True)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(generar(), f, ensure_ascii=False)
+        os.replace(temporal, ruta)
+    with open(ruta, 'rb') as f:
+        return f.read()
+
+
+def medir(funcion, repeticiones):
+    """Ejecuta `funcion` varias veces; retorna (resultado, métricas de tiempo y memoria)"""
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    # El pico de memoria se mide aparte: tracemalloc altera los tiempos
+    resultado = None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        resultado = funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return resultado, {
+        'mediana_s': statistics.median(tiempos),
+        'minimo_s': min(tiempos),
+        'pico_memoria_bytes': pico,
+    }
+
+
+def tamaño_serializado(fig):
+    """Bytes del JSON que se envía al navegador"""
+    return len(fig.to_json().encode('utf-8'))
+
+
+def escenario_indicador(nombre, años, repeticiones):
+    """Etapas de un indicador cuyo período abarca `años` (un payload por año)"""
+    import plotly.express as px
+
+    crudos = [payload(f'uf_{año}', lambda año=año: serie_sintetica('uf', año, hoy=FECHA_PAYLOADS)) for año in años]
+    etapas = {}
+
+    respuestas, etapas['parseo'] = medir(lambda: [json.loads(crudo) for crudo in crudos], repeticiones)
+
+    def normalizar():
+        partes = [normalizar_serie(respuesta['serie']) for respuesta in respuestas]
+        return pd.concat(partes) if len(partes) > 1 else partes[0]
+    df, etapas['normalizacion'] = medir(normalizar, repeticiones)
+    memoria = reporte_memoria([registro for respuesta in respuestas for registro in respuesta['serie']],
+                              normalizar_serie)
+
+    # Rango: el último 25% del período, submuestreado al ancho del gráfico
+    desde = df.index[int(len(df) * 0.75)]
+    filtrado, etapas['filtro'] = medir(lambda: submuestrear(df.loc[desde:], 'valor'), repeticiones)
+
+    def estadisticas():
+        # Cache nueva en cada ejecución: se mide el cálculo, no el acierto
+        return (ResumenSerie.desde_valores(df['valor'].to_numpy()).describe(),
+                AnalisisMovil().analizar(df))
+    _, etapas['estadisticas'] = medir(estadisticas, repeticiones)
+
+    fig, etapas['figura'] = medir(lambda: px.line(submuestrear(df, 'valor'), y='valor'), repeticiones)
+    etapas['figura']['serializado_bytes'] = tamaño_serializado(fig)
+
+    return {
+        'escenario': nombre,
+        'filas': len(df),
+        'payload_bytes': sum(len(crudo) for crudo in crudos),
+        'filas_filtradas': len(filtrado),
+        'memoria': memoria,
+        'etapas': etapas,
+    }
+
+
+def escenario_sismos(cantidad, repeticiones):
+    """Etapas de una respuesta de `cantidad` sismos"""
+    crudo = payload(f'sismos_{cantidad}', lambda: sismos_sinteticos(cantidad, hoy=FECHA_PAYLOADS))
+    etapas = {}
+
+    registros, etapas['parseo'] = medir(lambda: json.loads(crudo), repeticiones)
+    df, etapas['normalizacion'] = medir(lambda: normalizar_sismos(registros), repeticiones)
+    memoria = reporte_memoria(registros, normalizar_sismos)
+    del registros
+
+    almacen, etapas['indexacion'] = medir(lambda: AlmacenSismos(df), repeticiones)
+
+    filtros = {'mag_min': 4.0, 'prof_max': 100.0}
+    filtrado, etapas['filtro'] = medir(lambda: almacen.consultar(**filtros), repeticiones)
+
+    def estadisticas():
+        return estadisticas_sismos(filtrado), almacen.agregados_espaciales()
+    (_, agregados), etapas['estadisticas'] = medir(estadisticas, repeticiones)
+
+    def figuras():
+        # Cache nueva en cada ejecución: se mide la construcción
+        cache = CacheFiguras()
+        return (cache.figura(filtrado, 'histogram', x='Magnitud', nbins=20),
+                cache.figura(agregados, 'scatter_geo', lat='Latitud', lon='Longitud', size='cantidad'))
+    (histograma, mapa), etapas['figura'] = medir(figuras, repeticiones)
+    etapas['figura']['serializado_bytes'] = tamaño_serializado(histograma) + tamaño_serializado(mapa)
+
+    return {
+        'escenario': f'sismos_{cantidad}',
+        'filas': len(df),
+        'payload_bytes': len(crudo),
+        'filas_filtradas': len(filtrado),
+        'memoria': memoria,
+        'etapas': etapas,
+    }
+
+
+def commit_actual():
+    """Hash corto del commit (con '-dirty' si hay cambios sin confirmar), o None fuera de git"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        cambios = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=RAIZ,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+        return f'{commit}-dirty' if cambios else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(actual, base):
+    """Imprime la variación de la mediana de cada etapa respecto de otra corrida"""
+    anteriores = {r['escenario']: r['etapas'] for r in base['resultados']}
+    print(f"\n📈 Comparación con {base.get('commit')} ({base.get('fecha')}):")
+    regresiones = 0
+    for resultado in actual['resultados']:
+        for etapa, metricas in resultado['etapas'].items():
+            anterior = anteriores.get(resultado['escenario'], {}).get(etapa)
+            if not anterior or not anterior['mediana_s']:
+                continue
+            cambio = metricas['mediana_s'] / anterior['mediana_s'] - 1
+            marca = '❌' if cambio > UMBRAL_REGRESION else '✅'
+            regresiones += cambio > UMBRAL_REGRESION
+            print(f"   {marca} {resultado['escenario']:<16} {etapa:<14} {cambio:+7.1%}")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de obtención, transformación y visualización")
+    parser.add_argument('-n', '--repeticiones', type=int, default=5, help="ejecuciones por etapa")
+    parser.add_argument('--rapido', action='store_true', help="omite el escenario de 1.000.000 de sismos")
+    parser.add_argument('-e', '--escenarios', nargs='+', help="solo estos escenarios (p. ej. sismos_1000000)")
+    parser.add_argument('-o', '--salida', help="archivo JSON de resultados (por defecto resultados/<commit>.json)")
+    parser.add_argument('--comparar', help="JSON de una corrida anterior contra el cual comparar")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    escenarios = [
+        ('indicador_1_año', lambda: escenario_indicador('indicador_1_año', AÑOS_INDICADOR[-1:], args.repeticiones)),
+        ('indicador_10_años', lambda: escenario_indicador('indicador_10_años', AÑOS_INDICADOR, args.repeticiones)),
+    ] + [
+        (f'sismos_{cantidad}', lambda cantidad=cantidad: escenario_sismos(cantidad, args.repeticiones))
+        for cantidad in (TAMAÑOS_SISMOS_RAPIDO if args.rapido else TAMAÑOS_SISMOS)
+    ]
+
+    if args.escenarios:
+        escenarios = [(nombre, ejecutar) for nombre, ejecutar in escenarios if nombre in args.escenarios]
+
+    for nombre, ejecutar in escenarios:
+        print(f"⏱️  {nombre}...")
+        resultado = ejecutar()
+        resultados.append(resultado)
+        memoria = resultado['memoria']
+        print(f"   {'memoria':<14} {memoria['antes'] / 1024:10,.0f} KB genérico -> "
+              f"{memoria['despues'] / 1024:,.0f} KB normalizado ({memoria['reduccion']:.0%} menos)")
+        for etapa, metricas in resultado['etapas'].items():
+            extra = f"  json {metricas['serializado_bytes'] / 1024:,.0f} KB" if 'serializado_bytes' in metricas else ''
+            print(f"   {etapa:<14} {metricas['mediana_s'] * 1000:10.2f} ms  "
+                  f"pico {metricas['pico_memoria_bytes'] / 1024 ** 2:8.1f} MB{extra}")
+
+    commit = commit_actual()
+    corrida = {
+        'commit': commit,
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'repeticiones': args.repeticiones,
+        'resultados': resultados,
+    }
+
+    salida = args.salida or os.path.join(DIRECTORIO_RESULTADOS, f"{commit or 'sin-commit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump(corrida, f, ensure_ascii=False, indent=2)
+    print(f"📁 Resultados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            return 1 if comparar(corrida, json.load(f)) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Análisis completo por línea de comandos (sin Streamlit)
+
+Analiza varios indicadores y años en paralelo en un pool de procesos, más los
+sismos recientes, y deja los resultados en exports/<fecha-hora>/:
+
+    resumen_indicadores.csv   una fila por indicador y año
+    <indicador>_<año>.parquet serie con retornos, volatilidad, medias y drawdown
+    sismos.parquet            eventos descargados
+    resumen.json              estadísticas de sismos y errores de la ejecución
+
+Uso:
+    python ejemplos/analisis_completo.py
+    python ejemplos/analisis_completo.py --demo
+    python ejemplos/analisis_completo.py -i uf dolar -a 2022 2023 2024 -p 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+
+# Permite ejecutar el script directamente desde la raíz del proyecto
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+import pandas as pd
+
+from utils import fuentes
+from utils.analisis import INDICADORES, analizar_indicador, distribucion_magnitudes, estadisticas_sismos
+from utils.analisis_movil import VENTANA_VOLATILIDAD, VENTANAS_MEDIA
+from utils.data_processing import sin_ruido_float32
+from utils.exportacion import DIRECTORIO_EXPORTS
+
+AÑOS_DEFECTO = [str(año) for año in range(2021, date.today().year + 1)]
+
+# Configuración reducida de --demo
+INDICADORES_DEMO = ['uf', 'dolar']
+AÑOS_DEMO = [str(date.today().year)]
+
+
+def analizar_tarea(indicador, año, ventana_volatilidad, ventanas_media, directorio):
+    """Analiza un (indicador, año) en un proceso del pool y guarda su serie
+
+    Retorna la fila del resumen, o None si no hay datos.
+    """
+    resultado = analizar_indicador(indicador, año, ventana_volatilidad=ventana_volatilidad,
+                                   ventanas_media=ventanas_media)
+    if resultado is None:
+        return None
+    resultado['analisis'].to_parquet(os.path.join(directorio, f"{indicador}_{año}.parquet"))
+    return resultado['resumen']
+
+
+def analizar_sismos(directorio):
+    """Descarga los sismos, los guarda y retorna sus estadísticas"""
+    df = fuentes.obtener_sismos()
+    if df.empty:
+        return {'cantidad': 0}
+    # Magnitudes y coordenadas con los decimales de la API (las columnas float32 tienen ruido binario)
+    df = sin_ruido_float32(df)
+    df.to_parquet(os.path.join(directorio, 'sismos.parquet'))
+    estadisticas = estadisticas_sismos(df)
+    if 'Magnitud' in df.columns:
+        estadisticas['distribucion_magnitudes'] = {
+            f"{desde:.1f}": int(cantidad) for desde, cantidad in distribucion_magnitudes(df).items()
+        }
+    return estadisticas
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Análisis completo de indicadores económicos y sismos de Chile")
+    parser.add_argument('--demo', action='store_true',
+                        help=f"análisis reducido ({', '.join(INDICADORES_DEMO)} del año en curso)")
+    parser.add_argument('-i', '--indicadores', nargs='+', choices=list(INDICADORES), default=list(INDICADORES),
+                        help="indicadores a analizar (por defecto todos)")
+    parser.add_argument('-a', '--años', nargs='+', default=AÑOS_DEFECTO,
+                        help=f"años a analizar (por defecto {AÑOS_DEFECTO[0]}-{AÑOS_DEFECTO[-1]})")
+    parser.add_argument('-p', '--procesos', type=int, default=os.cpu_count(),
+                        help="procesos en paralelo")
+    parser.add_argument('--ventana-volatilidad', type=int, default=VENTANA_VOLATILIDAD,
+                        help="ventana de la volatilidad móvil (registros)")
+    parser.add_argument('--ventanas-media', type=int, nargs='+', default=list(VENTANAS_MEDIA),
+                        help="ventanas de las medias móviles (registros)")
+    parser.add_argument('--sin-sismos', action='store_true', help="omite el análisis de sismos")
+    parser.add_argument('-o', '--salida', default=DIRECTORIO_EXPORTS,
+                        help="directorio base de resultados")
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    if args.demo:
+        args.indicadores, args.años = INDICADORES_DEMO, AÑOS_DEMO
+
+    directorio = os.path.join(args.salida, datetime.now().strftime('%Y%m%d-%H%M%S'))
+    os.makedirs(directorio, exist_ok=True)
+
+    tareas = [(indicador, año) for indicador in args.indicadores for año in args.años]
+    print(f"📊 Analizando {len(tareas)} series con {args.procesos} procesos...")
+    inicio = time.perf_counter()
+
+    filas, errores = [], {}
+    with ProcessPoolExecutor(max_workers=args.procesos) as pool:
+        futuros = {
+            pool.submit(analizar_tarea, indicador, año, args.ventana_volatilidad,
+                        tuple(args.ventanas_media), directorio): (indicador, año)
+            for indicador, año in tareas
+        }
+        for futuro in as_completed(futuros):
+            indicador, año = futuros[futuro]
+            try:
+                fila = futuro.result()
+            except Exception as e:
+                errores[f"{indicador}/{año}"] = str(e)
+                print(f"   ❌ {indicador} {año}: {e}")
+                continue
+            if fila is None:
+                print(f"   ⚠️  {indicador} {año}: sin datos")
+            else:
+                filas.append(fila)
+                print(f"   ✅ {indicador} {año}: {int(fila['count'])} registros, "
+                      f"variación {fila['variacion_porcentual']:.2f}%")
+
+    if filas:
+        resumen = pd.DataFrame(filas).sort_values(['indicador', 'periodo'])
+        # Las estadísticas de series float32 se informan con la precisión de la fuente
+        resumen = sin_ruido_float32(resumen, columnas=list(resumen.select_dtypes('float').columns))
+        resumen.to_csv(os.path.join(directorio, 'resumen_indicadores.csv'), index=False)
+
+    sismos = None
+    if not args.sin_sismos:
+        print("🌍 Analizando sismos...")
+        try:
+            sismos = analizar_sismos(directorio)
+            print(f"   ✅ {sismos['cantidad']} sismos")
+        except Exception as e:
+            errores['sismos'] = str(e)
+            print(f"   ❌ Sismos: {e}")
+
+    with open(os.path.join(directorio, 'resumen.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'generado_en': datetime.now().isoformat(timespec='seconds'),
+            'indicadores': args.indicadores,
+            'años': args.años,
+            'series_analizadas': len(filas),
+            'sismos': sismos,
+            'errores': errores,
+            'duracion_segundos': round(time.perf_counter() - inicio, 2),
+        }, f, ensure_ascii=False, indent=2)
+
+    print(f"📁 Resultados en {directorio}")
+    return 1 if errores else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Secciones de la aplicación: un módulo por sección, cada uno con render()"""
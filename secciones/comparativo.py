@@ -0,0 +1,183 @@
+"""
+Sección Análisis Comparativo: alineación y correlación de varios indicadores
+"""
+
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from secciones.comun import obtener_rangos_indicadores
+from utils.analisis import INDICADORES
+from utils.cache_figuras import figuras, huella, tamaño_estimado_figura
+from utils.comparacion import (FRECUENCIAS, alinear, indices_normalizados, variaciones,
+                               matriz_correlacion, correlacion_movil, beta_movil)
+from utils.metricas import ERRORES, RERUN, TRANSFORMACION
+
+
+def render():
+    """Comparación de varios indicadores"""
+    st.markdown("## 📈 Análisis Comparativo de Indicadores")
+    
+    st.markdown("### Compara múltiples indicadores económicos")
+    
+    # Selección de indicadores y período para comparar
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        seleccionados = st.multiselect(
+            "Indicadores:",
+            list(INDICADORES.keys()),
+            default=['uf', 'dolar'],
+            format_func=lambda x: INDICADORES[x],
+            key="ind_comp"
+        )
+    
+    with col2:
+        rango_comparacion = st.date_input(
+            "Período:",
+            value=(date(2023, 1, 1), date(2024, 12, 31)),
+            min_value=date(2000, 1, 1),
+            max_value=date.today(),
+            key="rango_comp"
+        )
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        frecuencia = st.selectbox("Frecuencia:", list(FRECUENCIAS.keys()), key="frec_comp")
+    
+    with col2:
+        metodo_alineacion = st.radio(
+            "Alineación:", ["asof", "promedio"],
+            format_func=lambda x: "Último valor conocido" if x == "asof" else "Promedio del período",
+            horizontal=True, key="alin_comp"
+        )
+    
+    with col3:
+        ventana = st.slider("Ventana móvil (períodos):", 5, 90, 30, key="ventana_comp")
+    
+    if st.button("🔄 Comparar Indicadores", type="primary"):
+        if len(seleccionados) < 2:
+            st.warning("⚠️ Selecciona al menos dos indicadores")
+        elif not isinstance(rango_comparacion, tuple) or len(rango_comparacion) != 2:
+            st.warning("⚠️ Selecciona la fecha de inicio y de término")
+        else:
+            st.session_state['analisis_comparativo'] = (
+                tuple(seleccionados), *rango_comparacion, FRECUENCIAS[frecuencia], metodo_alineacion, ventana
+            )
+    
+    if 'analisis_comparativo' in st.session_state:
+        _mostrar_comparacion()
+
+
+@st.fragment
+@RERUN.medir(seccion='comparativo', fragmento='mostrar_comparacion')
+def _mostrar_comparacion():
+    """Resultado de la comparación; el indicador de referencia solo vuelve a ejecutar este fragmento"""
+    seleccionados, inicio, fin, codigo_frecuencia, metodo_alineacion, ventana = st.session_state['analisis_comparativo']
+    
+    with st.spinner("Obteniendo datos para comparación..."):
+        # Todos los (indicador, año) se descargan en paralelo
+        rangos = obtener_rangos_indicadores(seleccionados, inicio, fin)
+    
+    series = {}
+    nombres = {}
+    resumenes = {}
+    for indicador in seleccionados:
+        serie, nombre, resumen = rangos.get(indicador, (None, None, None))
+        if serie is not None and not serie.empty:
+            nombres[indicador] = nombre or indicador
+            series[nombres[indicador]] = serie
+            resumenes[nombres[indicador]] = resumen
+    
+    sin_datos = [INDICADORES[i] for i in seleccionados if i not in nombres]
+    if sin_datos:
+        st.warning(f"⚠️ Sin datos en el período para: {', '.join(sin_datos)}")
+    
+    alineado = None
+    if len(series) >= 2:
+        with TRANSFORMACION.medir(etapa='alinear'):
+            alineado = alinear(series, codigo_frecuencia, metodo_alineacion)
+    
+    if alineado is not None and len(alineado) > 1:
+        st.caption(f"{len(alineado)} períodos alineados · {alineado.index[0]:%d-%m-%Y} a {alineado.index[-1]:%d-%m-%Y}")
+        huella_alineado = huella(alineado)
+    
+        if len(alineado.columns) == 2:
+            # Con dos indicadores se mantiene el gráfico de doble eje
+            nombre1, nombre2 = alineado.columns
+    
+            def construir_comparacion():
+                fig = make_subplots(specs=[[{"secondary_y": True}]])
+                fig.add_trace(go.Scatter(x=alineado.index, y=alineado[nombre1], name=nombre1), secondary_y=False)
+                fig.add_trace(go.Scatter(x=alineado.index, y=alineado[nombre2], name=nombre2), secondary_y=True)
+                fig.update_xaxes(title_text="Fecha")
+                fig.update_yaxes(title_text=nombre1, secondary_y=False)
+                fig.update_yaxes(title_text=nombre2, secondary_y=True)
+                fig.update_layout(title_text=f"Comparación: {nombre1} vs {nombre2}")
+                return fig
+    
+            fig = figuras.obtener_o_construir(
+                ('comparacion', huella_alineado), construir_comparacion, tamaño_estimado_figura(alineado), 'doble_eje')
+            st.plotly_chart(fig, use_container_width=True)
+    
+        # Evolución relativa: todas las series parten en 100
+        indices = indices_normalizados(alineado)
+        if not indices.empty:
+            indices_largo = indices.rename_axis('fecha').reset_index().melt(
+                id_vars='fecha', var_name='indicador', value_name='indice')
+            fig = figuras.figura(indices_largo, 'line', x='fecha', y='indice', color='indicador',
+                                 titulo="Evolución relativa (base 100)")
+            st.plotly_chart(fig, use_container_width=True)
+    
+        cambios = variaciones(alineado)
+    
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            # Correlación de las variaciones, no de los niveles
+            correlaciones = matriz_correlacion(cambios)
+            fig = figuras.obtener_o_construir(
+                ('correlacion', huella(correlaciones)),
+                lambda: px.imshow(correlaciones, text_auto='.2f', zmin=-1, zmax=1,
+                                  color_continuous_scale='RdBu', title="Matriz de correlación"),
+                tamaño_estimado_figura(correlaciones), 'imshow')
+            st.plotly_chart(fig, use_container_width=True)
+    
+        with col2:
+            st.markdown("### 📊 Estadísticas")
+            # Los resúmenes vienen calculados junto con los rangos (no se recorren las series en cada rerun)
+            estadisticas = pd.DataFrame({nombre: resumen.describe() for nombre, resumen in resumenes.items()})
+            st.dataframe(estadisticas)
+    
+        if len(cambios) > ventana:
+            referencia = st.selectbox("Indicador de referencia:", list(alineado.columns), key="ref_comp")
+            otros = [c for c in alineado.columns if c != referencia]
+    
+            col1, col2 = st.columns(2)
+    
+            with col1:
+                movil = correlacion_movil(cambios, referencia, ventana)[otros].dropna(how='all')
+                movil_largo = movil.rename_axis('fecha').reset_index().melt(
+                    id_vars='fecha', var_name='indicador', value_name='correlacion')
+                fig = figuras.figura(movil_largo, 'line', x='fecha', y='correlacion', color='indicador',
+                                     titulo=f"Correlación móvil vs {referencia} ({ventana} períodos)")
+                st.plotly_chart(fig, use_container_width=True)
+    
+            with col2:
+                betas = beta_movil(cambios, referencia, ventana)[otros].dropna(how='all')
+                betas_largo = betas.rename_axis('fecha').reset_index().melt(
+                    id_vars='fecha', var_name='indicador', value_name='beta')
+                fig = figuras.figura(betas_largo, 'line', x='fecha', y='beta', color='indicador',
+                                     titulo=f"Beta móvil vs {referencia} ({ventana} períodos)")
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("ℹ️ El período es demasiado corto para la ventana móvil elegida")
+    
+    else:
+        ERRORES.incrementar(origen='comparativo')
+        st.error("❌ No se pudieron obtener datos para la comparación")
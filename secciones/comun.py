@@ -0,0 +1,308 @@
+"""
+Datos y componentes compartidos por las secciones de la aplicación
+
+Las funciones con cache de Streamlit se definen una sola vez aquí (y no en
+cada rerun del script principal).
+"""
+
+import os
+import threading
+from concurrent.futures import wait
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from utils import fuentes
+from utils.almacen_series import almacen_series
+from utils.analisis import INDICADORES
+from utils.exportacion import FORMATOS, exportador
+from utils.historial_sismos import historial
+from utils.metricas import ERRORES
+from utils.refresco import RefrescadorFondo, formatear_edad
+from utils.resumen import ResumenSerie
+
+# Funciones para obtener datos de APIs
+# La cache en memoria se apoya en la cache compartida (utils/cache_compartido.py),
+# por lo que cada réplica solo guarda en memoria una cantidad acotada de rangos
+MAXIMO_RANGOS = 32
+
+# Las series completas se sirven con st.cache_resource desde el almacén mapeado en
+# memoria (utils/almacen_series.py): todas las sesiones comparten el mismo DataFrame
+# de solo lectura en vez de recibir cada una su copia. Con copy-on-write (activado
+# en utils/__init__.py) modificarlo genera una copia privada de la sesión
+def _publicar_indicador(indicador, año, ttl=fuentes.TTL_CACHE):
+    """Obtiene un indicador y entrega (versión mapeada en memoria, nombre, resumen)"""
+    df, nombre, resumen = fuentes.obtener_indicador_con_resumen(indicador, año, ttl=ttl)
+    return almacen_series.publicar(('mindicador', indicador, str(año)), df), nombre, resumen
+
+def _publicar_sismos(ttl=fuentes.TTL_CACHE):
+    """Obtiene los sismos y entrega su versión mapeada en memoria"""
+    return almacen_series.publicar(('sismos', 'gael'), fuentes.obtener_sismos(ttl=ttl))
+
+def obtener_indicador_con_resumen(indicador, año='2024'):
+    """(df, nombre, resumen) de un indicador; serie y resumen salen de la misma llamada cacheada"""
+    try:
+        # Los años cerrados no cambian: se mantienen en memoria sin vencimiento
+        if fuentes.es_periodo_cerrado(año):
+            return _obtener_indicador_historico(indicador, año)
+        return _obtener_indicador_año_actual(indicador, año)
+    except Exception as e:
+        # Los errores se muestran fuera de la cache: el próximo rerun vuelve a intentar
+        ERRORES.incrementar(origen='indicadores')
+        st.error(f"Error al obtener datos de {indicador}: {str(e)}")
+        return None, None, None
+
+def obtener_indicadores_economicos(indicador, año='2024'):
+    """Obtiene indicadores económicos desde mindicador.cl"""
+    df, nombre, _ = obtener_indicador_con_resumen(indicador, año)
+    return df, nombre
+
+@st.cache_resource(max_entries=64)
+def _obtener_indicador_historico(indicador, año):
+    """Obtiene la serie de un año cerrado"""
+    return _publicar_indicador(indicador, año)
+
+@st.cache_resource(ttl=3600)  # Cache por 1 hora
+def _obtener_indicador_año_actual(indicador, año):
+    """Obtiene la serie del año en curso"""
+    return _publicar_indicador(indicador, año)
+
+class RangoIncompleto(Exception):
+    """Rango al que le faltan años; se lanza para que st.cache_data no guarde el resultado parcial"""
+
+    def __init__(self, rangos, faltantes):
+        super().__init__(f"{len(faltantes)} años sin datos")
+        self.rangos = rangos
+        self.faltantes = faltantes
+
+def _con_resumen(rangos):
+    """Agrega a cada rango su resumen, calculado una sola vez junto con la serie"""
+    return {indicador: (serie, nombre,
+                        None if serie is None or serie.empty else ResumenSerie.desde_valores(serie.to_numpy()))
+            for indicador, (serie, nombre) in rangos.items()}
+
+@st.cache_data(ttl=3600, max_entries=MAXIMO_RANGOS)
+def _obtener_rangos(indicadores, inicio, fin):
+    """Todos los años de varios indicadores en una sola tanda de descargas, con el resumen de cada serie"""
+    faltantes = []
+    rangos = _con_resumen(fuentes.obtener_rangos_indicadores(list(indicadores), inicio, fin, faltantes=faltantes))
+    if faltantes:
+        # El próximo rerun vuelve a intentar los años que faltan
+        raise RangoIncompleto(rangos, faltantes)
+    return rangos
+
+def obtener_rangos_indicadores(indicadores, inicio, fin):
+    """Obtiene varios indicadores entre dos fechas como {indicador: (serie, nombre, resumen)}
+
+    Los años que fallan se informan como datos faltantes.
+    """
+    try:
+        return _obtener_rangos(tuple(indicadores), inicio, fin)
+    except RangoIncompleto as e:
+        ERRORES.incrementar(origen='indicadores')
+        faltantes = ', '.join(f"{INDICADORES.get(indicador, indicador)} {año}" for indicador, año, _ in e.faltantes)
+        st.warning(f"⚠️ No se pudieron obtener (se muestran sin esos datos): {faltantes}")
+        return e.rangos
+    except Exception as e:
+        ERRORES.incrementar(origen='indicadores')
+        st.error(f"Error al obtener los indicadores: {str(e)}")
+        return {}
+
+def obtener_rango_indicador(indicador, inicio, fin):
+    """Obtiene un indicador entre dos fechas como (serie indexada por fecha, nombre, resumen)"""
+    return obtener_rangos_indicadores([indicador], inicio, fin).get(indicador, (None, None, None))
+
+# Días del historial en disco que se cargan en el almacén en memoria
+DIAS_HISTORIAL_ALMACEN = 365
+
+@st.cache_resource
+def almacen_sismos():
+    """Almacén indexado de sismos del proceso, que acumula el historial entre descargas"""
+    from utils.almacen_sismos import AlmacenSismos
+    
+    # Se parte del último año del historial en disco
+    desde = pd.Timestamp.now() - pd.Timedelta(days=DIAS_HISTORIAL_ALMACEN)
+    return AlmacenSismos(historial.leer_rango(desde=desde).drop(columns='id_evento', errors='ignore'),
+                         publicar=lambda df: almacen_series.publicar(('sismos', 'almacen'), df))
+
+@st.cache_data(ttl=300)
+def contar_sismos_recientes(dias=7):
+    """Sismos registrados en el historial durante los últimos días"""
+    return historial.contar_rango(desde=pd.Timestamp.now() - pd.Timedelta(days=dias))
+
+def obtener_sismos():
+    """Obtiene datos de sismos desde la API de Gael Cloud"""
+    try:
+        return _obtener_sismos()
+    except Exception as e:
+        # Los errores se muestran fuera de la cache: el próximo rerun vuelve a intentar
+        ERRORES.incrementar(origen='sismos')
+        st.error(f"Error al obtener datos de sismos: {str(e)}")
+        return pd.DataFrame()
+
+@st.cache_resource(ttl=3600)
+def _obtener_sismos():
+    """Descarga los sismos y los agrega al almacén del proceso"""
+    df = _publicar_sismos()
+    almacen_sismos().agregar(df)
+    return df
+
+# Indicadores que muestran Inicio y Dashboard (se refrescan en segundo plano)
+INDICADORES_TABLERO = ['uf', 'dolar']
+INTERVALO_REFRESCO = fuentes.TTL_CACHE / 4  # Se refresca bastante antes de que venza la cache
+
+def claves_tablero():
+    """Claves (indicador, año) del tablero: siempre el año en curso, que es el que cambia"""
+    año = str(date.today().year)
+    return [(indicador, año) for indicador in INDICADORES_TABLERO]
+
+@st.cache_resource
+def _refrescador():
+    """Inicia una sola vez por proceso el refresco en segundo plano"""
+    refrescador = RefrescadorFondo()
+    refrescador.registrar('sismos', lambda: _publicar_sismos(ttl=INTERVALO_REFRESCO), INTERVALO_REFRESCO)
+    refrescador.iniciar()
+    return refrescador
+
+def iniciar_refrescador():
+    """Refrescador del proceso con las claves del tablero del año en curso
+
+    Al cambiar el año se registran las claves nuevas y se dejan de refrescar
+    las del año anterior, que ya es un período cerrado.
+    """
+    refrescador = _refrescador()
+    vigentes = claves_tablero()
+    registradas = refrescador.claves()
+    for clave in registradas:
+        if clave != 'sismos' and clave not in vigentes:
+            refrescador.quitar(clave)
+    for indicador, año in vigentes:
+        if (indicador, año) not in registradas:
+            refrescador.registrar((indicador, año),
+                                  lambda i=indicador, a=año: _publicar_indicador(i, a, ttl=INTERVALO_REFRESCO)[:2],
+                                  INTERVALO_REFRESCO)
+    return refrescador
+
+def obtener_datos_en_paralelo(pares, incluir_sismos=True):
+    """Obtiene varios indicadores y los sismos, entregando cada resultado al terminar
+
+    Lo que ya tiene el refresco en segundo plano se entrega de inmediato; el
+    resto se consulta en paralelo.
+    """
+    ctx = get_script_run_ctx()
+    refrescador = iniciar_refrescador()
+
+    pendientes = []
+    for par in pares:
+        valor, _ = refrescador.obtener(par)
+        if valor is None:
+            pendientes.append(par)
+        else:
+            yield par, valor, None
+    if incluir_sismos:
+        valor, _ = refrescador.obtener('sismos')
+        if valor is not None:
+            incluir_sismos = False
+            yield 'sismos', valor, None
+
+    def en_contexto(funcion):
+        # Los hilos del pool necesitan el contexto de la sesión para usar st.*
+        def envoltura(*args):
+            add_script_run_ctx(threading.current_thread(), ctx)
+            return funcion(*args)
+        return envoltura
+
+    yield from fuentes.obtener_lote(pendientes, incluir_sismos,
+                                    funcion_indicador=en_contexto(obtener_indicadores_economicos),
+                                    funcion_sismos=en_contexto(obtener_sismos))
+
+def mostrar_antiguedad(claves):
+    """Muestra la antigüedad de los datos servidos para cada clave (clave, etiqueta)"""
+    refrescador = iniciar_refrescador()
+    textos = []
+    for clave, etiqueta in claves:
+        _, edad = refrescador.obtener(clave)
+        textos.append(f"{etiqueta} {formatear_edad(edad)}")
+    st.caption("🕒 Datos actualizados: " + " · ".join(textos))
+
+# Función auxiliar para verificar si una columna existe y tiene datos
+def verificar_columna(df, columna):
+    """Verifica si una columna existe y tiene datos válidos"""
+    return columna in df.columns and not df[columna].isna().all()
+
+def aplicar_zoom(df, clave, columna=None):
+    """Muestra un control de zoom por fechas y retorna solo las filas del período elegido"""
+    fechas = pd.DatetimeIndex(df.index if columna is None else df[columna])
+    minimo, maximo = fechas.min(), fechas.max()
+    if pd.isna(minimo) or minimo == maximo:
+        return df
+    
+    # El slider trabaja con fechas sin zona horaria
+    if fechas.tz is not None:
+        minimo, maximo = minimo.tz_convert(None), maximo.tz_convert(None)
+    desde, hasta = st.slider("🔍 Zoom (período):",
+                             min_value=minimo.to_pydatetime(), max_value=maximo.to_pydatetime(),
+                             value=(minimo.to_pydatetime(), maximo.to_pydatetime()),
+                             format="DD/MM/YYYY", key=f"{clave}_{minimo}_{maximo}")
+    desde, hasta = pd.Timestamp(desde), pd.Timestamp(hasta)
+    if desde == minimo and hasta == maximo:
+        return df
+    
+    if fechas.tz is not None:
+        desde, hasta = desde.tz_localize('UTC').tz_convert(fechas.tz), hasta.tz_localize('UTC').tz_convert(fechas.tz)
+    return df[(fechas >= desde) & (fechas <= hasta)]
+
+# Segundos que se espera una exportación antes de mostrarla como pendiente
+ESPERA_EXPORTACION = 5
+
+def mostrar_exportacion(clave, version, obtener, nombre, indice=True):
+    """Controles para exportar datos a Parquet, Arrow IPC o CSV en segundo plano
+
+    `obtener` entrega el DataFrame a exportar y se ejecuta en el hilo de la
+    exportación; `version` identifica su contenido, de modo que pedir de nuevo
+    lo mismo reutiliza el archivo ya generado en exports/. La exportación
+    recordada en la sesión solo se muestra mientras `version` y el formato
+    elegido sigan siendo los mismos.
+    """
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        formato = st.selectbox("Formato de exportación:", list(FORMATOS),
+                               format_func=lambda f: FORMATOS[f][0], key=f"{clave}_formato")
+    with col2:
+        if st.button("📦 Exportar", key=f"{clave}_exportar"):
+            st.session_state[f"{clave}_exportacion"] = (
+                version, formato, exportador.solicitar((clave, version), obtener, nombre, formato, indice=indice))
+    
+    if f"{clave}_exportacion" not in st.session_state:
+        return
+    version_exportada, formato_exportado, futuro = st.session_state[f"{clave}_exportacion"]
+    if (version_exportada, formato_exportado) != (version, formato):
+        # Cambiaron los datos o el formato: la exportación anterior ya no corresponde
+        del st.session_state[f"{clave}_exportacion"]
+        return
+    
+    with st.spinner("Generando exportación..."):
+        wait([futuro], timeout=ESPERA_EXPORTACION)
+    if not futuro.done():
+        st.info("⏳ La exportación sigue en curso")
+        st.button("🔄 Actualizar", key=f"{clave}_actualizar")
+        return
+    
+    if futuro.exception() is None and not os.path.exists(futuro.result()):
+        # El archivo se limpió de exports/ (trabajo descartado o demasiado antiguo)
+        del st.session_state[f"{clave}_exportacion"]
+        st.info("La exportación anterior ya no está disponible; vuelve a exportar")
+        return
+    
+    try:
+        ruta = futuro.result()
+        with open(ruta, 'rb') as archivo:
+            st.download_button(f"⬇️ Descargar {FORMATOS[formato][0]}", archivo, file_name=os.path.basename(ruta),
+                               mime=FORMATOS[formato][2], key=f"{clave}_descargar")
+    except Exception as e:
+        ERRORES.incrementar(origen='exportacion')
+        st.error(f"Error al exportar los datos: {str(e)}")
+        return
+    st.caption(f"Archivo guardado en {ruta} ({os.path.getsize(ruta) / 1024:,.1f} KB)")
@@ -0,0 +1,116 @@
+"""
+Sección Dashboard Interactivo: vista consolidada de las fuentes
+"""
+
+import pandas as pd
+import streamlit as st
+
+from secciones.comun import (claves_tablero, contar_sismos_recientes, mostrar_antiguedad,
+                             obtener_datos_en_paralelo, verificar_columna)
+from utils.cache_figuras import figuras
+
+
+def render():
+    """Vista consolidada de indicadores y sismos"""
+    st.markdown("## 📊 Dashboard Interactivo")
+    
+    with st.spinner("Cargando dashboard..."):
+        # Layout del dashboard
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("### 💰 UF")
+        with col2:
+            st.markdown("### 💵 Dólar")
+        with col3:
+            st.markdown("### 🌍 Sismos")
+        
+        # Obtener múltiples datos en paralelo; cada columna se completa apenas llega su fuente
+        uf, dolar = claves_tablero()
+        for clave, resultado, error in obtener_datos_en_paralelo([uf, dolar]):
+            
+            # Columna UF
+            if clave == uf:
+                df_uf = resultado[0] if error is None else None
+                with col1:
+                    if df_uf is not None and not df_uf.empty:
+                        uf_actual = df_uf['valor'].iloc[-1]
+                        uf_anterior = df_uf['valor'].iloc[-2] if len(df_uf) > 1 else uf_actual
+                        delta_uf = uf_actual - uf_anterior
+                        st.metric("Valor UF", f"${uf_actual:,.0f}", f"{delta_uf:+.0f}")
+                        
+                        # Gráfico pequeño UF
+                        fig_uf = figuras.figura(df_uf.tail(30), 'line', y='valor', titulo="UF - Últimos 30 días",
+                                                alto=300, layout={'showlegend': False})
+                        st.plotly_chart(fig_uf, use_container_width=True)
+                    else:
+                        st.info("Datos de UF no disponibles")
+            
+            # Columna Dólar
+            elif clave == dolar:
+                df_dolar = resultado[0] if error is None else None
+                with col2:
+                    if df_dolar is not None and not df_dolar.empty:
+                        dolar_actual = df_dolar['valor'].iloc[-1]
+                        dolar_anterior = df_dolar['valor'].iloc[-2] if len(df_dolar) > 1 else dolar_actual
+                        delta_dolar = dolar_actual - dolar_anterior
+                        st.metric("Valor Dólar", f"${dolar_actual:,.0f}", f"{delta_dolar:+.0f}")
+                        
+                        # Gráfico pequeño Dólar
+                        fig_dolar = figuras.figura(df_dolar.tail(30), 'line', y='valor', titulo="Dólar - Últimos 30 días",
+                                                   alto=300, layout={'showlegend': False})
+                        st.plotly_chart(fig_dolar, use_container_width=True)
+                    else:
+                        st.info("Datos de Dólar no disponibles")
+            
+            # Columna Sismos
+            else:
+                df_sismos = resultado if error is None else pd.DataFrame()
+                with col3:
+                    if not df_sismos.empty:
+                        sismos_recientes = contar_sismos_recientes(7)
+                        st.metric("Sismos últimos 7 días", sismos_recientes)
+                        
+                        if verificar_columna(df_sismos, 'Magnitud'):
+                            mag_promedio = df_sismos['Magnitud'].tail(10).mean()
+                            st.metric("Mag. promedio", f"{mag_promedio:.1f}")
+                            
+                            # Gráfico sismos
+                            fig_sismos = figuras.figura(df_sismos.tail(50), 'histogram', x='Magnitud', 
+                                                        titulo="Distribución Magnitudes",
+                                                        alto=300, layout={'showlegend': False})
+                            st.plotly_chart(fig_sismos, use_container_width=True)
+                        else:
+                            st.info("Datos de magnitud no disponibles")
+                    else:
+                        st.info("Datos sísmicos no disponibles")
+        
+        mostrar_antiguedad([(uf, "UF"), (dolar, "Dólar"), ('sismos', "Sismos")])
+        
+        # Sección de resumen
+        st.markdown("---")
+        st.markdown("### 📋 Resumen del Proyecto")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **🔧 Tecnologías Utilizadas:**
+            - Python 3.x
+            - Streamlit para la interfaz web
+            - Requests para consumo de APIs
+            - Pandas para análisis de datos
+            - Plotly para visualizaciones interactivas
+            - APIs REST públicas de Chile
+            """)
+        
+        with col2:
+            st.markdown("""
+            **📊 Funcionalidades Implementadas:**
+            - Conexión a múltiples APIs REST
+            - Análisis estadístico de datos
+            - Visualizaciones interactivas
+            - Dashboard en tiempo real
+            - Comparación de indicadores
+            - Filtros dinámicos
+            """)
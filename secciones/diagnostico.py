@@ -0,0 +1,63 @@
+"""
+Panel de diagnóstico: caches, APIs, tiempos de ejecución y errores del proceso
+"""
+
+import pandas as pd
+import streamlit as st
+
+from utils.almacen_series import almacen_series
+from utils.cliente_http import cliente
+from utils.metricas import ERRORES, RERUN, SINGLEFLIGHT, proporcion_aciertos
+
+
+def render(puerto=None):
+    """Resumen de las métricas del proceso (se muestra en el sidebar)"""
+    st.markdown("### 🩺 Diagnóstico")
+
+    st.markdown("**Caches (aciertos)**")
+    for cache, etiqueta in [('disco', "Disco"), ('figuras', "Figuras"), ('analisis_movil', "Análisis móvil")]:
+        proporcion = proporcion_aciertos(cache)
+        st.caption(f"{etiqueta}: {'-' if proporcion is None else f'{proporcion:.0%}'}")
+
+    mapeadas = almacen_series.estadisticas()
+    st.caption(f"Series mapeadas: {mapeadas['series']} ({mapeadas['bytes_mapeados'] / 1024 ** 2:,.1f} MB)")
+
+    vuelos = {}
+    for etiquetas, cantidad in SINGLEFLIGHT.valores().items():
+        etiquetas = dict(etiquetas)
+        if etiquetas.get('grupo') == 'fuentes':
+            vuelos[etiquetas.get('resultado')] = cantidad
+    if vuelos:
+        emitidas, agrupadas = vuelos.get('emitida', 0), vuelos.get('agrupada', 0)
+        st.caption(f"Consultas agrupadas: {agrupadas:,.0f} de {emitidas + agrupadas:,.0f} "
+                   f"({agrupadas / (emitidas + agrupadas):.0%})")
+
+    estadisticas = cliente.estadisticas()
+    if estadisticas:
+        st.markdown("**APIs**")
+        st.dataframe(pd.DataFrame({
+            host: {
+                'solicitudes': datos['solicitudes'],
+                'errores': datos['errores'],
+                'media (ms)': round(datos['latencia_media'] * 1000),
+                'máx (ms)': round(datos['latencia_max'] * 1000),
+                'circuito': datos['circuito'],
+            }
+            for host, datos in estadisticas.items()
+        }).T)
+
+    reruns = RERUN.valores()
+    if reruns:
+        st.markdown("**Ejecución del script y los fragmentos (promedio)**")
+        for etiquetas, serie in sorted(reruns.items()):
+            etiquetas = dict(etiquetas)
+            st.caption(f"{etiquetas.get('seccion', '')} / {etiquetas.get('fragmento', 'script')}: {serie['suma'] / serie['cantidad'] * 1000:,.0f} ms ({serie['cantidad']} ejecuciones)")
+
+    errores = ERRORES.valores()
+    if errores:
+        st.markdown("**Errores**")
+        for etiquetas, cantidad in sorted(errores.items()):
+            st.caption(f"{dict(etiquetas).get('origen', '')}: {cantidad:,.0f}")
+
+    if puerto:
+        st.caption(f"Métricas Prometheus: http://127.0.0.1:{puerto}/metrics")
@@ -0,0 +1,186 @@
+"""
+Sección Indicadores Económicos: análisis de un indicador por año o rango de fechas
+"""
+
+from datetime import date
+
+import streamlit as st
+
+from secciones.comun import (aplicar_zoom, mostrar_exportacion, obtener_indicador_con_resumen,
+                             obtener_rango_indicador)
+from utils.analisis import INDICADORES
+from utils.analisis_movil import analisis_movil, indicadores_finales
+from utils.cache_figuras import figuras
+from utils.data_processing import uso_memoria
+from utils.metricas import ERRORES, RERUN
+from utils.submuestreo import submuestrear
+
+
+def render():
+    """Análisis de un indicador"""
+    st.markdown("## 💰 Indicadores Económicos de Chile")
+    
+    # Selector de indicador
+    indicadores = INDICADORES
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        indicador_seleccionado = st.selectbox(
+            "Selecciona un indicador:",
+            list(indicadores.keys()),
+            format_func=lambda x: indicadores[x]
+        )
+    
+    with col2:
+        año = st.selectbox("Año:", ["2024", "2023", "2022", "2021", "Rango de fechas"])
+    
+    with col3:
+        tipo_grafico = st.selectbox("Tipo de gráfico:", ["Línea", "Area", "Barras"])
+    
+    # Análisis de varios años en una sola consulta
+    if año == "Rango de fechas":
+        rango = st.date_input("Período:", value=(date(2021, 1, 1), date(2024, 12, 31)),
+                              min_value=date(2000, 1, 1), max_value=date.today())
+        inicio, fin = (rango[0], rango[-1]) if rango else (date(2021, 1, 1), date(2024, 12, 31))
+        periodo = f"{inicio:%d-%m-%Y} a {fin:%d-%m-%Y}"
+    else:
+        inicio = fin = None
+        periodo = año
+    
+    if st.button("📊 Analizar Indicador", type="primary"):
+        # Se recuerda el análisis para que el zoom del gráfico no lo cierre
+        st.session_state['analisis_indicador'] = (indicador_seleccionado, año, periodo, inicio, fin)
+    
+    if 'analisis_indicador' in st.session_state:
+        _mostrar_analisis(tipo_grafico)
+
+
+@st.fragment
+@RERUN.medir(seccion='indicadores', fragmento='mostrar_analisis')
+def _mostrar_analisis(tipo_grafico):
+    """Resultado del análisis; las ventanas móviles y el zoom solo vuelven a ejecutar este fragmento"""
+    indicador_seleccionado, año, periodo, inicio, fin = st.session_state['analisis_indicador']
+    with st.spinner(f"Obteniendo datos de {INDICADORES[indicador_seleccionado]}..."):
+        if año == "Rango de fechas":
+            serie, nombre_indicador, resumen = obtener_rango_indicador(indicador_seleccionado, inicio, fin)
+            df = serie.to_frame() if serie is not None else None
+        else:
+            # La serie y su resumen vienen de la misma llamada: métricas, gráfico y tabla siempre coinciden
+            df, nombre_indicador, resumen = obtener_indicador_con_resumen(indicador_seleccionado, año)
+    
+        if df is not None and not df.empty and resumen is not None:
+            st.success(f"✅ Datos obtenidos exitosamente: {len(df)} registros")
+    
+            # Métricas principales
+            col1, col2, col3, col4 = st.columns(4)
+    
+            with col1:
+                st.metric("Valor Actual", f"${resumen.ultimo:,.2f}")
+    
+            with col2:
+                promedio = resumen.media
+                st.metric("Promedio", f"${promedio:,.2f}")
+    
+            with col3:
+                maximo = resumen.maximo
+                st.metric("Máximo", f"${maximo:,.2f}")
+    
+            with col4:
+                minimo = resumen.minimo
+                st.metric("Mínimo", f"${minimo:,.2f}")
+    
+            # Gráfico principal
+            st.markdown("### 📈 Evolución Temporal")
+    
+            # El zoom aplica a todos los gráficos del indicador
+            df_zoom = aplicar_zoom(df, "zoom_indicador")
+    
+            # Solo se envían al navegador los puntos que caben en el ancho del gráfico
+            if tipo_grafico != "Barras":
+                df_grafico = submuestrear(df_zoom, 'valor')
+    
+            if tipo_grafico == "Línea":
+                fig = figuras.figura(df_grafico, 'line', y='valor', alto=500,
+                            titulo=f'Evolución de {nombre_indicador or INDICADORES[indicador_seleccionado]} - {periodo}')
+            elif tipo_grafico == "Area":
+                fig = figuras.figura(df_grafico, 'area', y='valor', alto=500,
+                            titulo=f'Evolución de {nombre_indicador or INDICADORES[indicador_seleccionado]} - {periodo}')
+            else:
+                df_barras = df_zoom.tail(30) if len(df_zoom) > 30 else df_zoom
+                fig = figuras.figura(df_barras, 'bar', y='valor', alto=500,
+                           titulo=f'Últimos registros - {nombre_indicador or INDICADORES[indicador_seleccionado]}')
+    
+            st.plotly_chart(fig, use_container_width=True)
+    
+            # Análisis estadístico
+            col1, col2 = st.columns(2)
+    
+            with col1:
+                st.markdown("### 📊 Estadísticas Descriptivas")
+                stats = resumen.describe()
+                st.dataframe(stats)
+    
+            with col2:
+                st.markdown("### 📈 Análisis de Tendencia")
+                # Calcular variación porcentual
+                if resumen.cantidad > 1:
+                    variacion = resumen.variacion_porcentual
+                    st.metric("Variación del período", f"{variacion:.2f}%")
+    
+                    # Volatilidad
+                    volatilidad = resumen.desviacion
+                    st.metric("Desviación Estándar", f"${volatilidad:.2f}")
+    
+                    # Ventanas móviles (en registros)
+                    ventana_volatilidad = st.slider("Ventana de volatilidad:", 5, 120, 20, key="ventana_vol")
+                    ventana_corta, ventana_larga = st.slider("Medias móviles (corta, larga):", 5, 200, (20, 60),
+                                                             key="ventanas_media")
+                    analisis = analisis_movil.analizar(df, ventana_volatilidad, (ventana_corta, ventana_larga))
+                    finales = indicadores_finales(analisis)
+    
+                    # Retornos logarítmicos si la serie es positiva; si no, diferencias simples
+                    if (df['valor'] > 0).all():
+                        st.metric("Volatilidad móvil", f"{finales['volatilidad'] * 100:.3f}%")
+                        st.metric("Drawdown máximo", f"{finales['drawdown_maximo'] * 100:.2f}%",
+                                  delta=f"Actual {finales['drawdown'] * 100:.2f}%", delta_color="off")
+                    else:
+                        st.metric("Volatilidad móvil", f"{finales['volatilidad']:.3f} pts")
+    
+            if resumen.cantidad > 1:
+                # Medias móviles sobre la serie y caída desde el máximo
+                # Con ambas ventanas iguales la media larga repetiría la corta
+                columnas_tendencia = list(dict.fromkeys(
+                    ['valor', f'sma_{ventana_corta}', f'ema_{ventana_corta}', f'sma_{ventana_larga}']))
+                tendencia = submuestrear(analisis.loc[df_zoom.index, columnas_tendencia], 'valor')
+                fig = figuras.figura(tendencia, 'line', y=columnas_tendencia, alto=400,
+                                     titulo="Medias móviles")
+                st.plotly_chart(fig, use_container_width=True)
+    
+                col1, col2 = st.columns(2)
+    
+                with col1:
+                    volatilidad_grafico = submuestrear(analisis.loc[df_zoom.index, ['volatilidad']].dropna(), 'volatilidad')
+                    fig = figuras.figura(volatilidad_grafico, 'line', y='volatilidad', alto=300,
+                                         titulo=f"Volatilidad móvil ({ventana_volatilidad} registros)")
+                    st.plotly_chart(fig, use_container_width=True)
+    
+                with col2:
+                    if analisis['drawdown'].notna().any():
+                        drawdown_grafico = submuestrear(analisis.loc[df_zoom.index, ['drawdown']], 'drawdown')
+                        fig = figuras.figura(drawdown_grafico, 'area', y='drawdown', alto=300,
+                                             titulo="Drawdown")
+                        st.plotly_chart(fig, use_container_width=True)
+    
+            # Tabla de datos
+            with st.expander("🔍 Ver datos detallados"):
+                st.dataframe(df.tail(20))
+                st.caption(f"Memoria de la serie: {uso_memoria(df) / 1024:,.1f} KB")
+
+            with st.expander("📦 Exportar serie"):
+                mostrar_exportacion("exportar_indicador", (indicador_seleccionado, periodo, len(df), str(df.index[-1])),
+                                    lambda: df, f"{indicador_seleccionado}_{periodo}")
+    
+        else:
+            ERRORES.incrementar(origen='indicadores')
+            st.error("❌ No se pudieron obtener datos para el indicador seleccionado")
@@ -0,0 +1,68 @@
+"""
+Sección Inicio: objetivos del proyecto y métricas rápidas
+"""
+
+import streamlit as st
+
+from secciones.comun import claves_tablero, mostrar_antiguedad, obtener_datos_en_paralelo
+
+
+def render():
+    """Portada con las métricas principales"""
+    st.markdown("## Sistema de Análisis de Datos Públicos de Chile")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        ### 🎯 Objetivos del Proyecto
+        - **Integración con APIs REST**: Conexión con fuentes de datos públicas
+        - **Análisis de Datos**: Procesamiento y análisis estadístico
+        - **Visualización Interactiva**: Gráficos dinámicos y dashboards
+        - **Aplicación Web**: Interface intuitiva con Streamlit
+        """)
+        
+        st.markdown("""
+        ### 📊 Fuentes de Datos
+        - **MinIndicador.cl**: Indicadores económicos de Chile
+        - **Gael Cloud**: Datos sísmicos actualizados
+        - **Datos.gob.cl**: Portal oficial del gobierno
+        """)
+    
+    with col2:
+        st.markdown("### 🔍 Datos Disponibles")
+        
+        # Mostrar métricas rápidas (las fuentes se consultan en paralelo)
+        uf, dolar = claves_tablero()
+        espacios = {
+            uf: st.empty(),
+            dolar: st.empty(),
+            'sismos': st.empty(),
+        }
+        try:
+            for clave, resultado, error in obtener_datos_en_paralelo([uf, dolar]):
+                if error is not None:
+                    continue
+                
+                if clave == 'sismos':
+                    # Datos de sismos
+                    df_sismos = resultado
+                    if not df_sismos.empty:
+                        espacios[clave].metric("Sismos Registrados", len(df_sismos))
+                elif clave == uf:
+                    # Obtener UF del día
+                    df_uf, _ = resultado
+                    if df_uf is not None and not df_uf.empty:
+                        uf_actual = df_uf['valor'].iloc[-1]
+                        espacios[clave].metric("UF Actual", f"${uf_actual:,.0f}")
+                else:
+                    # Obtener dólar del día
+                    df_dolar, _ = resultado
+                    if df_dolar is not None and not df_dolar.empty:
+                        dolar_actual = df_dolar['valor'].iloc[-1]
+                        espacios[clave].metric("Dólar Actual", f"${dolar_actual:,.0f}")
+                
+            mostrar_antiguedad([(uf, "UF"), (dolar, "Dólar"), ('sismos', "Sismos")])
+                
+        except Exception as e:
+            st.info("Cargando métricas...")
@@ -0,0 +1,144 @@
+"""
+Sección Sismos en Chile: filtros, distribución, timeline y densidad espacial
+"""
+
+import streamlit as st
+
+from secciones.comun import (aplicar_zoom, almacen_sismos, mostrar_exportacion, obtener_sismos,
+                             verificar_columna)
+from utils.analisis import estadisticas_sismos
+from utils.cache_figuras import figuras
+from utils.data_processing import uso_memoria
+from utils.espacial import TAMAÑO_CELDA
+from utils.metricas import ERRORES, RERUN, TRANSFORMACION
+from utils.submuestreo import submuestrear
+
+
+def render():
+    """Monitoreo sísmico"""
+    st.markdown("## 🌍 Monitoreo Sísmico de Chile")
+    
+    with st.spinner("Obteniendo datos sísmicos..."):
+        obtener_sismos()
+        almacen = almacen_sismos()
+        
+        if len(almacen):
+            st.success(f"✅ {len(almacen)} sismos registrados")
+            
+            _filtros_y_resultados(almacen)
+            
+        else:
+            ERRORES.incrementar(origen='sismos')
+            st.error("❌ No se pudieron obtener datos sísmicos")
+
+
+@st.fragment
+@RERUN.medir(seccion='sismos', fragmento='filtros_y_resultados')
+def _filtros_y_resultados(almacen):
+    """Filtros y resultados; al mover un filtro solo se vuelve a ejecutar este fragmento"""
+    # Filtros solo si las columnas existen (se resuelven sobre el almacén indexado)
+    filtros = {}
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if almacen.tiene('Magnitud'):
+            mag_minima, mag_maxima = almacen.rango('Magnitud')
+            filtros['mag_min'] = st.slider("Magnitud mínima:", 
+                                           mag_minima, mag_maxima, mag_minima)
+        else:
+            st.info("Datos de magnitud no disponibles")
+    
+    with col2:
+        if almacen.tiene('Profundidad'):
+            prof_maxima = int(almacen.rango('Profundidad')[1])
+            filtros['prof_max'] = st.slider("Profundidad máxima (km):", 
+                                            0, prof_maxima, prof_maxima)
+        else:
+            st.info("Datos de profundidad no disponibles")
+    
+    with col3:
+        cantidad = almacen.contar(**filtros)
+        mostrar_ultimos = st.number_input("Mostrar últimos N sismos:", 
+                                        1, max(1, cantidad), 
+                                        min(50, max(1, cantidad)))
+        with TRANSFORMACION.medir(etapa='filtro_sismos'):
+            df_filtrado = almacen.consultar(ultimos=mostrar_ultimos, **filtros)
+    
+    # Métricas
+    col1, col2, col3, col4 = st.columns(4)
+    
+    estadisticas = estadisticas_sismos(df_filtrado)
+    
+    with col1:
+        st.metric("Sismos filtrados", estadisticas['cantidad'])
+    
+    if 'magnitud_promedio' in estadisticas:
+        with col2:
+            st.metric("Magnitud promedio", f"{estadisticas['magnitud_promedio']:.1f}")
+        with col3:
+            st.metric("Magnitud máxima", f"{estadisticas['magnitud_maxima']:.1f}")
+    
+    if 'profundidad_promedio' in estadisticas:
+        with col4:
+            st.metric("Profundidad promedio", f"{estadisticas['profundidad_promedio']:.0f} km")
+    
+    # Gráficos solo si hay datos
+    if verificar_columna(df_filtrado, 'Magnitud'):
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            st.markdown("### 📊 Distribución por Magnitud")
+            fig1 = figuras.figura(df_filtrado, 'histogram', x='Magnitud', nbins=20,
+                                  titulo="Distribución de Magnitudes")
+            st.plotly_chart(fig1, use_container_width=True)
+    
+        with col2:
+            if verificar_columna(df_filtrado, 'Profundidad'):
+                st.markdown("### 🕳️ Magnitud vs Profundidad")
+                fig2 = figuras.figura(df_filtrado, 'scatter', x='Profundidad', y='Magnitud',
+                                      titulo="Relación Magnitud-Profundidad")
+                st.plotly_chart(fig2, use_container_width=True)
+            else:
+                st.info("Datos de profundidad no disponibles para el gráfico")
+    
+    # Timeline de sismos
+    if verificar_columna(df_filtrado, 'Fecha') and verificar_columna(df_filtrado, 'Magnitud'):
+        st.markdown("### ⏰ Timeline de Sismos")
+        # El almacén entrega los eventos ya ordenados por fecha
+        df_timeline = submuestrear(aplicar_zoom(df_filtrado, "zoom_sismos", 'Fecha'), 'Magnitud', 'Fecha')
+        fig3 = figuras.figura(df_timeline, 'line', x='Fecha', y='Magnitud',
+                              titulo="Evolución temporal de magnitudes")
+        st.plotly_chart(fig3, use_container_width=True)
+    
+    # Mapa de densidad a partir de los agregados por celda (no de cada evento)
+    if almacen.tiene('Latitud') and almacen.tiene('Longitud'):
+        st.markdown("### 🗺️ Densidad Sísmica")
+        agregados = almacen.agregados_espaciales()
+        color = {'color': 'magnitud_max'} if 'magnitud_max' in agregados.columns else {}
+        fig4 = figuras.figura(agregados, 'scatter_geo', lat='Latitud', lon='Longitud', size='cantidad',
+                              fitbounds='locations', titulo=f"Sismos por celda de {TAMAÑO_CELDA}°",
+                              alto=600, **color)
+        st.plotly_chart(fig4, use_container_width=True)
+    
+        with st.expander("📍 Buscar sismos cerca de un punto"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                latitud = st.number_input("Latitud:", -90.0, 90.0, -33.45)
+            with col2:
+                longitud = st.number_input("Longitud:", -180.0, 180.0, -70.66)
+            with col3:
+                radio = st.number_input("Radio (km):", 1.0, 2000.0, 100.0)
+    
+            cercanos = almacen.en_radio(latitud, longitud, radio)
+            st.metric("Sismos en el radio", len(cercanos))
+            st.dataframe(cercanos.tail(50))
+    
+    # Tabla de datos
+    with st.expander("🔍 Ver datos detallados"):
+        st.dataframe(df_filtrado)
+        st.caption(f"Memoria de los datos sísmicos: {uso_memoria(almacen.df) / 1024:,.1f} KB")
+
+    with st.expander("📦 Exportar sismos filtrados"):
+        st.caption("Incluye todos los sismos que cumplen los filtros de magnitud y profundidad, no solo los últimos N.")
+        mostrar_exportacion("exportar_sismos", (tuple(sorted(filtros.items())), len(almacen)),
+                            lambda: almacen.consultar(**filtros), "sismos", indice=False)
@@ -74,6 +74,17 @@ SISMOS_API_URL=https://api.gael.cloud/general/public/sismos
 
 # Configuración de cache
 CACHE_TTL=3600
+# DATA_DIR=data
+# Cache compartida entre réplicas: disco (DATA_DIR) o redis (requiere pip install redis)
+CACHE_BACKEND=disco
+# REDIS_URL=redis://localhost:6379/0
+# Directorio de las exportaciones (Parquet, Arrow IPC y CSV)
+# EXPORTS_DIR=exports
+# Horas que se conservan las exportaciones que ningún trabajo recuerda
+# EDAD_MAXIMA_EXPORTS=24
+
+# Métricas Prometheus en http://127.0.0.1:<puerto>/metrics (0 las desactiva)
+METRICS_PORT=9464
 """
     
     if not os.path.exists('.env.example'):
@@ -212,16 +223,17 @@ def verificar_conectividad():
     """Verifica la conectividad a las APIs"""
     print("🌐 Verificando conectividad a APIs...")
     
-    import requests
+    from utils.cliente_http import cliente
+    from utils.fuentes import URL_MINDICADOR, URL_SISMOS
     
     apis = [
-        ("MinIndicador", "https://mindicador.cl/api/uf"),
-        ("Sismos", "https://api.gael.cloud/general/public/sismos")
+        ("MinIndicador", f"{URL_MINDICADOR}/uf"),
+        ("Sismos", URL_SISMOS)
     ]
     
     for nombre, url in apis:
         try:
-            response = requests.get(url, timeout=5)
+            response = cliente.get(url, timeout=5, reintentos=0)
             if response.status_code == 200:
                 print(f"   ✅ {nombre}: Conectado")
             else:
@@ -0,0 +1,10 @@
+"""
+Configuración de pytest: permite importar los módulos del proyecto desde la raíz
+"""
+
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
@@ -0,0 +1,99 @@
+"""
+Consultas de AlmacenSismos e IndiceEspacial frente a máscaras booleanas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.almacen_sismos import AlmacenSismos
+from utils.espacial import distancia_km
+
+
+def _sismos():
+    azar = np.random.default_rng(42)
+    cantidad = 3000
+    df = pd.DataFrame({
+        'Fecha': pd.Timestamp('2024-01-01') + pd.to_timedelta(azar.integers(0, 365 * 24, cantidad), unit='h'),
+        'Magnitud': np.round(2.5 + azar.exponential(1.0, cantidad), 1),
+        'Profundidad': azar.integers(5, 250, cantidad).astype(float),
+        'Latitud': azar.uniform(-45.0, -18.0, cantidad),
+        'Longitud': azar.uniform(-74.0, -68.0, cantidad),
+    })
+    # Algunos eventos sin magnitud ni coordenadas
+    df.loc[::97, 'Magnitud'] = np.nan
+    df.loc[::89, ['Latitud', 'Longitud']] = np.nan
+    return df
+
+
+@pytest.fixture(scope='module')
+def almacen():
+    return AlmacenSismos(_sismos())
+
+
+def _mascara(df, mag_min=None, mag_max=None, prof_min=None, prof_max=None, desde=None, hasta=None):
+    mascara = pd.Series(True, index=df.index)
+    if mag_min is not None:
+        mascara &= df['Magnitud'] >= mag_min
+    if mag_max is not None:
+        mascara &= df['Magnitud'] <= mag_max
+    if prof_min is not None:
+        mascara &= df['Profundidad'] >= prof_min
+    if prof_max is not None:
+        mascara &= df['Profundidad'] <= prof_max
+    if desde is not None:
+        mascara &= df['Fecha'] >= pd.Timestamp(desde)
+    if hasta is not None:
+        mascara &= df['Fecha'] <= pd.Timestamp(hasta)
+    return df[mascara]
+
+
+@pytest.mark.parametrize('filtros', [
+    {},
+    {'mag_min': 4.0},
+    {'mag_min': 3.0, 'mag_max': 3.5},
+    {'prof_max': 100.0},
+    {'mag_min': 3.5, 'prof_min': 50.0, 'prof_max': 150.0},
+    {'desde': '2024-03-01', 'hasta': '2024-06-30'},
+    {'mag_min': 3.0, 'desde': '2024-05-01'},
+    {'mag_min': 20.0},
+])
+def test_consultar_coincide_con_mascara(almacen, filtros):
+    esperado = _mascara(almacen.df, **filtros)
+    pd.testing.assert_frame_equal(almacen.consultar(**filtros), esperado)
+    assert almacen.contar(**filtros) == len(esperado)
+
+
+def test_consultar_ultimos(almacen):
+    esperado = _mascara(almacen.df, mag_min=4.0).tail(25)
+    pd.testing.assert_frame_equal(almacen.consultar(ultimos=25, mag_min=4.0), esperado)
+    pd.testing.assert_frame_equal(almacen.consultar(ultimos=10), almacen.df.tail(10))
+
+
+def test_eventos_ordenados_y_sin_duplicados():
+    # Almacén propio: agregar modifica el del módulo que usan las demás pruebas
+    almacen = AlmacenSismos(_sismos())
+    total = len(almacen)
+    almacen.agregar(almacen.df.tail(100))
+    assert len(almacen) == total
+    assert almacen.df['Fecha'].is_monotonic_increasing
+
+
+@pytest.mark.parametrize('caja', [(-35.0, -30.0, -72.0, -70.0), (-45.0, -18.0, -74.0, -68.0), (-20.1, -20.0, -70.0, -69.9)])
+def test_en_caja_coincide_con_mascara(almacen, caja):
+    lat_min, lat_max, lon_min, lon_max = caja
+    df = almacen.df
+    mascara = df['Latitud'].between(lat_min, lat_max) & df['Longitud'].between(lon_min, lon_max)
+    pd.testing.assert_frame_equal(almacen.en_caja(*caja), df[mascara])
+
+
+@pytest.mark.parametrize('lat, lon, radio', [(-33.45, -70.66, 150.0), (-20.0, -70.0, 40.0), (-40.0, -73.0, 500.0)])
+def test_en_radio_coincide_con_fuerza_bruta(almacen, lat, lon, radio):
+    df = almacen.df
+    distancias = distancia_km(lat, lon, df['Latitud'].to_numpy(), df['Longitud'].to_numpy())
+    pd.testing.assert_frame_equal(almacen.en_radio(lat, lon, radio), df[distancias <= radio])
+
+
+def test_distancia_conocida():
+    # Santiago - Valparaíso, ~100 km
+    assert distancia_km(-33.45, -70.66, -33.05, -71.62) == pytest.approx(99.0, abs=3.0)
@@ -0,0 +1,54 @@
+"""
+Entradas de la cache en disco: datos y metadatos en un solo archivo
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import cache_disco
+
+
+@pytest.fixture(autouse=True)
+def directorio(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_disco, 'DIRECTORIO_CACHE', str(tmp_path))
+    return tmp_path
+
+
+def test_guardar_y_leer(directorio):
+    df = pd.DataFrame({'valor': np.arange(5.0)},
+                      index=pd.date_range('2024-01-01', periods=5, tz='UTC', name='fecha'))
+    meta = cache_disco.guardar(('mindicador', 'uf', '2024'), df, nombre='UF', periodo_cerrado=True)
+
+    leido, meta_leida = cache_disco.leer(('mindicador', 'uf', '2024'))
+    pd.testing.assert_frame_equal(leido, df, check_freq=False)
+    assert meta_leida == meta == cache_disco.leer_metadatos(('mindicador', 'uf', '2024'))
+    assert [archivo.name for archivo in (directorio / 'mindicador' / 'uf').iterdir()] == ['2024.parquet']
+    assert cache_disco.leer(('mindicador', 'uf', '2024'), ttl=0) == (None, None)
+    assert cache_disco.leer(('no', 'existe')) == (None, None)
+
+
+def test_lectura_concurrente_no_mezcla_versiones():
+    terminar = threading.Event()
+
+    def escribir():
+        version = 0
+        while not terminar.is_set():
+            version += 1
+            # Cada versión tiene otro largo y sus valores la identifican
+            cache_disco.guardar(('serie',), pd.DataFrame({'valor': np.full(version % 50 + 1, float(version))}),
+                                version_datos=version)
+
+    escritor = threading.Thread(target=escribir)
+    escritor.start()
+    try:
+        for _ in range(500):
+            df, meta = cache_disco.leer(('serie',))
+            if df is not None:
+                assert len(df) == meta['filas']
+                assert (df['valor'] == meta['version_datos']).all()
+    finally:
+        terminar.set()
+        escritor.join()
@@ -0,0 +1,58 @@
+"""
+Timeouts y reintentos de ClienteHTTP contra servidores locales
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from utils.cliente_http import ClienteHTTP
+
+
+@pytest.fixture
+def servidor_colgado():
+    """Acepta conexiones y nunca responde"""
+    servidor = socket.socket()
+    servidor.bind(('127.0.0.1', 0))
+    servidor.listen(16)
+    conexiones = []
+
+    def aceptar():
+        while True:
+            try:
+                conexiones.append(servidor.accept()[0])
+            except OSError:
+                return
+
+    threading.Thread(target=aceptar, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.getsockname()[1]}/"
+    servidor.close()
+    for conexion in conexiones:
+        conexion.close()
+
+
+def test_timeout_de_lectura_no_se_reintenta(servidor_colgado):
+    cliente = ClienteHTTP(reintentos=2)
+    inicio = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        cliente.get_json(servidor_colgado, timeout=0.5)
+
+    assert time.monotonic() - inicio < 1.0
+    assert next(iter(cliente.estadisticas().values()))['solicitudes'] == 1
+
+
+def test_reintentos_dentro_del_timeout_total():
+    # Puerto sin servidor: los errores de conexión se reintentan mientras quede tiempo
+    libre = socket.socket()
+    libre.bind(('127.0.0.1', 0))
+    url = f"http://127.0.0.1:{libre.getsockname()[1]}/"
+    libre.close()
+
+    cliente = ClienteHTTP(reintentos=5, backoff_base=0.4, backoff_max=0.4)
+    inicio = time.monotonic()
+    with pytest.raises(requests.ConnectionError):
+        cliente.get(url, timeout=0.5)
+    assert time.monotonic() - inicio < 0.75
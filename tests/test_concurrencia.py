@@ -0,0 +1,110 @@
+"""
+SingleFlight y obtener_en_paralelo con llamadas concurrentes
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.concurrencia import SingleFlight, _ejecutor, obtener_en_paralelo
+from utils.metricas import SINGLEFLIGHT
+
+
+def test_single_flight_agrupa_llamadas_concurrentes():
+    vuelos = SingleFlight('prueba_agrupa')
+    ejecuciones = []
+    barrera = threading.Barrier(8)
+
+    def lenta():
+        ejecuciones.append(1)
+        time.sleep(0.2)
+        return 'resultado'
+
+    def llamar(_):
+        barrera.wait()
+        return vuelos.ejecutar('clave', lenta)
+
+    with ThreadPoolExecutor(8) as pool:
+        resultados = list(pool.map(llamar, range(8)))
+
+    assert resultados == ['resultado'] * 8
+    assert len(ejecuciones) == 1
+    assert vuelos.estadisticas() == {'emitidas': 1, 'agrupadas': 7, 'en_vuelo': 0}
+    # Los mismos contadores se publican como métrica
+    publicadas = {dict(etiquetas)['resultado']: valor for etiquetas, valor in SINGLEFLIGHT.valores().items()
+                  if dict(etiquetas)['grupo'] == 'prueba_agrupa'}
+    assert publicadas == {'emitida': 1, 'agrupada': 7}
+
+
+def test_single_flight_propaga_errores_y_permite_reintentar():
+    vuelos = SingleFlight()
+    barrera = threading.Barrier(4)
+
+    def falla():
+        time.sleep(0.1)
+        raise ValueError('sin conexión')
+
+    def llamar(_):
+        barrera.wait()
+        with pytest.raises(ValueError):
+            vuelos.ejecutar('clave', falla)
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(llamar, range(4)))
+
+    # Terminado el vuelo, la siguiente llamada vuelve a ejecutar la función
+    assert vuelos.ejecutar('clave', lambda: 'ok') == 'ok'
+    assert vuelos.estadisticas()['en_vuelo'] == 0
+
+
+def test_single_flight_no_agrupa_claves_distintas():
+    vuelos = SingleFlight()
+    with ThreadPoolExecutor(4) as pool:
+        resultados = list(pool.map(lambda i: vuelos.ejecutar(i, lambda: i * 2), range(4)))
+    assert resultados == [0, 2, 4, 6]
+    assert vuelos.estadisticas()['emitidas'] == 4
+
+
+def test_obtener_en_paralelo_el_timeout_corre_desde_el_inicio_de_cada_tarea():
+    # Más tareas que hilos en el pool: las últimas esperan turno más que su timeout
+    tareas = {i: (lambda: time.sleep(0.3) or 'ok') for i in range(20)}
+    resultados = list(obtener_en_paralelo(tareas, timeout_defecto=0.5))
+
+    assert len(resultados) == 20
+    assert all(error is None and resultado == 'ok' for _, resultado, error in resultados)
+
+
+def test_obtener_en_paralelo_reporta_la_tarea_vencida_sin_bloquear_al_resto():
+    tareas = {'rapida': lambda: 'ok', 'lenta': lambda: time.sleep(1.0)}
+    inicio = time.monotonic()
+    resultados = {clave: (resultado, error) for clave, resultado, error in
+                  obtener_en_paralelo(tareas, timeouts={'lenta': 0.2})}
+
+    assert time.monotonic() - inicio < 0.8
+    assert resultados['rapida'] == ('ok', None)
+    assert isinstance(resultados['lenta'][1], TimeoutError)
+
+
+def test_obtener_en_paralelo_limita_la_espera_en_cola():
+    # El pool completo queda ocupado por tareas colgadas de otra llamada
+    liberar = threading.Event()
+    colgadas = [_ejecutor.submit(liberar.wait) for _ in range(_ejecutor._max_workers)]
+    ejecutadas = []
+    try:
+        inicio = time.monotonic()
+        resultados = list(obtener_en_paralelo({'fuente': lambda: ejecutadas.append(1)}, timeout_defecto=0.5))
+        transcurrido = time.monotonic() - inicio
+    finally:
+        liberar.set()
+        for futuro in colgadas:
+            futuro.result()
+
+    # Límite total: espera en cola (el mayor timeout) + timeout de la tarea
+    assert transcurrido < 1.5
+    assert [clave for clave, _, _ in resultados] == ['fuente']
+    assert isinstance(resultados[0][2], TimeoutError)
+    # La tarea vencida en cola se cancela y no ocupa un hilo después
+    time.sleep(0.1)
+    assert ejecutadas == []
@@ -0,0 +1,29 @@
+"""
+Valores float32 sin ruido binario al pasarlos a float64
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.data_processing import decimal_float32, sin_ruido_float32
+
+
+def test_decimal_mas_corto_del_float32():
+    valores = np.array([0.2, 11.67, 35248.8, -33.4489, 1e-7, 3.4e38, 0.0, np.nan], dtype=np.float32)
+    resultado = decimal_float32(valores)
+
+    assert resultado.tolist()[:7] == [0.2, 11.67, 35248.8, -33.4489, 1e-7, 3.4e38, 0.0]
+    assert np.isnan(resultado[7])
+    # Siempre vuelve al mismo float32
+    azar = np.random.default_rng(0).uniform(-1e6, 1e6, 10_000).astype(np.float32)
+    assert (decimal_float32(azar).astype(np.float32) == azar).all()
+
+
+def test_solo_cambia_columnas_float32():
+    df = pd.DataFrame({'valor': np.array([0.2, 1.1], dtype=np.float32), 'otro': [0.1, 0.2], 'texto': ['a', 'b']})
+    limpio = sin_ruido_float32(df)
+
+    assert limpio['valor'].tolist() == [0.2, 1.1]
+    assert limpio.dtypes['valor'] == np.float64
+    pd.testing.assert_frame_equal(limpio[['otro', 'texto']], df[['otro', 'texto']])
+    assert df.dtypes['valor'] == np.float32
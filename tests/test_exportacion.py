@@ -0,0 +1,48 @@
+"""
+Nombres y limpieza de los archivos del Exportador
+"""
+
+import os
+from concurrent.futures import wait
+
+import pandas as pd
+
+from utils import exportacion
+from utils.exportacion import Exportador
+
+
+def _exportar(exportador, clave, valor):
+    futuro = exportador.solicitar(clave, lambda: pd.DataFrame({'valor': [valor]}), 'sismos', 'csv')
+    wait([futuro])
+    return futuro.result()
+
+
+def test_exportaciones_del_mismo_segundo_no_se_pisan(tmp_path):
+    exportador = Exportador(directorio=str(tmp_path))
+    rutas = [_exportar(exportador, ('sismos', valor), valor) for valor in range(5)]
+
+    assert len(set(rutas)) == 5
+    assert [pd.read_csv(ruta)['valor'].item() for ruta in rutas] == list(range(5))
+
+
+def test_trabajos_descartados_eliminan_su_archivo(tmp_path, monkeypatch):
+    monkeypatch.setattr(exportacion, 'MAXIMO_TRABAJOS', 2)
+    exportador = Exportador(directorio=str(tmp_path))
+    rutas = [_exportar(exportador, ('sismos', valor), valor) for valor in range(4)]
+
+    assert [os.path.exists(ruta) for ruta in rutas] == [False, False, True, True]
+
+
+def test_limpia_solo_exportaciones_antiguas(tmp_path):
+    antigua = tmp_path / 'sismos_20200101-000000_0123abcd.csv'
+    ajena = tmp_path / 'notas.csv'
+    reporte = tmp_path / '20200101-000000'
+    for archivo in (antigua, ajena):
+        archivo.write_text('x')
+        os.utime(archivo, (0, 0))
+    reporte.mkdir()
+
+    _exportar(Exportador(directorio=str(tmp_path)), ('sismos',), 1)
+
+    assert not antigua.exists()
+    assert ajena.exists() and reporte.exists()
@@ -0,0 +1,53 @@
+"""
+Ingesta, compactación y lectura por rango de HistorialSismos
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import historial_sismos
+from utils.historial_sismos import HistorialSismos
+
+
+def _sismos(desde, cantidad, semilla):
+    azar = np.random.default_rng(semilla)
+    return pd.DataFrame({
+        'Fecha': pd.Timestamp(desde) + pd.to_timedelta(np.sort(azar.integers(0, 20 * 24, cantidad)), unit='h'),
+        'Magnitud': np.round(2.5 + azar.exponential(1.0, cantidad), 1),
+        'Profundidad': azar.integers(5, 250, cantidad).astype(float),
+        'Latitud': azar.uniform(-45.0, -18.0, cantidad),
+        'Longitud': azar.uniform(-74.0, -68.0, cantidad),
+    })
+
+
+@pytest.fixture
+def mes_actual():
+    return pd.Timestamp.now().normalize().replace(day=1)
+
+
+def test_ingestas_frecuentes_no_acumulan_archivos(tmp_path, monkeypatch, mes_actual):
+    monkeypatch.setattr(historial_sismos, 'MAXIMO_PARTES', 4)
+    historial = HistorialSismos(str(tmp_path))
+    lotes = [_sismos(mes_actual, 20, semilla) for semilla in range(12)]
+    for lote in lotes:
+        historial.ingerir(lote)
+        # Cada lote repite eventos ya guardados
+        assert historial.ingerir(lote.head(5)) == 0
+
+    mes = mes_actual.strftime('%Y-%m')
+    assert len(historial._archivos(mes)) <= 4
+    leidos = historial.leer_rango()
+    assert len(leidos) == len(pd.concat(lotes).drop_duplicates())
+    assert leidos['Fecha'].is_monotonic_increasing
+    assert not leidos['id_evento'].duplicated().any()
+
+
+def test_meses_terminados_quedan_en_un_archivo(tmp_path, mes_actual):
+    historial = HistorialSismos(str(tmp_path))
+    anterior = mes_actual - pd.DateOffset(months=2)
+    for semilla in range(3):
+        historial.ingerir(_sismos(anterior, 10, semilla))
+
+    assert len(historial._archivos(anterior.strftime('%Y-%m'))) == 1
+    assert len(historial.leer_rango(desde=anterior, hasta=anterior + pd.DateOffset(months=1))) == 30
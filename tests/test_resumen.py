@@ -0,0 +1,62 @@
+"""
+ResumenSerie frente a Series.describe() de pandas
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.resumen import CAPACIDAD_SKETCH, ResumenSerie
+
+
+def _serie(cantidad, semilla=0):
+    azar = np.random.default_rng(semilla)
+    return pd.Series(1000 * np.cumprod(1 + azar.normal(0.0005, 0.01, cantidad)))
+
+
+@pytest.mark.parametrize('bloques', [[1], [7, 3], [50, 1, 49, 100]])
+def test_agregar_por_bloques_coincide_con_describe(bloques):
+    serie = _serie(sum(bloques))
+    resumen = ResumenSerie()
+    inicio = 0
+    for largo in bloques:
+        resumen.agregar(serie.iloc[inicio:inicio + largo].to_numpy())
+        inicio += largo
+
+    esperado = serie.describe()
+    obtenido = resumen.describe()
+    # Con pocas observaciones (sin compactación del sketch) los cuartiles son exactos
+    for estadistica in esperado.index:
+        assert obtenido[estadistica] == pytest.approx(esperado[estadistica], rel=1e-9, nan_ok=True)
+    assert resumen.primero == serie.iloc[0]
+    assert resumen.ultimo == serie.iloc[-1]
+
+
+def test_cuartiles_aproximados_en_series_largas():
+    serie = _serie(20 * CAPACIDAD_SKETCH, semilla=1)
+    resumen = ResumenSerie()
+    for bloque in np.array_split(serie.to_numpy(), 13):
+        resumen.agregar(bloque)
+
+    esperado = serie.describe()
+    obtenido = resumen.describe()
+    for estadistica in ['count', 'mean', 'std', 'min', 'max']:
+        assert obtenido[estadistica] == pytest.approx(esperado[estadistica], rel=1e-9)
+    # Los cuartiles del sketch caen cerca del rango (posición) correcto
+    ordenados = np.sort(serie.to_numpy())
+    for q, estadistica in [(0.25, '25%'), (0.5, '50%'), (0.75, '75%')]:
+        rango = np.searchsorted(ordenados, obtenido[estadistica]) / len(ordenados)
+        assert abs(rango - q) < 0.03
+
+
+def test_ignora_nan_y_se_serializa():
+    valores = np.array([3.0, np.nan, 1.0, 2.0, np.nan, 5.0])
+    resumen = ResumenSerie.desde_valores(valores)
+    esperado = pd.Series(valores).describe()
+    copia = ResumenSerie.desde_dict(resumen.a_dict())
+    # Metadatos de versiones anteriores con campos que ya no existen
+    antigua = ResumenSerie.desde_dict({**resumen.a_dict(), 'penultimo': 2.0})
+    assert 'penultimo' not in antigua.a_dict()
+    for estadistica in esperado.index:
+        assert resumen.describe()[estadistica] == pytest.approx(esperado[estadistica])
+        assert copia.describe()[estadistica] == pytest.approx(esperado[estadistica])
@@ -0,0 +1,12 @@
+"""
+Utilidades de datos del proyecto DataViz Chile
+"""
+
+import pandas as pd
+
+# Las series publicadas (utils/almacen_series.py) y los tramos que se exportan
+# son vistas de solo lectura: con copy-on-write, modificarlas genera una copia
+# en lugar de fallar o alterar los datos compartidos. Desde pandas 3.0 siempre
+# está activo y la opción quedó obsoleta, por eso solo se activa antes.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
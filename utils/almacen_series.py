@@ -0,0 +1,123 @@
+"""
+Almacén de series inmutables mapeadas en memoria
+
+Cada versión de una serie se escribe una sola vez como archivo Arrow IPC sin
+compresión en <DATA_DIR>/series/ y se vuelve a abrir con mmap. Las columnas
+numéricas y de fechas del DataFrame resultante son vistas de solo lectura
+sobre las páginas del archivo, no copias en el heap. Todas las sesiones del
+proceso reciben el mismo DataFrame (sin el pickle y la copia por sesión de
+st.cache_data), y los procesos del mismo equipo comparten esas páginas a
+través de la cache del sistema operativo.
+
+Con copy-on-write de pandas (siempre activo desde pandas 3.0; en versiones
+anteriores lo activa utils/__init__.py), tail(), los tramos por fecha y la
+selección de columnas siguen siendo vistas. Modificar el resultado genera una
+copia privada, así que la versión publicada nunca cambia.
+"""
+
+import glob
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from utils.cache_disco import DIRECTORIO_DATOS
+from utils.cache_figuras import huella
+
+DIRECTORIO_SERIES = os.path.join(DIRECTORIO_DATOS, 'series')
+
+
+def _escribir(ruta, df):
+    """Escribe el DataFrame como Arrow IPC (escritura atómica)"""
+    tabla = pa.Table.from_pandas(df)
+    temporal = f'{ruta}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with pa.OSFile(temporal, 'wb') as archivo, ipc.new_file(archivo, tabla.schema) as escritor:
+        escritor.write_table(tabla)
+    os.replace(temporal, ruta)
+
+
+def _mapear(ruta):
+    """DataFrame cuyas columnas apuntan directamente al archivo mapeado"""
+    tabla = ipc.open_file(pa.memory_map(ruta, 'r')).read_all()
+    # split_blocks evita consolidar las columnas en un bloque nuevo (que sería una copia)
+    return tabla.to_pandas(split_blocks=True), tabla.nbytes
+
+
+class AlmacenSeries:
+    """Última versión publicada de cada serie, mapeada en memoria"""
+
+    def __init__(self, directorio=DIRECTORIO_SERIES):
+        self.directorio = directorio
+        self.publicaciones = 0
+        self.reutilizadas = 0
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _ruta(self, clave, marca):
+        nombre = '_'.join(str(parte).replace(os.sep, '-') for parte in clave)
+        return os.path.join(self.directorio, f'{nombre}-{marca}.arrow')
+
+    def publicar(self, clave, df):
+        """Versión mapeada en memoria de `df`
+
+        Si la serie ya estaba publicada con el mismo contenido se entrega la
+        misma instancia. Los DataFrames vacíos (o None) se retornan tal cual.
+        """
+        if df is None or df.empty:
+            return df
+        marca = huella(df)
+
+        with self._lock:
+            actual = self._series.get(clave)
+            if actual is not None and actual[0] == marca:
+                self.reutilizadas += 1
+                return actual[1]
+
+        ruta = self._ruta(clave, marca)
+        os.makedirs(self.directorio, exist_ok=True)
+        try:
+            mapeado, tamaño = _mapear(ruta)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            # Otro proceso pudo haber publicado la misma versión; si no, se escribe
+            _escribir(ruta, df)
+            mapeado, tamaño = _mapear(ruta)
+
+        with self._lock:
+            self._series[clave] = (marca, mapeado, tamaño)
+            self.publicaciones += 1
+        self._limpiar(clave, ruta)
+        return mapeado
+
+    def obtener(self, clave):
+        """Última versión publicada de la serie o None"""
+        with self._lock:
+            actual = self._series.get(clave)
+        return None if actual is None else actual[1]
+
+    def _limpiar(self, clave, vigente):
+        """Elimina del directorio las versiones anteriores de la serie
+
+        En POSIX las vistas que aún usan las sesiones siguen siendo válidas:
+        el archivo se libera recién cuando se deja de mapear.
+        """
+        for ruta in glob.glob(self._ruta(clave, '*')):
+            if ruta != vigente:
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    pass
+
+    def estadisticas(self):
+        """Series publicadas, bytes mapeados y publicaciones reutilizadas"""
+        with self._lock:
+            return {
+                'series': len(self._series),
+                'bytes_mapeados': sum(tamaño for _, _, tamaño in self._series.values()),
+                'publicaciones': self.publicaciones,
+                'reutilizadas': self.reutilizadas,
+            }
+
+
+# Instancia compartida por todas las sesiones del proceso
+almacen_series = AlmacenSeries()
@@ -0,0 +1,181 @@
+"""
+Almacén indexado de eventos sísmicos
+
+Mantiene los eventos ordenados por fecha junto con índices ordenados por
+magnitud y profundidad, de modo que las consultas por rango se resuelven con
+búsqueda binaria sobre arreglos NumPy en vez de recorrer el DataFrame con
+máscaras. Acumula los eventos de sucesivas descargas (sin duplicados), por lo
+que el historial crece más allá de lo que entrega la API en cada consulta.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.espacial import IndiceEspacial
+
+# Columnas que identifican un evento de forma estable
+COLUMNAS_CLAVE = ['Fecha', 'Latitud', 'Longitud', 'Magnitud']
+
+COLUMNAS_INDEXADAS = ['Magnitud', 'Profundidad']
+
+
+class _IndiceOrdenado:
+    """Valores de una columna ordenados junto con la posición (temporal) de cada uno"""
+
+    def __init__(self, valores):
+        valores = np.asarray(valores, dtype=np.float64)
+        self.orden = np.argsort(valores, kind='stable')
+        self.valores = valores[self.orden]
+        # Los NaN quedan al final del orden y nunca cumplen un rango
+        self.validos = int(np.count_nonzero(~np.isnan(self.valores)))
+
+    def posiciones(self, minimo=None, maximo=None):
+        inicio = 0 if minimo is None else np.searchsorted(self.valores[:self.validos], minimo, side='left')
+        fin = self.validos if maximo is None else np.searchsorted(self.valores[:self.validos], maximo, side='right')
+        return self.orden[inicio:fin]
+
+    def rango(self):
+        if not self.validos:
+            return None, None
+        return float(self.valores[0]), float(self.valores[self.validos - 1])
+
+
+class _Instantanea:
+    """Estado inmutable del almacén; las consultas trabajan siempre sobre una instantánea"""
+
+    def __init__(self, df):
+        self.df = df
+        self.fechas = pd.DatetimeIndex(df['Fecha']).asi8 if 'Fecha' in df.columns else None
+        self.indices = {columna: _IndiceOrdenado(df[columna].to_numpy(dtype=np.float64, na_value=np.nan))
+                        for columna in COLUMNAS_INDEXADAS if columna in df.columns}
+        self.espacial = None
+        if 'Latitud' in df.columns and 'Longitud' in df.columns:
+            self.espacial = IndiceEspacial(df['Latitud'].to_numpy(dtype=np.float64, na_value=np.nan),
+                                           df['Longitud'].to_numpy(dtype=np.float64, na_value=np.nan))
+
+
+def deduplicar(df):
+    """Elimina eventos repetidos según su clave estable (fecha, coordenadas y magnitud)"""
+    clave = [columna for columna in COLUMNAS_CLAVE if columna in df.columns]
+    return df.drop_duplicates(subset=clave or None, keep='last')
+
+
+class AlmacenSismos:
+    """Eventos sísmicos ordenados por fecha e indexados por magnitud y profundidad"""
+
+    def __init__(self, df=None, publicar=None):
+        """`publicar` recibe cada versión combinada de los eventos y retorna la que se guarda
+        (p. ej. una versión mapeada en memoria de utils/almacen_series.py)"""
+        self._publicar = publicar
+        self._lock = threading.Lock()
+        self._instantanea = _Instantanea(pd.DataFrame())
+        if df is not None:
+            self.agregar(df)
+
+    @property
+    def df(self):
+        """Todos los eventos, ordenados por fecha"""
+        return self._instantanea.df
+
+    def __len__(self):
+        return len(self._instantanea.df)
+
+    def agregar(self, df):
+        """Incorpora nuevos eventos, descartando los que ya estaban"""
+        if df is None or df.empty:
+            return
+        with self._lock:
+            actual = self._instantanea.df
+            combinado = deduplicar(pd.concat([actual, df], ignore_index=True) if len(actual) else df)
+            if 'Fecha' in combinado.columns:
+                combinado = combinado.sort_values('Fecha', kind='stable', na_position='first')
+            combinado = combinado.reset_index(drop=True)
+            if self._publicar is not None:
+                combinado = self._publicar(combinado)
+            # Se reemplaza la instantánea completa: las consultas en curso no ven estados intermedios
+            self._instantanea = _Instantanea(combinado)
+
+    def tiene(self, columna):
+        """Indica si la columna existe y tiene al menos un valor"""
+        df = self._instantanea.df
+        return columna in df.columns and df[columna].notna().any()
+
+    def rango(self, columna):
+        """(mínimo, máximo) de una columna indexada, sin recorrer los datos"""
+        return self._instantanea.indices[columna].rango()
+
+    def posiciones(self, mag_min=None, mag_max=None, prof_min=None, prof_max=None,
+                   desde=None, hasta=None, instantanea=None):
+        """Posiciones (en orden temporal) de los eventos que cumplen todos los rangos"""
+        instantanea = instantanea or self._instantanea
+        total = len(instantanea.df)
+
+        # El rango de fechas es un tramo contiguo porque los eventos están ordenados
+        inicio, fin = 0, total
+        if instantanea.fechas is not None:
+            if desde is not None:
+                inicio = np.searchsorted(instantanea.fechas, _a_entero(desde, instantanea), side='left')
+            if hasta is not None:
+                fin = np.searchsorted(instantanea.fechas, _a_entero(hasta, instantanea), side='right')
+
+        candidatos = []
+        if mag_min is not None or mag_max is not None:
+            candidatos.append(instantanea.indices['Magnitud'].posiciones(mag_min, mag_max))
+        if prof_min is not None or prof_max is not None:
+            candidatos.append(instantanea.indices['Profundidad'].posiciones(prof_min, prof_max))
+
+        if not candidatos:
+            return np.arange(inicio, fin)
+
+        # Se parte del rango más selectivo y se intersecta con los demás
+        candidatos.sort(key=len)
+        posiciones = np.sort(candidatos[0])
+        for otros in candidatos[1:]:
+            marcados = np.zeros(total, dtype=bool)
+            marcados[otros] = True
+            posiciones = posiciones[marcados[posiciones]]
+        return posiciones[(posiciones >= inicio) & (posiciones < fin)]
+
+    def consultar(self, ultimos=None, **rangos):
+        """Eventos que cumplen los rangos (ver `posiciones`), opcionalmente solo los `ultimos` N"""
+        instantanea = self._instantanea
+        posiciones = self.posiciones(instantanea=instantanea, **rangos)
+        if ultimos is not None:
+            posiciones = posiciones[-ultimos:] if ultimos > 0 else posiciones[:0]
+        # Un tramo contiguo (solo fechas o `ultimos`) se entrega como vista, sin copiar las filas
+        if len(posiciones) and posiciones[-1] - posiciones[0] + 1 == len(posiciones):
+            return instantanea.df.iloc[posiciones[0]:posiciones[-1] + 1]
+        return instantanea.df.iloc[posiciones]
+
+    def en_radio(self, lat, lon, radio_km):
+        """Eventos a menos de `radio_km` kilómetros del punto (lat, lon), en orden temporal"""
+        instantanea = self._instantanea
+        return instantanea.df.iloc[instantanea.espacial.en_radio(lat, lon, radio_km)]
+
+    def en_caja(self, lat_min, lat_max, lon_min, lon_max):
+        """Eventos dentro de una caja de latitud/longitud, en orden temporal"""
+        instantanea = self._instantanea
+        return instantanea.df.iloc[instantanea.espacial.en_caja(lat_min, lat_max, lon_min, lon_max)]
+
+    def agregados_espaciales(self):
+        """Cantidad de eventos y magnitud máxima por celda de la grilla"""
+        instantanea = self._instantanea
+        magnitudes = instantanea.df['Magnitud'].to_numpy(dtype=np.float64, na_value=np.nan) \
+            if 'Magnitud' in instantanea.df.columns else None
+        return instantanea.espacial.agregados(magnitudes)
+
+    def contar(self, **rangos):
+        """Cantidad de eventos que cumplen los rangos"""
+        return len(self.posiciones(**rangos))
+
+
+def _a_entero(fecha, instantanea):
+    """Convierte una fecha a la misma representación entera que el índice temporal"""
+    columna = instantanea.df['Fecha']
+    fecha = pd.Timestamp(fecha)
+    tz = getattr(columna.dt, 'tz', None)
+    if tz is not None and fecha.tzinfo is None:
+        fecha = fecha.tz_localize(tz)
+    return pd.DatetimeIndex([fecha]).as_unit(pd.DatetimeIndex(columna).unit).asi8[0]
@@ -0,0 +1,94 @@
+"""
+Análisis de indicadores y sismos independiente de Streamlit
+
+Reúne la obtención de datos y los cálculos que muestra la aplicación para
+que también puedan ejecutarse por lotes (ver ejemplos/analisis_completo.py).
+"""
+
+import pandas as pd
+
+from utils import fuentes
+from utils.analisis_movil import VENTANA_VOLATILIDAD, VENTANAS_MEDIA, analisis_movil, indicadores_finales
+from utils.resumen import ResumenSerie
+
+# Indicadores disponibles en mindicador.cl
+INDICADORES = {
+    'uf': 'Unidad de Fomento (UF)',
+    'dolar': 'Dólar Observado',
+    'euro': 'Euro',
+    'ipc': 'Índice de Precios al Consumidor',
+    'utm': 'Unidad Tributaria Mensual',
+    'tpm': 'Tasa de Política Monetaria',
+    'bitcoin': 'Bitcoin'
+}
+
+
+def obtener_serie_con_resumen(indicador, año=None, inicio=None, fin=None):
+    """Serie de un indicador para un año o un rango de fechas, con su resumen
+
+    Retorna (df, nombre, resumen) con la columna 'valor' indexada por fecha, o
+    (None, None, None) si no hay datos. El resumen describe la misma serie
+    entregada: precalculado para un año, calculado sobre la serie para un rango.
+    """
+    if inicio is not None:
+        serie, nombre = fuentes.obtener_rango_indicador(indicador, inicio, fin)
+        if serie is None:
+            return None, None, None
+        return serie.to_frame(), nombre, ResumenSerie.desde_valores(serie.to_numpy())
+    return fuentes.obtener_indicador_con_resumen(indicador, año)
+
+
+def obtener_serie(indicador, año=None, inicio=None, fin=None):
+    """Serie de un indicador para un año o un rango de fechas como (df, nombre)"""
+    return obtener_serie_con_resumen(indicador, año, inicio, fin)[:2]
+
+
+def resumen_periodo(indicador, año=None, inicio=None, fin=None):
+    """Resumen estadístico de un indicador (precalculado para años completos)"""
+    return obtener_serie_con_resumen(indicador, año, inicio, fin)[2]
+
+
+def analizar_indicador(indicador, año=None, inicio=None, fin=None,
+                       ventana_volatilidad=VENTANA_VOLATILIDAD, ventanas_media=VENTANAS_MEDIA):
+    """Análisis completo de un indicador: estadísticas, tendencia y ventanas móviles
+
+    Retorna un diccionario con 'resumen' (estadísticas y tendencia) y
+    'analisis' (DataFrame de analisis_movil), o None si no hay datos.
+    """
+    df, nombre, resumen = obtener_serie_con_resumen(indicador, año, inicio, fin)
+    if df is None or df.empty:
+        return None
+    resumen = resumen or ResumenSerie.desde_valores(df['valor'].to_numpy())
+    analisis = analisis_movil.analizar(df, ventana_volatilidad, ventanas_media)
+
+    fila = {
+        'indicador': indicador,
+        'nombre': nombre or INDICADORES.get(indicador, indicador),
+        'periodo': año if inicio is None else f"{inicio:%Y-%m-%d}/{fin:%Y-%m-%d}",
+        'desde': df.index.min(),
+        'hasta': df.index.max(),
+    }
+    fila.update(resumen.describe().to_dict())
+    fila['variacion_porcentual'] = resumen.variacion_porcentual
+    fila.update(indicadores_finales(analisis))
+    return {'resumen': fila, 'analisis': analisis}
+
+
+def estadisticas_sismos(df):
+    """Cantidad, magnitud promedio y máxima y profundidad promedio de un conjunto de sismos"""
+    estadisticas = {'cantidad': len(df)}
+    if 'Magnitud' in df.columns and df['Magnitud'].notna().any():
+        estadisticas['magnitud_promedio'] = float(df['Magnitud'].mean())
+        estadisticas['magnitud_maxima'] = float(df['Magnitud'].max())
+    if 'Profundidad' in df.columns and df['Profundidad'].notna().any():
+        estadisticas['profundidad_promedio'] = float(df['Profundidad'].mean())
+    return estadisticas
+
+
+def distribucion_magnitudes(df, ancho=0.5):
+    """Cantidad de sismos por tramo de magnitud de `ancho` unidades"""
+    magnitudes = df['Magnitud'].dropna()
+    if magnitudes.empty:
+        return pd.Series(dtype='int64', name='cantidad')
+    tramos = (magnitudes // ancho) * ancho
+    return tramos.value_counts().sort_index().rename_axis('magnitud_desde').rename('cantidad')
@@ -0,0 +1,147 @@
+"""
+Analítica de ventana móvil para series de indicadores
+
+Calcula retornos, volatilidad móvil, medias móviles (simple y exponencial) y
+drawdown de una serie en una sola pasada O(n) cada uno, sin recorrer la
+ventana completa por cada punto. No depende de Streamlit, por lo que sirve
+tanto para la aplicación como para procesos por lotes.
+
+Los resultados se guardan en una cache LRU por versión de la serie (huella
+de su contenido) y ventanas pedidas.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.cache_figuras import huella
+from utils.data_processing import decimal_float32
+from utils.metricas import CACHE, TRANSFORMACION
+
+VENTANA_VOLATILIDAD = 20
+VENTANAS_MEDIA = (20, 60)
+
+# Resultados guardados en la cache
+MAXIMO_ENTRADAS = 64
+
+
+def retornos(valores):
+    """Retorno de cada período respecto del anterior (el primero es NaN)
+
+    Retorno logarítmico si la serie es siempre positiva; en otro caso (tasas,
+    variación del IPC) la diferencia simple.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    resultado = np.full(len(valores), np.nan)
+    if len(valores) > 1:
+        if (valores > 0).all():
+            resultado[1:] = np.diff(np.log(valores))
+        else:
+            resultado[1:] = np.diff(valores)
+    return resultado
+
+
+def media_movil(valores, ventana):
+    """Media móvil simple con sumas acumuladas (NaN hasta completar la ventana)"""
+    valores = np.asarray(valores, dtype=np.float64)
+    resultado = np.full(len(valores), np.nan)
+    if ventana <= len(valores):
+        acumulado = np.cumsum(np.concatenate(([0.0], valores)))
+        resultado[ventana - 1:] = (acumulado[ventana:] - acumulado[:-ventana]) / ventana
+    return resultado
+
+
+def media_exponencial(valores, ventana):
+    """Media móvil exponencial con alfa = 2 / (ventana + 1)"""
+    return pd.Series(valores, dtype=np.float64).ewm(span=ventana, adjust=False).mean().to_numpy()
+
+
+def volatilidad_movil(rendimientos, ventana):
+    """Desviación estándar móvil (ddof=1) de los retornos"""
+    return pd.Series(rendimientos, dtype=np.float64).rolling(ventana, min_periods=ventana).std().to_numpy()
+
+
+def drawdown(valores):
+    """Caída relativa de cada punto respecto del máximo alcanzado hasta ese momento"""
+    valores = np.asarray(valores, dtype=np.float64)
+    maximo = np.maximum.accumulate(valores)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(maximo > 0, valores / maximo - 1, np.nan)
+
+
+class AnalisisMovil:
+    """Cache LRU de análisis móviles por versión de la serie y ventanas"""
+
+    def __init__(self, maximo_entradas=MAXIMO_ENTRADAS):
+        self.maximo_entradas = maximo_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._resultados = OrderedDict()
+        self._lock = threading.Lock()
+
+    def analizar(self, serie, ventana_volatilidad=VENTANA_VOLATILIDAD, ventanas_media=VENTANAS_MEDIA):
+        """DataFrame con valor, retorno, volatilidad, sma_<n>, ema_<n> y drawdown
+
+        `serie` es una Series (o DataFrame con columna 'valor') ordenada en el
+        tiempo. El resultado se comparte entre llamadas y no debe modificarse.
+        """
+        if isinstance(serie, pd.DataFrame):
+            serie = serie['valor']
+        ventanas_media = tuple(sorted(set(ventanas_media)))
+        clave = (huella(serie), ventana_volatilidad, ventanas_media)
+
+        with self._lock:
+            if clave in self._resultados:
+                self._resultados.move_to_end(clave)
+                self.aciertos += 1
+                CACHE.incrementar(cache='analisis_movil', resultado='acierto')
+                return self._resultados[clave]
+            self.fallos += 1
+        CACHE.incrementar(cache='analisis_movil', resultado='fallo')
+
+        with TRANSFORMACION.medir(etapa='analisis_movil'):
+            resultado = self._calcular(serie, ventana_volatilidad, ventanas_media)
+
+        with self._lock:
+            self._resultados[clave] = resultado
+            while len(self._resultados) > self.maximo_entradas:
+                self._resultados.popitem(last=False)
+        return resultado
+
+    @staticmethod
+    def _calcular(serie, ventana_volatilidad, ventanas_media):
+        # Las series normalizadas son float32: se parte de los decimales de la API, sin su ruido binario
+        valores = decimal_float32(serie.to_numpy()) if serie.dtype == np.float32 else serie.to_numpy(dtype=np.float64)
+        rendimientos = retornos(valores)
+        columnas = {
+            'valor': valores,
+            'retorno': rendimientos,
+            'volatilidad': volatilidad_movil(rendimientos, ventana_volatilidad),
+        }
+        for ventana in ventanas_media:
+            columnas[f'sma_{ventana}'] = media_movil(valores, ventana)
+            columnas[f'ema_{ventana}'] = media_exponencial(valores, ventana)
+        columnas['drawdown'] = drawdown(valores)
+        return pd.DataFrame(columnas, index=serie.index)
+
+    def estadisticas(self):
+        """Aciertos, fallos y cantidad de resultados guardados"""
+        with self._lock:
+            return {'aciertos': self.aciertos, 'fallos': self.fallos, 'resultados': len(self._resultados)}
+
+
+def indicadores_finales(analisis):
+    """Métricas del último punto del análisis: volatilidad actual, drawdown actual y máximo"""
+    ultimo = analisis.iloc[-1]
+    return {
+        'volatilidad': float(ultimo['volatilidad']),
+        'drawdown': float(ultimo['drawdown']),
+        'drawdown_maximo': float(analisis['drawdown'].min()),
+        'retorno_medio': float(analisis['retorno'].mean()),
+    }
+
+
+# Instancia compartida por todas las sesiones del proceso
+analisis_movil = AnalisisMovil()
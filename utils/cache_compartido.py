@@ -0,0 +1,27 @@
+"""
+Selección de la cache compartida de las series descargadas
+
+CACHE_BACKEND elige dónde quedan las entradas:
+
+    disco   (por defecto) Parquet bajo DATA_DIR; lo comparten los procesos
+            del mismo equipo que usan el mismo directorio
+    redis   servidor Redis en REDIS_URL; lo comparten réplicas en equipos
+            distintos
+
+Ambos módulos exponen leer, leer_metadatos, esta_fresca, guardar y bloqueo.
+"""
+
+import importlib
+import os
+
+BACKENDS = {
+    'disco': 'utils.cache_disco',
+    'redis': 'utils.cache_redis',
+}
+
+NOMBRE_BACKEND = os.environ.get('CACHE_BACKEND', 'disco').strip().lower()
+
+if NOMBRE_BACKEND not in BACKENDS:
+    raise ValueError(f"CACHE_BACKEND desconocido: {NOMBRE_BACKEND!r} (opciones: {', '.join(BACKENDS)})")
+
+cache = importlib.import_module(BACKENDS[NOMBRE_BACKEND])
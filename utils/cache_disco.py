@@ -0,0 +1,139 @@
+"""
+Cache persistente en disco (Parquet) para las series descargadas
+
+Cada entrada se guarda como un único archivo data/cache/<fuente>/<partes...>.parquet,
+con sus metadatos de frescura en los metadatos clave-valor del propio Parquet,
+de modo que un reinicio del servidor pueda responder sin volver a consultar las
+APIs. Como datos y metadatos se reemplazan juntos, una lectura concurrente
+nunca mezcla los datos de una versión con los metadatos de otra. Todos los
+procesos del mismo equipo que usan el mismo DATA_DIR comparten las entradas.
+"""
+
+import os
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo entre procesos
+    fcntl = None
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Se incrementa cuando cambia el esquema de los DataFrames guardados; las
+# entradas de versiones anteriores se ignoran y se vuelven a descargar
+VERSION_ESQUEMA = 2
+
+# Directorio de datos locales (DATA_DIR permite separar, p. ej., los datos del servidor simulado)
+DIRECTORIO_DATOS = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data'))
+
+DIRECTORIO_CACHE = os.path.join(DIRECTORIO_DATOS, 'cache')
+
+# Tiempo máximo de espera por el bloqueo de una entrada (segundos)
+ESPERA_BLOQUEO = 60
+
+# Clave de los metadatos de la cache dentro del esquema Parquet
+CLAVE_METADATOS = b'dataviz'
+
+
+def _ruta_base(clave):
+    """Ruta (sin extensión) de una entrada a partir de su clave (fuente, indicador, año, ...)"""
+    return os.path.join(DIRECTORIO_CACHE, *[str(parte) for parte in clave])
+
+
+def _metadatos(esquema):
+    """Metadatos de la cache guardados en un esquema Parquet (None si no tiene)"""
+    try:
+        return json.loads(esquema.metadata[CLAVE_METADATOS])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def leer_metadatos(clave):
+    """Lee los metadatos de una entrada (solo el pie del Parquet) o None si no existe"""
+    try:
+        return _metadatos(pq.read_schema(_ruta_base(clave) + '.parquet'))
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def esta_fresca(meta, ttl):
+    """Indica si una entrada sigue vigente (ttl=None significa que no expira)"""
+    return ttl is None or time.time() - meta['guardado_en'] < ttl
+
+
+def leer(clave, ttl=None):
+    """Lee una entrada de la cache
+
+    Retorna (df, metadatos), o (None, None) si la entrada no existe o tiene más
+    de `ttl` segundos.
+    """
+    # Datos y metadatos salen del mismo archivo abierto: aunque otro proceso lo
+    # reemplace durante la lectura, se sigue leyendo la versión que se abrió
+    try:
+        with open(_ruta_base(clave) + '.parquet', 'rb') as archivo:
+            tabla = pq.ParquetFile(archivo).read()
+    except Exception:
+        return None, None
+    meta = _metadatos(tabla.schema)
+    if meta is None or meta.get('version') != VERSION_ESQUEMA or not esta_fresca(meta, ttl):
+        return None, None
+    try:
+        df = tabla.to_pandas()
+    except Exception:
+        return None, None
+    return df, meta
+
+
+def guardar(clave, df, **metadatos):
+    """Guarda una entrada en la cache junto con sus metadatos de frescura"""
+    ruta = _ruta_base(clave)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+
+    meta = dict(metadatos, guardado_en=time.time(), filas=len(df), version=VERSION_ESQUEMA)
+
+    tabla = pa.Table.from_pandas(df)
+    tabla = tabla.replace_schema_metadata(
+        {**(tabla.schema.metadata or {}), CLAVE_METADATOS: json.dumps(meta, ensure_ascii=False)})
+
+    # Escritura atómica: otro proceso nunca ve un archivo a medio escribir
+    temporal = f'{ruta}.{os.getpid()}.{threading.get_ident()}.tmp'
+    pq.write_table(tabla, temporal)
+    os.replace(temporal, ruta + '.parquet')
+    return meta
+
+
+@contextmanager
+def bloqueo(clave, espera=ESPERA_BLOQUEO):
+    """Bloqueo exclusivo de una entrada entre procesos del mismo equipo
+
+    Mientras un proceso descarga una entrada, los demás esperan para luego
+    leerla de la cache en vez de repetir la descarga. Si la espera supera
+    `espera` segundos se continúa sin el bloqueo.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    ruta = _ruta_base(clave) + '.lock'
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, 'a') as archivo:
+        limite = time.monotonic() + espera
+        adquirido = False
+        while True:
+            try:
+                fcntl.flock(archivo, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                adquirido = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= limite:
+                    break
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if adquirido:
+                fcntl.flock(archivo, fcntl.LOCK_UN)
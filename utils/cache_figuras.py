@@ -0,0 +1,109 @@
+"""
+Cache de figuras Plotly por versión de los datos y parámetros del gráfico
+
+Evita reconstruir en cada rerun de Streamlit las figuras cuyos datos y
+parámetros no cambiaron. La clave combina una huella del contenido de los
+datos con el tipo de gráfico, título, alto y demás argumentos; las entradas
+se desalojan por LRU al superar el límite de memoria.
+
+Las figuras se comparten entre sesiones, por lo que no deben modificarse
+después de obtenerlas de la cache.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.metricas import CACHE, FIGURAS
+
+# Límite de memoria (estimada) de las figuras guardadas
+MEMORIA_MAXIMA = 64 * 1024 * 1024
+
+# Sobrecosto aproximado del layout y los metadatos de una figura
+TAMAÑO_BASE_FIGURA = 16 * 1024
+
+
+def huella(*datos):
+    """Huella del contenido (valores e índice) de uno o más DataFrames/Series"""
+    h = hashlib.blake2b(digest_size=16)
+    for df in datos:
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        nombres = list(df.columns) if isinstance(df, pd.DataFrame) else [df.name]
+        h.update(repr(nombres).encode())
+    return h.hexdigest()
+
+
+def tamaño_estimado_figura(*datos):
+    """Memoria aproximada de una figura: sus datos (en JSON ocupan ~2x) más el layout"""
+    return TAMAÑO_BASE_FIGURA + 2 * sum(int(pd.DataFrame(df).memory_usage(deep=True).sum()) for df in datos)
+
+
+class CacheFiguras:
+    """Cache LRU de figuras con límite de memoria"""
+
+    def __init__(self, memoria_maxima=MEMORIA_MAXIMA):
+        self.memoria_maxima = memoria_maxima
+        self.memoria_usada = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._figuras = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener_o_construir(self, clave, construir, tamaño, tipo='personalizada'):
+        """Retorna la figura guardada para la clave o la construye con `construir()`"""
+        with self._lock:
+            if clave in self._figuras:
+                self._figuras.move_to_end(clave)
+                self.aciertos += 1
+                CACHE.incrementar(cache='figuras', resultado='acierto')
+                return self._figuras[clave][0]
+            self.fallos += 1
+        CACHE.incrementar(cache='figuras', resultado='fallo')
+
+        with FIGURAS.medir(tipo=tipo):
+            fig = construir()
+
+        with self._lock:
+            if clave not in self._figuras and tamaño <= self.memoria_maxima:
+                self._figuras[clave] = (fig, tamaño)
+                self.memoria_usada += tamaño
+                while self.memoria_usada > self.memoria_maxima:
+                    _, (_, tamaño_desalojado) = self._figuras.popitem(last=False)
+                    self.memoria_usada -= tamaño_desalojado
+        return fig
+
+    def figura(self, df, tipo, titulo=None, alto=None, layout=None, **argumentos):
+        """Figura de plotly.express (`tipo` = 'line', 'area', 'bar', 'histogram', 'scatter', ...)"""
+        layout = dict(layout or {})
+        # Las listas (p. ej. varias columnas en y) se pasan a tuplas para formar la clave
+        parametros = tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in argumentos.items()))
+        clave = (huella(df), tipo, titulo, alto, tuple(sorted(layout.items())), parametros)
+
+        def construir():
+            # plotly.express se importa recién al construir la primera figura
+            import plotly.express as px
+
+            fig = getattr(px, tipo)(df, title=titulo, **argumentos)
+            if alto is not None:
+                layout['height'] = alto
+            if layout:
+                fig.update_layout(**layout)
+            return fig
+
+        return self.obtener_o_construir(clave, construir, tamaño_estimado_figura(df), tipo)
+
+    def estadisticas(self):
+        """Aciertos, fallos, cantidad de figuras y memoria estimada en uso"""
+        with self._lock:
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'figuras': len(self._figuras),
+                'memoria_usada': self.memoria_usada,
+            }
+
+
+# Instancia compartida por todas las sesiones del proceso
+figuras = CacheFiguras()
@@ -0,0 +1,112 @@
+"""
+Cache compartida en Redis (o un servidor compatible) para las series descargadas
+
+Misma interfaz que utils/cache_disco.py, pero las entradas quedan en un
+servidor al que se conectan todas las réplicas de la aplicación, aunque estén
+en equipos distintos. Cada entrada ocupa dos claves: <prefijo>:<clave>:datos
+con el DataFrame en Parquet y <prefijo>:<clave>:meta con los metadatos en JSON.
+
+Requiere el paquete opcional `redis` (pip install redis).
+"""
+
+import io
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from utils.cache_disco import ESPERA_BLOQUEO, VERSION_ESQUEMA, esta_fresca
+
+URL_REDIS = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+PREFIJO = os.environ.get('REDIS_PREFIJO', 'dataviz')
+
+# Duración máxima de un bloqueo cuyo dueño dejó de responder (segundos)
+DURACION_BLOQUEO = 120
+
+_conexion = None
+
+__all__ = ['leer_metadatos', 'esta_fresca', 'leer', 'guardar', 'bloqueo']
+
+
+def _redis():
+    """Conexión compartida (se crea en el primer uso)"""
+    global _conexion
+    if _conexion is None:
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("CACHE_BACKEND=redis requiere el paquete 'redis' (pip install redis)") from e
+        _conexion = redis.Redis.from_url(URL_REDIS)
+    return _conexion
+
+
+def _nombre(clave, sufijo):
+    return ':'.join([PREFIJO, *[str(parte) for parte in clave], sufijo])
+
+
+def leer_metadatos(clave):
+    """Lee los metadatos de una entrada o None si no existe"""
+    datos = _redis().get(_nombre(clave, 'meta'))
+    if datos is None:
+        return None
+    try:
+        return json.loads(datos)
+    except ValueError:
+        return None
+
+
+def leer(clave, ttl=None):
+    """Lee una entrada de la cache
+
+    Retorna (df, metadatos), o (None, None) si la entrada no existe o tiene más
+    de `ttl` segundos.
+    """
+    meta_bytes, datos = _redis().mget(_nombre(clave, 'meta'), _nombre(clave, 'datos'))
+    if meta_bytes is None or datos is None:
+        return None, None
+    try:
+        meta = json.loads(meta_bytes)
+    except ValueError:
+        return None, None
+    if meta.get('version') != VERSION_ESQUEMA or not esta_fresca(meta, ttl):
+        return None, None
+    try:
+        df = pd.read_parquet(io.BytesIO(datos))
+    except Exception:
+        return None, None
+    return df, meta
+
+
+def guardar(clave, df, **metadatos):
+    """Guarda una entrada en la cache junto con sus metadatos de frescura"""
+    meta = dict(metadatos, guardado_en=time.time(), filas=len(df), version=VERSION_ESQUEMA)
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+
+    # Ambas claves se escriben en una transacción: nunca se leen datos y metadatos de versiones distintas
+    transaccion = _redis().pipeline(transaction=True)
+    transaccion.set(_nombre(clave, 'datos'), buffer.getvalue())
+    transaccion.set(_nombre(clave, 'meta'), json.dumps(meta, ensure_ascii=False))
+    transaccion.execute()
+    return meta
+
+
+@contextmanager
+def bloqueo(clave, espera=ESPERA_BLOQUEO):
+    """Bloqueo exclusivo de una entrada entre todas las réplicas
+
+    Si la espera supera `espera` segundos se continúa sin el bloqueo.
+    """
+    candado = _redis().lock(_nombre(clave, 'bloqueo'), timeout=DURACION_BLOQUEO, blocking_timeout=espera)
+    adquirido = candado.acquire()
+    try:
+        yield
+    finally:
+        if adquirido:
+            try:
+                candado.release()
+            except Exception:
+                # El bloqueo venció mientras se descargaba; otro proceso ya puede tenerlo
+                pass
@@ -0,0 +1,195 @@
+"""
+Cliente HTTP compartido para las APIs externas
+
+Mantiene una sesión con pool de conexiones por host, reintenta con backoff
+exponencial con jitter y corta el paso a un host caído (circuit breaker) para
+fallar de inmediato en lugar de esperar el timeout completo en cada consulta.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.metricas import LATENCIA_HTTP, SOLICITUDES_HTTP
+
+# Códigos HTTP que vale la pena reintentar
+ESTADOS_REINTENTABLES = {429, 500, 502, 503, 504}
+
+
+def _recortar(timeout, restante):
+    """Timeout de un intento: el pedido, sin pasar del tiempo que queda"""
+    restante = max(restante, 0.001)
+    if isinstance(timeout, tuple):
+        return tuple(min(parte, restante) for parte in timeout)
+    return min(timeout, restante)
+
+
+class CircuitoAbiertoError(requests.ConnectionError):
+    """El host está marcado como caído y la solicitud se rechaza sin intentarla"""
+
+
+class CircuitBreaker:
+    """Circuit breaker por host: cerrado -> abierto tras N fallos -> semiabierto tras la espera"""
+
+    def __init__(self, umbral_fallos=5, tiempo_apertura=30):
+        self.umbral_fallos = umbral_fallos
+        self.tiempo_apertura = tiempo_apertura
+        self.fallos_consecutivos = 0
+        self.abierto_desde = None
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self):
+        if self.abierto_desde is None:
+            return 'cerrado'
+        if time.monotonic() - self.abierto_desde >= self.tiempo_apertura:
+            return 'semiabierto'
+        return 'abierto'
+
+    def permitir(self):
+        """Indica si se puede intentar una solicitud (en semiabierto pasa una de prueba)"""
+        with self._lock:
+            if self.estado == 'abierto':
+                return False
+            if self.estado == 'semiabierto':
+                # Solo una solicitud de prueba; las demás esperan su resultado
+                self.abierto_desde = time.monotonic()
+            return True
+
+    def registrar_exito(self):
+        with self._lock:
+            self.fallos_consecutivos = 0
+            self.abierto_desde = None
+
+    def registrar_fallo(self):
+        with self._lock:
+            self.fallos_consecutivos += 1
+            if self.fallos_consecutivos >= self.umbral_fallos:
+                self.abierto_desde = time.monotonic()
+
+
+class ClienteHTTP:
+    """Cliente con sesiones por host, reintentos con backoff y circuit breaker"""
+
+    def __init__(self, reintentos=2, backoff_base=0.5, backoff_max=4.0, tamaño_pool=10,
+                 umbral_fallos=5, tiempo_apertura=30):
+        self.reintentos = reintentos
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.tamaño_pool = tamaño_pool
+        self.umbral_fallos = umbral_fallos
+        self.tiempo_apertura = tiempo_apertura
+
+        self._sesiones = {}
+        self._circuitos = {}
+        self._estadisticas = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url):
+        return urlsplit(url).netloc
+
+    def _recursos_host(self, host):
+        """Sesión, circuit breaker y contadores del host (se crean la primera vez)"""
+        with self._lock:
+            if host not in self._sesiones:
+                sesion = requests.Session()
+                adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=self.tamaño_pool)
+                sesion.mount('http://', adaptador)
+                sesion.mount('https://', adaptador)
+                self._sesiones[host] = sesion
+                self._circuitos[host] = CircuitBreaker(self.umbral_fallos, self.tiempo_apertura)
+                self._estadisticas[host] = {
+                    'solicitudes': 0,
+                    'errores': 0,
+                    'reintentos': 0,
+                    'rechazadas': 0,
+                    'latencia_total': 0.0,
+                    'latencia_max': 0.0,
+                }
+            return self._sesiones[host], self._circuitos[host], self._estadisticas[host]
+
+    def _sumar(self, stats, **incrementos):
+        with self._lock:
+            for nombre, valor in incrementos.items():
+                stats[nombre] += valor
+
+    def _espera_backoff(self, intento):
+        """Backoff exponencial con jitter completo"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** intento))
+
+    def get(self, url, timeout=10, reintentos=None, **kwargs):
+        """GET con reintentos; retorna la respuesta (el llamador decide si usar raise_for_status)
+
+        `timeout` limita el tiempo total de la llamada, sumando todos los
+        intentos y las esperas entre ellos. Un timeout de lectura no se
+        reintenta: el servidor recibió la solicitud y no respondió a tiempo,
+        y repetirla solo multiplicaría la espera.
+        """
+        host = self._host(url)
+        sesion, circuito, stats = self._recursos_host(host)
+        reintentos = self.reintentos if reintentos is None else reintentos
+        limite = time.monotonic() + (sum(timeout) if isinstance(timeout, tuple) else timeout)
+
+        for intento in range(reintentos + 1):
+            if not circuito.permitir():
+                self._sumar(stats, rechazadas=1)
+                SOLICITUDES_HTTP.incrementar(host=host, resultado='rechazada')
+                raise CircuitoAbiertoError(f"{host} no disponible (circuito abierto), se reintentará más tarde")
+
+            restante = limite - time.monotonic()
+            inicio = time.perf_counter()
+            try:
+                response = sesion.get(url, timeout=_recortar(timeout, restante), **kwargs)
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+            duracion = time.perf_counter() - inicio
+            self._sumar(stats, solicitudes=1, reintentos=int(intento > 0), latencia_total=duracion)
+            with self._lock:
+                stats['latencia_max'] = max(stats['latencia_max'], duracion)
+            LATENCIA_HTTP.observar(duracion, host=host)
+            SOLICITUDES_HTTP.incrementar(host=host, resultado='error' if error is not None else response.status_code)
+
+            if error is None and response.status_code not in ESTADOS_REINTENTABLES:
+                circuito.registrar_exito()
+                return response
+
+            self._sumar(stats, errores=1)
+            circuito.registrar_fallo()
+            if isinstance(error, requests.ReadTimeout):
+                break
+            espera = self._espera_backoff(intento)
+            if intento == reintentos or time.monotonic() + espera >= limite:
+                # Sin tiempo para otro intento dentro del timeout pedido
+                break
+            time.sleep(espera)
+
+        if error is not None:
+            raise error
+        return response
+
+    def get_json(self, url, timeout=10, **kwargs):
+        """GET que valida el estado HTTP y decodifica el JSON"""
+        response = self.get(url, timeout=timeout, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def estadisticas(self):
+        """Contadores por host: solicitudes, errores, latencia media/máxima y estado del circuito"""
+        with self._lock:
+            resultado = {}
+            for host, stats in self._estadisticas.items():
+                resultado[host] = dict(
+                    stats,
+                    latencia_media=stats['latencia_total'] / stats['solicitudes'] if stats['solicitudes'] else 0.0,
+                    circuito=self._circuitos[host].estado,
+                )
+            return resultado
+
+
+# Instancia compartida por todas las consultas del proceso
+cliente = ClienteHTTP()
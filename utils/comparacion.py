@@ -0,0 +1,104 @@
+"""
+Motor de comparación entre varios indicadores
+
+Alinea series de distinta frecuencia (UF diaria, IPC mensual, TPM que cambia
+pocas veces al año) sobre un calendario común y calcula índices
+normalizados, correlaciones y betas móviles con operaciones vectorizadas de
+pandas/NumPy sobre todas las columnas a la vez.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Frecuencias disponibles para el calendario común
+FRECUENCIAS = {
+    'Diaria': 'D',
+    'Semanal': 'W',
+    'Mensual': 'MS',
+}
+
+ZONA_HORARIA_CHILE = 'America/Santiago'
+
+
+def _a_fechas_locales(serie):
+    """Índice en días calendario de Chile (las fechas de la API vienen en UTC)"""
+    indice = serie.index
+    if indice.tz is not None:
+        indice = indice.tz_convert(ZONA_HORARIA_CHILE).tz_localize(None)
+    serie = serie.set_axis(indice.normalize())
+    return serie[~serie.index.duplicated(keep='last')]
+
+
+def alinear(series, frecuencia='D', metodo='asof'):
+    """Alinea varias series sobre un calendario común
+
+    `series` es un diccionario {nombre: Series indexada por fecha}. Con
+    metodo='asof' cada fecha del calendario toma el último valor conocido a esa
+    fecha (unión as-of); con metodo='promedio' se promedian las observaciones de
+    cada período antes de completar los vacíos. El calendario parte cuando
+    todas las series ya tienen al menos un valor.
+    """
+    series = {nombre: _a_fechas_locales(serie.dropna()) for nombre, serie in series.items() if serie is not None}
+    series = {nombre: serie for nombre, serie in series.items() if not serie.empty}
+    if not series:
+        return pd.DataFrame()
+
+    inicio = max(serie.index[0] for serie in series.values())
+    fin = max(serie.index[-1] for serie in series.values())
+    calendario = pd.date_range(inicio, fin, freq=frecuencia, name='fecha')
+    if calendario.empty:
+        return pd.DataFrame()
+
+    columnas = {}
+    for nombre, serie in series.items():
+        if metodo == 'promedio':
+            serie = serie.resample(frecuencia).mean().dropna()
+        columnas[nombre] = serie.reindex(calendario, method='ffill')
+    return pd.DataFrame(columnas).dropna()
+
+
+def indices_normalizados(df, base=100):
+    """Cada columna expresada como índice con la primera fecha = `base`
+
+    Las columnas que parten en cero o en negativo (p. ej. la variación del IPC)
+    no admiten un índice y se omiten.
+    """
+    positivas = df.columns[df.iloc[0] > 0]
+    return df[positivas] / df[positivas].iloc[0] * base
+
+
+def variaciones(df):
+    """Variación período a período de cada columna
+
+    Retorno logarítmico para las series siempre positivas (UF, dólar, ...) y
+    diferencia simple para las que pueden ser cero o negativas (tasas, IPC).
+    """
+    positivas = (df > 0).all()
+    cambios = df.diff()
+    cambios.loc[:, positivas] = np.log(df.loc[:, positivas]).diff()
+    return cambios.iloc[1:]
+
+
+def matriz_correlacion(df):
+    """Correlación de Pearson entre todas las columnas"""
+    return df.corr()
+
+
+def correlacion_movil(df, referencia, ventana):
+    """Correlación móvil de cada columna contra la columna `referencia`"""
+    return df.drop(columns=referencia).rolling(ventana).corr(df[referencia])
+
+
+def beta_movil(df, referencia, ventana):
+    """Beta móvil de cada columna respecto de `referencia`: cov(x, ref) / var(ref)
+
+    Se calcula con medias móviles de los productos, en una sola pasada
+    vectorizada para todas las columnas.
+    """
+    x = df.drop(columns=referencia)
+    y = df[referencia]
+    media_x = x.rolling(ventana).mean()
+    media_y = y.rolling(ventana).mean()
+    covarianza = x.mul(y, axis=0).rolling(ventana).mean() - media_x.mul(media_y, axis=0)
+    varianza = (y * y).rolling(ventana).mean() - media_y ** 2
+    return covarianza.div(varianza.replace(0, np.nan), axis=0)
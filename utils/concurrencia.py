@@ -0,0 +1,133 @@
+"""
+Ejecución concurrente de descargas desde varias fuentes
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils.metricas import SINGLEFLIGHT
+
+# Pool compartido por todo el proceso del servidor
+_ejecutor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='dataviz-fuentes')
+
+
+# Con tareas todavía en cola se revisa cada cuánto empiezan a ejecutarse (segundos)
+INTERVALO_REVISION = 0.1
+
+
+def obtener_en_paralelo(tareas, timeouts=None, timeout_defecto=15, espera_cola=None):
+    """Ejecuta las tareas en paralelo y entrega cada resultado apenas termina
+
+    `tareas` es un diccionario {clave: función sin argumentos}. Genera tuplas
+    (clave, resultado, error) en orden de llegada; una tarea que supera su
+    timeout se entrega con un TimeoutError sin bloquear al resto. El timeout
+    corre desde que la tarea empieza a ejecutarse, no desde que entra a la cola
+    del pool, de modo que muchas tareas a la vez no vencen solo por esperar turno.
+
+    La espera en la cola también tiene límite: ninguna tarea se espera más de
+    `espera_cola` + su timeout desde que se envió (por defecto `espera_cola` es
+    el mayor timeout del lote), aunque el pool esté ocupado por tareas de otras
+    llamadas. Las tareas vencidas que aún no empezaban se cancelan para que no
+    ocupen un hilo que necesitan los lotes siguientes.
+    """
+    timeouts = timeouts or {}
+    if espera_cola is None:
+        espera_cola = max([timeout_defecto, *timeouts.values()])
+    inicios = {}
+
+    def medir_inicio(clave, funcion):
+        def envoltura():
+            inicios[clave] = time.monotonic()
+            return funcion()
+        return envoltura
+
+    pendientes = {}
+    enviado = time.monotonic()
+    for clave, funcion in tareas.items():
+        pendientes[_ejecutor.submit(medir_inicio(clave, funcion))] = clave
+
+    def limite(clave):
+        timeout = timeouts.get(clave, timeout_defecto)
+        vence = enviado + espera_cola + timeout
+        inicio = inicios.get(clave)
+        return vence if inicio is None else min(vence, inicio + timeout)
+
+    try:
+        while pendientes:
+            limites = [limite(clave) for clave in pendientes.values()]
+            espera = max(0, min(limites) - time.monotonic())
+            if any(clave not in inicios for clave in pendientes.values()):
+                # Mientras haya tareas en cola, su límite puede adelantarse al empezar
+                espera = min(espera, INTERVALO_REVISION)
+            listos, _ = wait(list(pendientes), timeout=espera, return_when=FIRST_COMPLETED)
+
+            for futuro in listos:
+                clave = pendientes.pop(futuro)
+                try:
+                    yield clave, futuro.result(), None
+                except Exception as e:
+                    yield clave, None, e
+
+            # Las tareas vencidas se reportan y se dejan de esperar
+            ahora = time.monotonic()
+            for futuro, clave in list(pendientes.items()):
+                if limite(clave) <= ahora and not futuro.done():
+                    del pendientes[futuro]
+                    if futuro.cancel():
+                        error = TimeoutError(f"{clave}: sin un hilo libre tras {ahora - enviado:.1f} s en cola")
+                    else:
+                        error = TimeoutError(f"{clave}: sin respuesta tras {timeouts.get(clave, timeout_defecto):.0f} s")
+                    yield clave, None, error
+    finally:
+        # Si se deja de consumir el generador, lo que sigue en cola no se ejecuta
+        for futuro in pendientes:
+            futuro.cancel()
+
+
+class SingleFlight:
+    """Agrupa las llamadas concurrentes con la misma clave en una sola ejecución
+
+    Mientras una consulta está en curso, las demás llamadas con la misma clave
+    esperan su resultado en vez de repetirla contra la API. Las llamadas
+    emitidas y agrupadas se cuentan en SINGLEFLIGHT con la etiqueta `grupo`.
+    """
+
+    def __init__(self, grupo='general'):
+        self.grupo = grupo
+        self._en_vuelo = {}
+        self._lock = threading.Lock()
+        self.emitidas = 0
+        self.agrupadas = 0
+
+    def ejecutar(self, clave, funcion):
+        """Ejecuta `funcion()` o espera el resultado de la ejecución en curso para la clave"""
+        with self._lock:
+            futuro = self._en_vuelo.get(clave)
+            propia = futuro is None
+            if propia:
+                futuro = self._en_vuelo[clave] = Future()
+                self.emitidas += 1
+            else:
+                self.agrupadas += 1
+        SINGLEFLIGHT.incrementar(grupo=self.grupo, resultado='emitida' if propia else 'agrupada')
+
+        if not propia:
+            return futuro.result()
+
+        try:
+            resultado = funcion()
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            with self._lock:
+                del self._en_vuelo[clave]
+
+    def estadisticas(self):
+        """Contadores de llamadas emitidas, agrupadas y en curso"""
+        with self._lock:
+            return {'emitidas': self.emitidas, 'agrupadas': self.agrupadas, 'en_vuelo': len(self._en_vuelo)}
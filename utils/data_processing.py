@@ -0,0 +1,127 @@
+"""
+Utilidades de procesamiento: normalización de las respuestas de las APIs
+
+Las respuestas se convierten directamente a un esquema fijo y compacto en una
+sola pasada, sin construir primero un DataFrame genérico de objetos:
+
+- Indicadores: índice datetime64 llamado 'fecha' (ordenado) y columna 'valor' float32.
+- Sismos: 'Fecha' datetime64, columnas numéricas float32 y columnas de texto
+  como category (si se repiten) o string de Arrow.
+
+Al pasar un float32 a float64 aparece su ruido binario (0.2 se vuelve
+0.20000000298023224). `sin_ruido_float32` lo reemplaza por el decimal más corto
+que representa ese float32, el mismo que entregó la API, antes de exportar o
+informar los datos.
+"""
+
+import numpy as np
+import pandas as pd
+
+COLUMNAS_NUMERICAS_SISMOS = ['Magnitud', 'Profundidad', 'Latitud', 'Longitud']
+COLUMNAS_FECHA_SISMOS = ['Fecha', 'FechaUpdate']
+
+# Una columna de texto se guarda como category si tiene menos de esta
+# proporción de valores distintos
+PROPORCION_CATEGORICA = 0.5
+
+# Cifras significativas que un float32 conserva siempre y las que pueden hacer
+# falta para distinguirlo de sus vecinos
+CIFRAS_FLOAT32 = (6, 9)
+
+
+def normalizar_serie(registros):
+    """Convierte la lista "serie" de mindicador.cl al esquema de indicadores"""
+    fechas = pd.to_datetime([registro.get("fecha") for registro in registros])
+    valores = pd.to_numeric(pd.Series([registro.get("valor") for registro in registros], dtype=object),
+                            errors='coerce').to_numpy(dtype=np.float32)
+
+    # Se descartan valores no numéricos y se ordena por fecha en la misma pasada
+    validos = ~np.isnan(valores)
+    orden = np.argsort(fechas.asi8[validos], kind='stable')
+    indice = pd.DatetimeIndex(fechas[validos][orden], name="fecha")
+    return pd.DataFrame({"valor": valores[validos][orden]}, index=indice)
+
+
+def _columna_texto(valores):
+    """Columna de texto compacta: category si hay muchos repetidos, string de Arrow si no"""
+    columna = pd.Series(valores, dtype="string[pyarrow]")
+    if columna.nunique() < PROPORCION_CATEGORICA * len(columna):
+        return columna.astype("category")
+    return columna
+
+
+def normalizar_sismos(registros):
+    """Convierte la respuesta de Gael Cloud al esquema de sismos"""
+    nombres = list(dict.fromkeys(clave for registro in registros for clave in registro))
+
+    columnas = {}
+    for nombre in nombres:
+        valores = [registro.get(nombre) for registro in registros]
+        if nombre in COLUMNAS_FECHA_SISMOS:
+            columnas[nombre] = pd.to_datetime(pd.Series(valores, dtype=object), errors='coerce')
+        elif nombre in COLUMNAS_NUMERICAS_SISMOS:
+            columnas[nombre] = pd.to_numeric(pd.Series(valores, dtype=object), errors='coerce').astype(np.float32)
+        else:
+            columnas[nombre] = _columna_texto(valores)
+
+    df = pd.DataFrame(columnas)
+    # Eliminar filas completamente vacías
+    return df.dropna(how='all')
+
+
+def redondear_cifras(valores, cifras):
+    """Arreglo float64 con cada valor redondeado a `cifras` cifras significativas"""
+    valores = np.asarray(valores, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exponentes = np.floor(np.log10(np.abs(valores)))
+    # Cero, NaN e infinitos se dejan tal cual
+    decimales = np.where(np.isfinite(exponentes), cifras - 1 - exponentes, 0)
+    # Solo se usan potencias positivas de 10, que son exactas en float64
+    escala = 10.0 ** np.abs(decimales)
+    with np.errstate(invalid='ignore'):
+        return np.where(decimales >= 0, np.round(valores * escala) / escala, np.round(valores / escala) * escala)
+
+
+def decimal_float32(valores):
+    """float64 con el decimal más corto que representa cada valor float32"""
+    originales = np.asarray(valores, dtype=np.float32)
+    resultado = originales.astype(np.float64)
+    pendientes = np.ones(len(resultado), dtype=bool)
+    minimo, maximo = CIFRAS_FLOAT32
+    for cifras in range(minimo, maximo + 1):
+        candidatos = redondear_cifras(resultado[pendientes], cifras)
+        exactos = candidatos.astype(np.float32) == originales[pendientes]
+        indices = np.flatnonzero(pendientes)[exactos]
+        resultado[indices] = candidatos[exactos]
+        pendientes[indices] = False
+    return resultado
+
+
+def sin_ruido_float32(df, columnas=None):
+    """Copia de `df` con las columnas float32 (o las `columnas` indicadas) en float64 sin ruido
+
+    Cada valor se reemplaza por el decimal más corto de su float32, de modo que
+    35248.8 se exporta como 35248.8 y no como 35248.80078125.
+    """
+    if columnas is None:
+        columnas = [columna for columna, tipo in df.dtypes.items() if tipo == np.float32]
+    if not columnas:
+        return df
+    return df.assign(**{columna: decimal_float32(df[columna].to_numpy(dtype=np.float32, na_value=np.nan))
+                        for columna in columnas})
+
+
+def uso_memoria(df):
+    """Memoria ocupada por un DataFrame (incluyendo el contenido de los objetos), en bytes"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def reporte_memoria(registros, normalizar):
+    """Compara la memoria de un DataFrame genérico contra la versión normalizada"""
+    antes = uso_memoria(pd.DataFrame(registros))
+    despues = uso_memoria(normalizar(registros))
+    return {
+        'antes': antes,
+        'despues': despues,
+        'reduccion': 1 - despues / antes if antes else 0.0,
+    }
@@ -0,0 +1,97 @@
+"""
+Índice espacial en grilla para las coordenadas de los sismos
+
+Los eventos se asignan a celdas de una grilla regular de latitud/longitud y
+se ordenan por celda, de modo que cada fila de celdas queda en un tramo
+contiguo. Una caja o un radio se resuelven leyendo solo los tramos de las
+celdas que tocan, y los agregados por celda (cantidad, magnitud máxima) se
+calculan una sola vez para dibujar mapas de densidad sin enviar cada evento.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Tamaño de celda por defecto, en grados (~55 km de latitud)
+TAMAÑO_CELDA = 0.5
+
+RADIO_TIERRA_KM = 6371.0
+
+
+def distancia_km(lat1, lon1, lat2, lon2):
+    """Distancia de gran círculo (haversine) en kilómetros; acepta arreglos"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RADIO_TIERRA_KM * np.arcsin(np.sqrt(a))
+
+
+class IndiceEspacial:
+    """Grilla de celdas sobre (latitud, longitud) con consultas por caja y por radio"""
+
+    def __init__(self, latitudes, longitudes, tamaño_celda=TAMAÑO_CELDA):
+        self.tamaño_celda = tamaño_celda
+        self.columnas = int(np.ceil(360 / tamaño_celda))
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+
+        # Los eventos sin coordenadas quedan fuera del índice
+        validos = np.flatnonzero(~(np.isnan(self.latitudes) | np.isnan(self.longitudes)))
+        celdas = self._celda(self.latitudes[validos], self.longitudes[validos])
+        orden = np.argsort(celdas, kind='stable')
+        self.celdas = celdas[orden]
+        self.posiciones = validos[orden]
+        self._agregados = None
+
+    def _fila_columna(self, lat, lon):
+        fila = np.floor((np.asarray(lat) + 90) / self.tamaño_celda).astype(np.int64)
+        columna = np.floor((np.asarray(lon) + 180) / self.tamaño_celda).astype(np.int64)
+        return fila, np.clip(columna, 0, self.columnas - 1)
+
+    def _celda(self, lat, lon):
+        fila, columna = self._fila_columna(lat, lon)
+        return fila * self.columnas + columna
+
+    def en_caja(self, lat_min, lat_max, lon_min, lon_max):
+        """Posiciones de los eventos dentro de la caja (límites incluidos)"""
+        (fila_min, fila_max), (col_min, col_max) = self._fila_columna([lat_min, lat_max], [lon_min, lon_max])
+
+        # Cada fila de celdas aporta un tramo contiguo del arreglo ordenado
+        tramos = []
+        for fila in range(fila_min, fila_max + 1):
+            inicio = np.searchsorted(self.celdas, fila * self.columnas + col_min, side='left')
+            fin = np.searchsorted(self.celdas, fila * self.columnas + col_max, side='right')
+            tramos.append(self.posiciones[inicio:fin])
+        candidatos = np.concatenate(tramos) if tramos else np.empty(0, dtype=np.int64)
+
+        # Las celdas del borde pueden sobresalir de la caja
+        lat, lon = self.latitudes[candidatos], self.longitudes[candidatos]
+        dentro = (lat >= lat_min) & (lat <= lat_max) & (lon >= lon_min) & (lon <= lon_max)
+        return np.sort(candidatos[dentro])
+
+    def en_radio(self, lat, lon, radio_km):
+        """Posiciones de los eventos a menos de `radio_km` del punto (lat, lon)"""
+        delta_lat = np.degrees(radio_km / RADIO_TIERRA_KM)
+        delta_lon = delta_lat / max(np.cos(np.radians(lat)), 1e-6)
+        candidatos = self.en_caja(lat - delta_lat, lat + delta_lat, lon - delta_lon, lon + delta_lon)
+        distancias = distancia_km(lat, lon, self.latitudes[candidatos], self.longitudes[candidatos])
+        return candidatos[distancias <= radio_km]
+
+    def agregados(self, magnitudes=None):
+        """Por celda: centro (Latitud, Longitud), cantidad de eventos y magnitud máxima
+
+        El resultado se calcula una vez y queda guardado en el índice.
+        """
+        if self._agregados is not None:
+            return self._agregados
+
+        celdas, inicios, cantidades = np.unique(self.celdas, return_index=True, return_counts=True)
+        filas, columnas = np.divmod(celdas, self.columnas)
+        datos = {
+            'Latitud': (filas + 0.5) * self.tamaño_celda - 90,
+            'Longitud': (columnas + 0.5) * self.tamaño_celda - 180,
+            'cantidad': cantidades,
+        }
+        if magnitudes is not None and len(celdas):
+            valores = np.asarray(magnitudes, dtype=np.float64)[self.posiciones]
+            datos['magnitud_max'] = np.fmax.reduceat(valores, inicios)
+        self._agregados = pd.DataFrame(datos)
+        return self._agregados
@@ -0,0 +1,210 @@
+"""
+Exportación de series y sismos filtrados a Parquet, Arrow IPC o CSV
+
+Los archivos se escriben por bloques de filas: cada bloque es una vista del
+DataFrame (con copy-on-write, activado en utils/__init__.py, iloc por tramos no
+copia), de modo que nunca se arma una segunda copia completa de los datos ni
+del texto del CSV. Solo las columnas float32 de cada bloque se copian, para
+escribirlas como float64 con el decimal original (sin el ruido de 35248.80078125
+en lugar de 35248.8). Cada archivo se escribe primero a un temporal y luego se
+renombra, así que en exports/ nunca queda un archivo a medio escribir.
+
+`exportador` ejecuta las exportaciones en hilos de fondo para no bloquear los
+reruns de Streamlit. Los archivos de un trabajo que sale de la lista se
+eliminan, y los que quedaron de ejecuciones anteriores se borran pasadas
+EDAD_MAXIMA_EXPORTS horas.
+"""
+
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from utils.data_processing import sin_ruido_float32
+from utils.metricas import TRANSFORMACION
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_EXPORTS = os.environ.get('EXPORTS_DIR', os.path.join(RAIZ, 'exports'))
+
+# formato: (etiqueta, extensión, tipo MIME)
+FORMATOS = {
+    'parquet': ('Parquet', '.parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('Arrow IPC', '.arrow', 'application/vnd.apache.arrow.file'),
+    'csv': ('CSV', '.csv', 'text/csv'),
+}
+
+FILAS_POR_BLOQUE = 50_000
+
+HILOS_EXPORTACION = 2
+
+# Exportaciones recordadas para reutilizar su archivo
+MAXIMO_TRABAJOS = 32
+
+# Antigüedad máxima de los archivos exportados que ningún trabajo recuerda
+EDAD_MAXIMA_EXPORTS = int(os.environ.get('EDAD_MAXIMA_EXPORTS', 24))
+
+# <nombre>_<fecha-hora>_<sufijo>.<extensión>; solo estos archivos se limpian
+PATRON_ARCHIVO = re.compile(r'_\d{8}-\d{6}_[0-9a-f]{8}\.(?:%s)$' % '|'.join(
+    re.escape(extension[1:]) for _, extension, _ in FORMATOS.values()))
+
+
+def _bloques(df, filas):
+    """Tramos consecutivos de `filas` filas, con los float32 como el decimal que entregó la API
+
+    Solo se convierten las columnas float32 de cada tramo; el resto son vistas.
+    """
+    if not len(df):
+        # Un DataFrame vacío se escribe igual (solo el esquema o los encabezados)
+        yield sin_ruido_float32(df)
+        return
+    for inicio in range(0, len(df), filas):
+        yield sin_ruido_float32(df.iloc[inicio:inicio + filas])
+
+
+def _esquema(df, indice):
+    """Esquema Arrow de los bloques que entrega _bloques"""
+    return pa.Schema.from_pandas(sin_ruido_float32(df.iloc[:0]), preserve_index=indice)
+
+
+def escribir_parquet(df, ruta, indice=True, filas=FILAS_POR_BLOQUE):
+    """Parquet con un row group por bloque"""
+    esquema = _esquema(df, indice)
+    with pq.ParquetWriter(ruta, esquema) as escritor:
+        for bloque in _bloques(df, filas):
+            escritor.write_table(pa.Table.from_pandas(bloque, schema=esquema, preserve_index=indice))
+
+
+def escribir_arrow(df, ruta, indice=True, filas=FILAS_POR_BLOQUE):
+    """Archivo Arrow IPC (sin compresión, se puede leer mapeado en memoria)"""
+    esquema = _esquema(df, indice)
+    with pa.OSFile(ruta, 'wb') as archivo, ipc.new_file(archivo, esquema) as escritor:
+        for bloque in _bloques(df, filas):
+            escritor.write_table(pa.Table.from_pandas(bloque, schema=esquema, preserve_index=indice))
+
+
+def escribir_csv(df, ruta, indice=True, filas=FILAS_POR_BLOQUE):
+    """CSV escrito bloque a bloque (solo un bloque de texto en memoria a la vez)"""
+    with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+        for posicion, bloque in enumerate(_bloques(df, filas)):
+            bloque.to_csv(archivo, header=posicion == 0, index=indice)
+
+
+ESCRITORES = {
+    'parquet': escribir_parquet,
+    'arrow': escribir_arrow,
+    'csv': escribir_csv,
+}
+
+
+def nombre_archivo(nombre, formato):
+    """<nombre>_<fecha-hora>_<sufijo>.<extensión>, sin caracteres problemáticos en el nombre
+
+    El sufijo aleatorio evita que dos exportaciones con el mismo nombre en el
+    mismo segundo (p. ej. dos sesiones con filtros distintos) se pisen.
+    """
+    limpio = re.sub(r'[^\w.-]+', '_', str(nombre)).strip('_') or 'datos'
+    return f"{limpio}_{datetime.now():%Y%m%d-%H%M%S}_{uuid.uuid4().hex[:8]}{FORMATOS[formato][1]}"
+
+
+def exportar(df, nombre, formato, directorio=DIRECTORIO_EXPORTS, indice=True):
+    """Escribe `df` en `directorio` en el formato pedido y retorna la ruta del archivo"""
+    if formato not in ESCRITORES:
+        raise ValueError(f"Formato de exportación desconocido: {formato!r} (opciones: {', '.join(ESCRITORES)})")
+
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, nombre_archivo(nombre, formato))
+    temporal = f'{ruta}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with TRANSFORMACION.medir(etapa=f'exportar_{formato}'):
+            ESCRITORES[formato](df, temporal, indice=indice)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return ruta
+
+
+class Exportador:
+    """Exportaciones en hilos de fondo
+
+    Las solicitudes con la misma clave y formato comparten el trabajo (y el
+    archivo) mientras este siga en exports/.
+    """
+
+    def __init__(self, hilos=HILOS_EXPORTACION, directorio=DIRECTORIO_EXPORTS, edad_maxima=EDAD_MAXIMA_EXPORTS):
+        self.directorio = directorio
+        self.edad_maxima = edad_maxima
+        self._pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='dataviz-exportacion')
+        self._trabajos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def solicitar(self, clave, obtener, nombre, formato, indice=True):
+        """Future con la ruta del archivo exportado
+
+        `obtener` es una función que entrega el DataFrame; se ejecuta en el
+        hilo de fondo, por lo que un filtro costoso tampoco bloquea el rerun.
+        Con copy-on-write, los cambios que la sesión haga después sobre vistas
+        del mismo DataFrame quedan en una copia propia y no alteran los
+        bloques que se están escribiendo.
+        """
+        with self._lock:
+            futuro = self._trabajos.get((clave, formato))
+            if futuro is not None and self._vigente(futuro):
+                self._trabajos.move_to_end((clave, formato))
+                return futuro
+
+            futuro = self._pool.submit(self._exportar, obtener, nombre, formato, indice)
+            self._trabajos[(clave, formato)] = futuro
+            while len(self._trabajos) > MAXIMO_TRABAJOS:
+                _, descartado = self._trabajos.popitem(last=False)
+                descartado.add_done_callback(self._eliminar_archivo)
+            vigentes = {trabajo.result() for trabajo in self._trabajos.values()
+                        if trabajo.done() and trabajo.exception() is None}
+        self._limpiar_antiguos(vigentes)
+        return futuro
+
+    @staticmethod
+    def _vigente(futuro):
+        """Un trabajo en curso, o terminado cuyo archivo todavía existe"""
+        if not futuro.done():
+            return True
+        return futuro.exception() is None and os.path.exists(futuro.result())
+
+    def _exportar(self, obtener, nombre, formato, indice):
+        return exportar(obtener(), nombre, formato, self.directorio, indice=indice)
+
+    @staticmethod
+    def _eliminar_archivo(futuro):
+        """Borra el archivo de un trabajo que ya no se recuerda (al terminar, si seguía en curso)"""
+        if futuro.exception() is None:
+            try:
+                os.remove(futuro.result())
+            except OSError:
+                pass
+
+    def _limpiar_antiguos(self, vigentes):
+        """Borra las exportaciones de más de `edad_maxima` horas que ningún trabajo recuerda"""
+        limite = time.time() - self.edad_maxima * 3600
+        try:
+            entradas = list(os.scandir(self.directorio))
+        except FileNotFoundError:
+            return
+        for entrada in entradas:
+            if (entrada.is_file() and PATRON_ARCHIVO.search(entrada.name)
+                    and entrada.path not in vigentes and entrada.stat().st_mtime < limite):
+                try:
+                    os.remove(entrada.path)
+                except OSError:
+                    pass
+
+
+# Instancia compartida por todas las sesiones del proceso
+exportador = Exportador()
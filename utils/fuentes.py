@@ -0,0 +1,317 @@
+"""
+Acceso a las APIs públicas de datos (mindicador.cl y Gael Cloud)
+"""
+
+import logging
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from utils.cache_compartido import cache
+from utils.cliente_http import cliente
+from utils.concurrencia import SingleFlight, obtener_en_paralelo
+from utils.data_processing import normalizar_serie, normalizar_sismos
+from utils.metricas import CACHE, OBTENCION, TRANSFORMACION
+from utils.resumen import ResumenSerie
+from utils.historial_sismos import historial
+
+logger = logging.getLogger(__name__)
+
+# Se pueden apuntar a otro servidor (p. ej. utils/servidor_simulado.py)
+URL_MINDICADOR = os.environ.get('MINDICADOR_API_URL', 'https://mindicador.cl/api').rstrip('/')
+URL_SISMOS = os.environ.get('SISMOS_API_URL', 'https://api.gael.cloud/general/public/sismos')
+
+# Timeouts por fuente (segundos)
+TIMEOUT_INDICADORES = 10
+TIMEOUT_SISMOS = 15
+
+# Vigencia de la cache compartida (segundos)
+TTL_CACHE = int(os.environ.get('CACHE_TTL', 3600))
+
+# Consultas concurrentes a la misma serie comparten una sola descarga
+vuelos = SingleFlight('fuentes')
+
+
+def descargar_indicador(indicador, año='2024', timeout=TIMEOUT_INDICADORES):
+    """Descarga la serie de un indicador desde mindicador.cl (lanza la excepción si falla)"""
+    data = cliente.get_json(f'{URL_MINDICADOR}/{indicador}/{año}', timeout=timeout)
+
+    if "serie" in data and data["serie"]:
+        with TRANSFORMACION.medir(etapa='normalizar_serie'):
+            return normalizar_serie(data["serie"]), data.get("nombre", indicador)
+    else:
+        return None, None
+
+
+def descargar_ultimos_valores(indicador, timeout=TIMEOUT_INDICADORES):
+    """Descarga los valores más recientes de un indicador (último mes en series diarias)"""
+    data = cliente.get_json(f'{URL_MINDICADOR}/{indicador}', timeout=timeout)
+
+    if "serie" in data and data["serie"]:
+        with TRANSFORMACION.medir(etapa='normalizar_serie'):
+            return normalizar_serie(data["serie"])
+    else:
+        return None
+
+
+def es_periodo_cerrado(año):
+    """Indica si el año ya terminó, en cuyo caso su serie no vuelve a cambiar"""
+    return int(año) < datetime.now().year
+
+
+def descargar_sismos(timeout=TIMEOUT_SISMOS):
+    """Descarga los sismos desde la API de Gael Cloud (lanza la excepción si falla)"""
+    data = cliente.get_json(URL_SISMOS, timeout=timeout)
+
+    if data and isinstance(data, list):
+        with TRANSFORMACION.medir(etapa='normalizar_sismos'):
+            return normalizar_sismos(data)
+    else:
+        return pd.DataFrame()
+
+
+def _guardar_en_cache(clave, df, **metadatos):
+    """Guarda en la cache compartida sin interrumpir la consulta si falla la escritura"""
+    try:
+        cache.guardar(clave, df, **metadatos)
+    except Exception:
+        # Disco lleno, sin permisos o Redis caído: la consulta sigue, pero queda registrado
+        logger.warning("No se pudo guardar %s en la cache compartida", clave, exc_info=True)
+
+
+def _actualizar_incremental(df, resumen, indicador, año):
+    """Agrega a una serie del año en curso solo los días posteriores a su última fecha
+
+    El resumen se actualiza con las mismas observaciones nuevas. Retorna
+    (None, None) si los valores recientes no alcanzan a cubrir el hueco desde
+    la última fecha guardada, en cuyo caso hay que descargar el año completo.
+    """
+    recientes = descargar_ultimos_valores(indicador)
+    if recientes is None:
+        return df, resumen
+
+    ultima_fecha = df.index[-1]
+    if recientes.index[0] > ultima_fecha:
+        return None, None
+
+    nuevos = recientes[(recientes.index > ultima_fecha) & (recientes.index.year == int(año))]
+    if nuevos.empty:
+        return df, resumen
+    return pd.concat([df, nuevos]), resumen.agregar(nuevos["valor"].to_numpy())
+
+
+def obtener_indicador(indicador, año='2024', ttl=TTL_CACHE):
+    """Obtiene un indicador desde la cache compartida o, si no está vigente, desde mindicador.cl
+
+    Los años cerrados se guardan sin vencimiento. El año en curso se refresca
+    de forma incremental a partir de la última fecha guardada.
+    """
+    with OBTENCION.medir(fuente='mindicador'):
+        return vuelos.ejecutar(('mindicador', indicador, str(año)),
+                               lambda: _obtener_indicador(indicador, año, ttl))
+
+
+def _leer_resumen(meta, df):
+    """Resumen guardado en los metadatos, o calculado si falta o no corresponde a la serie"""
+    if meta and 'resumen' in meta and meta['resumen']['cantidad'] == len(df):
+        return ResumenSerie.desde_dict(meta['resumen'])
+    return ResumenSerie.desde_valores(df["valor"].to_numpy())
+
+
+def _indicador_vigente(df, meta, ttl):
+    """Una copia vigente (o de un año que ya estaba cerrado al guardarla) se entrega tal cual"""
+    return df is not None and (meta.get('periodo_cerrado') or cache.esta_fresca(meta, ttl))
+
+
+def _obtener_indicador(indicador, año, ttl):
+    clave = ('mindicador', indicador, str(año))
+
+    df, meta = cache.leer(clave)
+    if _indicador_vigente(df, meta, ttl):
+        CACHE.incrementar(cache='disco', resultado='acierto')
+        return df, meta.get('nombre', indicador)
+
+    # Solo un proceso descarga cada entrada; los demás esperan y la leen de la cache
+    with cache.bloqueo(clave):
+        df, meta = cache.leer(clave)
+        if _indicador_vigente(df, meta, ttl):
+            CACHE.incrementar(cache='disco', resultado='acierto')
+            return df, meta.get('nombre', indicador)
+        CACHE.incrementar(cache='disco', resultado='fallo')
+        return _refrescar_indicador(clave, df, meta, indicador, año)
+
+
+def _refrescar_indicador(clave, df, meta, indicador, año):
+    try:
+        nombre = meta.get('nombre', indicador) if meta else None
+        actualizado, resumen = None, None
+        if df is not None:
+            actualizado, resumen = _actualizar_incremental(df, _leer_resumen(meta, df), indicador, año)
+        if actualizado is None:
+            actualizado, nombre = descargar_indicador(indicador, año)
+    except Exception:
+        # Sin conexión: se usa la última copia guardada aunque esté vencida
+        if df is None:
+            raise
+        return df, nombre
+
+    if actualizado is not None:
+        if resumen is None:
+            resumen = ResumenSerie.desde_valores(actualizado["valor"].to_numpy())
+        _guardar_en_cache(clave, actualizado, nombre=nombre, url=f'{URL_MINDICADOR}/{indicador}/{año}',
+                          periodo_cerrado=es_periodo_cerrado(año), resumen=resumen.a_dict())
+    return actualizado, nombre
+
+
+def obtener_indicador_con_resumen(indicador, año='2024', ttl=TTL_CACHE):
+    """(df, nombre, resumen) de un indicador para un año
+
+    El resumen precalculado corresponde siempre a la serie entregada (si los
+    metadatos son de otra versión se calcula sobre ella); es None si no hay datos.
+    """
+    df, nombre = obtener_indicador(indicador, año, ttl=ttl)
+    if df is None or df.empty:
+        return df, nombre, None
+    return df, nombre, _leer_resumen(cache.leer_metadatos(('mindicador', indicador, str(año))), df)
+
+
+def obtener_resumen(indicador, año='2024'):
+    """Resumen estadístico precalculado de un indicador para un año (None si no hay datos)"""
+    return obtener_indicador_con_resumen(indicador, año)[2]
+
+
+def obtener_sismos(ttl=TTL_CACHE):
+    """Obtiene los sismos desde la cache compartida o, si no está vigente, desde Gael Cloud"""
+    with OBTENCION.medir(fuente='sismos'):
+        return vuelos.ejecutar(('sismos', 'gael'), lambda: _obtener_sismos(ttl))
+
+
+def _obtener_sismos(ttl):
+    clave = ('sismos', 'gael')
+    df, _ = cache.leer(clave, ttl)
+    if df is not None:
+        CACHE.incrementar(cache='disco', resultado='acierto')
+        return df
+
+    # Solo un proceso descarga; los demás esperan y leen su resultado de la cache
+    with cache.bloqueo(clave):
+        df, _ = cache.leer(clave, ttl)
+        if df is not None:
+            CACHE.incrementar(cache='disco', resultado='acierto')
+            return df
+        CACHE.incrementar(cache='disco', resultado='fallo')
+
+        try:
+            df = descargar_sismos()
+        except Exception:
+            # Sin conexión: se usa la última copia guardada aunque esté vencida
+            df, _ = cache.leer(clave)
+            if df is None:
+                raise
+            return df
+
+        if not df.empty:
+            _guardar_en_cache(clave, df, url=URL_SISMOS)
+
+    if not df.empty:
+        # Cada descarga se agrega al historial persistente (solo los eventos nuevos)
+        try:
+            historial.ingerir(df)
+        except Exception:
+            # El historial es un extra: la consulta sigue con los datos descargados
+            logger.warning("No se pudieron agregar los sismos al historial", exc_info=True)
+    return df
+
+
+def obtener_lote(pares, incluir_sismos=True, funcion_indicador=None, funcion_sismos=None):
+    """Obtiene varios indicadores y los sismos en paralelo
+
+    `pares` es una lista de tuplas (indicador, año). Genera tuplas
+    (clave, resultado, error) a medida que cada fuente termina, donde la clave
+    es el par (indicador, año) o 'sismos'. Cada fuente tiene su propio timeout,
+    por lo que la latencia total queda dada por la fuente más lenta.
+    """
+    funcion_indicador = funcion_indicador or obtener_indicador
+    funcion_sismos = funcion_sismos or obtener_sismos
+
+    tareas = {}
+    timeouts = {}
+    for indicador, año in pares:
+        tareas[(indicador, año)] = lambda i=indicador, a=año: funcion_indicador(i, a)
+        timeouts[(indicador, año)] = TIMEOUT_INDICADORES
+    if incluir_sismos:
+        tareas['sismos'] = funcion_sismos
+        timeouts['sismos'] = TIMEOUT_SISMOS
+
+    return obtener_en_paralelo(tareas, timeouts)
+
+
+def _serie_de_rango(partes, inicio, fin):
+    """Concatena (una sola vez) las series anuales en orden y las recorta al rango pedido"""
+    if not partes:
+        return None
+
+    # Los años se concatenan en orden cronológico, por lo que solo hace falta
+    # ordenar si las series se traslapan
+    serie = pd.concat([partes[año]["valor"] for año in sorted(partes)])
+    if not serie.index.is_monotonic_increasing:
+        serie = serie.sort_index()
+    if serie.index.has_duplicates:
+        serie = serie[~serie.index.duplicated(keep='last')]
+
+    # Los límites se comparan en la misma zona horaria que las fechas de la API
+    if serie.index.tz is not None:
+        inicio = inicio.tz_localize(serie.index.tz) if inicio.tzinfo is None else inicio
+        fin = fin.tz_localize(serie.index.tz) if fin.tzinfo is None else fin
+    fin = fin + pd.Timedelta(days=1) - pd.Timedelta(1)  # incluye el día final completo
+    return serie.loc[inicio:fin]
+
+
+def obtener_rangos_indicadores(indicadores, inicio, fin, faltantes=None):
+    """Obtiene varios indicadores entre dos fechas, todos los años en paralelo
+
+    Retorna un diccionario {indicador: (serie, nombre)}; la serie tiene un
+    DatetimeIndex llamado 'fecha' y es None si no hay datos en el rango.
+
+    Un año que no se pudo obtener queda fuera de la serie (como datos
+    faltantes) sin descartar los demás; si se entrega la lista `faltantes`, se
+    le agregan las tuplas (indicador, año, error). Solo si fallan todos los
+    años se lanza el primer error.
+    """
+    inicio, fin = pd.Timestamp(inicio), pd.Timestamp(fin)
+    años = [str(año) for año in range(inicio.year, fin.year + 1)]
+    pares = [(indicador, año) for indicador in indicadores for año in años]
+
+    partes = {indicador: {} for indicador in indicadores}
+    nombres = {}
+    errores = []
+    for (indicador, año), resultado, error in obtener_lote(pares, incluir_sismos=False):
+        if error is not None:
+            errores.append((indicador, año, error))
+            continue
+        df, nombre = resultado
+        if df is not None and not df.empty:
+            partes[indicador][año] = df
+            nombres.setdefault(indicador, nombre)
+
+    if errores and len(errores) == len(pares):
+        raise errores[0][2]
+    if faltantes is not None:
+        faltantes.extend(sorted(errores, key=lambda e: (e[0], e[1])))
+
+    return {indicador: (_serie_de_rango(partes[indicador], inicio, fin), nombres.get(indicador))
+            for indicador in indicadores}
+
+
+def obtener_rango_indicador(indicador, inicio, fin):
+    """Obtiene un indicador entre dos fechas como una sola serie indexada por fecha
+
+    Los años involucrados se consultan en paralelo (cada uno pasa por la cache)
+    y se concatenan una única vez. Retorna (serie, nombre), donde la serie tiene
+    un DatetimeIndex llamado 'fecha', o (None, None) si no hay datos.
+    """
+    serie, nombre = obtener_rangos_indicadores([indicador], inicio, fin)[indicador]
+    if serie is None:
+        return None, None
+    return serie, nombre
@@ -0,0 +1,188 @@
+"""
+Historial persistente de sismos, de solo agregado y particionado por mes
+
+Cada descarga del feed de Gael Cloud se incorpora al historial en
+data/sismos/mes=AAAA-MM/. Los eventos se identifican por una clave estable
+(fecha, coordenadas y magnitud) y solo se escriben los que no estaban; cada
+ingesta agrega un archivo nuevo a la partición, sin reescribir los
+anteriores. Cuando una partición junta más de MAXIMO_PARTES archivos, o su mes
+ya terminó, sus partes se compactan en un solo archivo ordenado por fecha, de
+modo que ingerir y leer no se vuelven más lentos con cada descarga. Las
+lecturas por rango de fechas abren solo las particiones de los meses
+involucrados.
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.almacen_sismos import COLUMNAS_CLAVE
+from utils.cache_disco import DIRECTORIO_DATOS
+
+DIRECTORIO_HISTORIAL = os.path.join(DIRECTORIO_DATOS, 'sismos')
+
+# Partición para los eventos sin fecha válida
+MES_DESCONOCIDO = 'desconocido'
+
+# Archivos que puede acumular la partición del mes en curso antes de compactarla
+MAXIMO_PARTES = 16
+
+
+def id_evento(df):
+    """Identificador estable de cada evento a partir de su clave"""
+    clave = [columna for columna in COLUMNAS_CLAVE if columna in df.columns]
+    return pd.util.hash_pandas_object(df[clave], index=False).to_numpy()
+
+
+class HistorialSismos:
+    """Almacén en disco de todos los sismos observados, sin duplicados"""
+
+    def __init__(self, directorio=DIRECTORIO_HISTORIAL):
+        self.directorio = directorio
+        self._lock = threading.Lock()
+
+    def _ruta_mes(self, mes):
+        return os.path.join(self.directorio, f'mes={mes}')
+
+    def meses(self):
+        """Particiones existentes ('AAAA-MM'), en orden"""
+        if not os.path.isdir(self.directorio):
+            return []
+        return sorted(nombre.split('=', 1)[1] for nombre in os.listdir(self.directorio) if nombre.startswith('mes='))
+
+    def _archivos(self, mes):
+        ruta = self._ruta_mes(mes)
+        if not os.path.isdir(ruta):
+            return []
+        return sorted(os.path.join(ruta, nombre) for nombre in os.listdir(ruta) if nombre.endswith('.parquet'))
+
+    def _leer_particion(self, mes, columnas=None):
+        """DataFrames de los archivos de una partición
+
+        Si otro proceso la compacta mientras se lee, se vuelve a listar: el
+        archivo compactado ya contiene las partes que se eliminaron.
+        """
+        for intento in range(2):
+            try:
+                return [pd.read_parquet(archivo, columns=columnas) for archivo in self._archivos(mes)]
+            except FileNotFoundError:
+                if intento:
+                    raise
+
+    def _ids_existentes(self, mes):
+        """Identificadores ya guardados en una partición (lee solo esa columna)"""
+        partes = self._leer_particion(mes, columnas=['id_evento'])
+        if not partes:
+            return np.empty(0, dtype=np.uint64)
+        return np.concatenate([parte['id_evento'].to_numpy() for parte in partes])
+
+    def _escribir(self, mes, df, prefijo):
+        """Escribe un archivo nuevo en la partición (escritura atómica) y retorna su ruta"""
+        ruta = self._ruta_mes(mes)
+        os.makedirs(ruta, exist_ok=True)
+        nombre = f'{prefijo}-{time.time_ns()}-{os.getpid()}'
+        temporal = os.path.join(ruta, nombre + '.tmp')
+        df.to_parquet(temporal, index=False)
+        destino = os.path.join(ruta, nombre + '.parquet')
+        os.replace(temporal, destino)
+        return destino
+
+    def compactar(self, mes):
+        """Reúne las partes de una partición en un solo archivo ordenado por fecha
+
+        El archivo compactado se publica antes de borrar las partes, así que
+        una lectura concurrente nunca pierde eventos (a lo sumo los ve dos
+        veces, y leer_rango descarta los repetidos). Retorna cuántas partes se
+        reunieron.
+        """
+        archivos = self._archivos(mes)
+        if len(archivos) < 2:
+            return 0
+        df = pd.concat([pd.read_parquet(archivo) for archivo in archivos], ignore_index=True)
+        df = df.drop_duplicates(subset='id_evento')
+        if 'Fecha' in df.columns:
+            df = df.sort_values('Fecha', kind='stable')
+        self._escribir(mes, df, 'compacto')
+        for archivo in archivos:
+            try:
+                os.remove(archivo)
+            except FileNotFoundError:
+                pass
+        return len(archivos)
+
+    def _compactar_pendientes(self):
+        """Compacta las particiones con demasiadas partes y las de meses ya terminados"""
+        mes_actual = pd.Timestamp.now().strftime('%Y-%m')
+        for mes in self.meses():
+            cantidad = len(self._archivos(mes))
+            cerrado = mes != MES_DESCONOCIDO and mes < mes_actual
+            if cantidad > MAXIMO_PARTES or (cerrado and cantidad > 1):
+                self.compactar(mes)
+
+    def ingerir(self, df):
+        """Agrega al historial los eventos nuevos de `df`; retorna cuántos se escribieron"""
+        if df is None or df.empty:
+            return 0
+
+        df = df.assign(id_evento=id_evento(df)).drop_duplicates(subset='id_evento')
+        # Las columnas de texto se guardan como string para que las partes sean concatenables
+        for columna in df.columns:
+            if isinstance(df[columna].dtype, pd.CategoricalDtype):
+                df[columna] = df[columna].astype('string[pyarrow]')
+
+        meses = df['Fecha'].dt.strftime('%Y-%m').fillna(MES_DESCONOCIDO) if 'Fecha' in df.columns \
+            else pd.Series(MES_DESCONOCIDO, index=df.index)
+
+        escritos = 0
+        with self._lock:
+            for mes, grupo in df.groupby(meses, sort=True):
+                nuevos = grupo[~np.isin(grupo['id_evento'].to_numpy(), self._ids_existentes(mes))]
+                if nuevos.empty:
+                    continue
+                self._escribir(mes, nuevos, 'parte')
+                escritos += len(nuevos)
+            self._compactar_pendientes()
+        return escritos
+
+    def leer_rango(self, desde=None, hasta=None, columnas=None):
+        """Eventos con Fecha entre `desde` y `hasta` (incluidos), ordenados por fecha"""
+        desde = pd.Timestamp(desde) if desde is not None else None
+        hasta = pd.Timestamp(hasta) if hasta is not None else None
+        mes_desde = desde.strftime('%Y-%m') if desde is not None else None
+        mes_hasta = hasta.strftime('%Y-%m') if hasta is not None else None
+
+        partes = []
+        for mes in self.meses():
+            if mes == MES_DESCONOCIDO:
+                if desde is None and hasta is None:
+                    partes.extend(self._leer_particion(mes, columnas))
+                continue
+            if (mes_desde and mes < mes_desde) or (mes_hasta and mes > mes_hasta):
+                continue
+            partes.extend(self._leer_particion(mes, columnas))
+
+        if not partes:
+            return pd.DataFrame()
+
+        df = pd.concat(partes, ignore_index=True)
+        # Dos procesos pueden haber escrito el mismo evento a la vez
+        if 'id_evento' in df.columns:
+            df = df.drop_duplicates(subset='id_evento')
+        if 'Fecha' in df.columns:
+            if desde is not None:
+                df = df[df['Fecha'] >= desde]
+            if hasta is not None:
+                df = df[df['Fecha'] <= hasta]
+            df = df.sort_values('Fecha', kind='stable')
+        return df.reset_index(drop=True)
+
+    def contar_rango(self, desde=None, hasta=None):
+        """Cantidad de eventos entre dos fechas (lee solo la columna Fecha)"""
+        return len(self.leer_rango(desde, hasta, columnas=['Fecha', 'id_evento']))
+
+
+# Instancia compartida del proceso
+historial = HistorialSismos()
@@ -0,0 +1,225 @@
+"""
+Métricas de la aplicación en formato de texto de Prometheus
+
+Contadores e histogramas con etiquetas, seguros entre hilos y sin
+dependencias externas. Las rutas críticas (descargas, caches,
+transformaciones, figuras y cada rerun) registran sus tiempos y resultados en
+las métricas definidas al final del módulo; `iniciar_servidor` las expone en
+http://127.0.0.1:<puerto>/metrics.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Límites (segundos) de los histogramas de duración
+BUCKETS_DURACION = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PREFIJO = 'dataviz_'
+
+
+def _formatear_etiquetas(etiquetas, extra=()):
+    pares = list(etiquetas) + list(extra)
+    if not pares:
+        return ''
+    texto = ','.join(f'{nombre}="{_escapar(valor)}"' for nombre, valor in pares)
+    return '{' + texto + '}'
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _formatear_numero(valor):
+    if math.isinf(valor):
+        return '+Inf' if valor > 0 else '-Inf'
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+class Contador:
+    """Valor acumulado por combinación de etiquetas"""
+
+    tipo = 'counter'
+
+    def __init__(self, nombre, ayuda):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def incrementar(self, valor=1, **etiquetas):
+        clave = tuple(sorted(etiquetas.items()))
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0) + valor
+
+    def valores(self):
+        """{etiquetas: valor}, con las etiquetas como tupla de pares ordenados"""
+        with self._lock:
+            return dict(self._valores)
+
+    def exportar(self):
+        lineas = []
+        for etiquetas, valor in sorted(self.valores().items()):
+            lineas.append(f'{self.nombre}{_formatear_etiquetas(etiquetas)} {_formatear_numero(valor)}')
+        return lineas
+
+
+class Histograma:
+    """Distribución de observaciones (p. ej. duraciones) por combinación de etiquetas"""
+
+    tipo = 'histogram'
+
+    def __init__(self, nombre, ayuda, buckets=BUCKETS_DURACION):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observar(self, valor, **etiquetas):
+        clave = tuple(sorted(etiquetas.items()))
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = {'cuentas': [0] * len(self.buckets), 'suma': 0.0, 'cantidad': 0}
+            for posicion, limite in enumerate(self.buckets):
+                if valor <= limite:
+                    serie['cuentas'][posicion] += 1
+                    break
+            serie['suma'] += valor
+            serie['cantidad'] += 1
+
+    @contextmanager
+    def medir(self, **etiquetas):
+        """Registra la duración del bloque (también si lanza una excepción)
+
+        También sirve como decorador: cada llamada a la función se mide por separado.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(time.perf_counter() - inicio, **etiquetas)
+
+    def valores(self):
+        """{etiquetas: {'cuentas', 'suma', 'cantidad'}} (cuentas por bucket, no acumuladas)"""
+        with self._lock:
+            return {clave: dict(serie, cuentas=list(serie['cuentas'])) for clave, serie in self._series.items()}
+
+    def exportar(self):
+        lineas = []
+        for etiquetas, serie in sorted(self.valores().items()):
+            acumulado = 0
+            for limite, cuenta in zip(self.buckets, serie['cuentas']):
+                acumulado += cuenta
+                lineas.append(f'{self.nombre}_bucket{_formatear_etiquetas(etiquetas, [("le", _formatear_numero(limite))])} {acumulado}')
+            lineas.append(f'{self.nombre}_bucket{_formatear_etiquetas(etiquetas, [("le", "+Inf")])} {serie["cantidad"]}')
+            lineas.append(f'{self.nombre}_sum{_formatear_etiquetas(etiquetas)} {_formatear_numero(serie["suma"])}')
+            lineas.append(f'{self.nombre}_count{_formatear_etiquetas(etiquetas)} {serie["cantidad"]}')
+        return lineas
+
+
+class Registro:
+    """Conjunto de métricas del proceso"""
+
+    def __init__(self):
+        self._metricas = {}
+        self._lock = threading.Lock()
+
+    def _registrar(self, clase, nombre, ayuda, **argumentos):
+        nombre = PREFIJO + nombre
+        with self._lock:
+            if nombre not in self._metricas:
+                self._metricas[nombre] = clase(nombre, ayuda, **argumentos)
+            return self._metricas[nombre]
+
+    def contador(self, nombre, ayuda):
+        return self._registrar(Contador, nombre, ayuda)
+
+    def histograma(self, nombre, ayuda, buckets=BUCKETS_DURACION):
+        return self._registrar(Histograma, nombre, ayuda, buckets=buckets)
+
+    def exportar(self):
+        """Todas las métricas en el formato de texto de Prometheus"""
+        with self._lock:
+            metricas = list(self._metricas.values())
+        lineas = []
+        for metrica in metricas:
+            lineas.append(f'# HELP {metrica.nombre} {metrica.ayuda}')
+            lineas.append(f'# TYPE {metrica.nombre} {metrica.tipo}')
+            lineas.extend(metrica.exportar())
+        return '\n'.join(lineas) + '\n'
+
+
+def proporcion_aciertos(cache):
+    """Aciertos / consultas de una cache según el contador CACHE (None si no hubo consultas)"""
+    aciertos = fallos = 0
+    for etiquetas, valor in CACHE.valores().items():
+        etiquetas = dict(etiquetas)
+        if etiquetas.get('cache') == cache:
+            if etiquetas.get('resultado') == 'acierto':
+                aciertos += valor
+            else:
+                fallos += valor
+    return aciertos / (aciertos + fallos) if aciertos + fallos else None
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        cuerpo = self.server.registro.exportar().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def iniciar_servidor(puerto, host='127.0.0.1', registro=None):
+    """Expone las métricas en http://host:puerto/metrics desde un hilo daemon
+
+    Retorna el servidor, o None si el puerto no está disponible (p. ej. otro
+    proceso de la aplicación ya lo usa).
+    """
+    try:
+        servidor = ThreadingHTTPServer((host, puerto), _ManejadorMetricas)
+    except OSError as e:
+        logger.warning("No se pudo exponer las métricas en %s:%s: %s", host, puerto, e)
+        return None
+    servidor.daemon_threads = True
+    servidor.registro = registro or metricas
+    threading.Thread(target=servidor.serve_forever, name='dataviz-metricas', daemon=True).start()
+    return servidor
+
+
+# Registro compartido por todo el proceso
+metricas = Registro()
+
+SOLICITUDES_HTTP = metricas.contador(
+    'solicitudes_http_total', 'Solicitudes a las APIs por host y resultado (código HTTP, error o rechazada)')
+LATENCIA_HTTP = metricas.histograma(
+    'latencia_http_segundos', 'Latencia de cada intento de solicitud a las APIs por host')
+CACHE = metricas.contador(
+    'cache_consultas_total', 'Consultas a las caches por cache y resultado (acierto/fallo)')
+OBTENCION = metricas.histograma(
+    'obtencion_segundos', 'Duración de la obtención de datos por fuente (incluye cache y descarga)')
+TRANSFORMACION = metricas.histograma(
+    'transformacion_segundos', 'Duración de las transformaciones de DataFrames por etapa')
+FIGURAS = metricas.histograma(
+    'figura_segundos', 'Duración de la construcción de figuras Plotly por tipo')
+RERUN = metricas.histograma(
+    'rerun_segundos', 'Duración de cada ejecución de Streamlit por sección y fragmento (script = ejecución completa)')
+ERRORES = metricas.contador(
+    'errores_total', 'Errores mostrados a los usuarios por origen')
+SINGLEFLIGHT = metricas.contador(
+    'singleflight_total', 'Consultas por grupo y resultado (emitida a la API o agrupada con una en curso)')
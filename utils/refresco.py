@@ -0,0 +1,94 @@
+"""
+Refresco en segundo plano de las fuentes más consultadas (stale-while-revalidate)
+
+Un hilo daemon por proceso vuelve a consultar cada clave registrada antes de
+que venza su cache y conserva el último valor bueno, de modo que las páginas
+nunca esperan una llamada a la red para estas claves.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RefrescadorFondo:
+    """Mantiene el último valor bueno de cada clave y lo refresca periódicamente"""
+
+    def __init__(self):
+        self._tareas = {}
+        self._valores = {}
+        self._lock = threading.Lock()
+        self._despertar = threading.Event()
+        self._hilo = None
+
+    def registrar(self, clave, funcion, intervalo):
+        """Registra una clave que se refrescará cada `intervalo` segundos llamando a `funcion()`"""
+        with self._lock:
+            self._tareas[clave] = {'funcion': funcion, 'intervalo': intervalo, 'proximo': 0.0}
+        self._despertar.set()
+
+    def quitar(self, clave):
+        """Deja de refrescar una clave y descarta su último valor"""
+        with self._lock:
+            self._tareas.pop(clave, None)
+            self._valores.pop(clave, None)
+
+    def claves(self):
+        """Claves registradas"""
+        with self._lock:
+            return list(self._tareas)
+
+    def iniciar(self):
+        """Inicia el hilo de refresco (no hace nada si ya está corriendo)"""
+        with self._lock:
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._ciclo, name='dataviz-refresco', daemon=True)
+                self._hilo.start()
+
+    def obtener(self, clave):
+        """Retorna (valor, edad en segundos) del último refresco exitoso, o (None, None)"""
+        with self._lock:
+            if clave not in self._valores:
+                return None, None
+            valor, obtenido_en = self._valores[clave]
+        return valor, time.time() - obtenido_en
+
+    def _refrescar(self, clave, tarea):
+        try:
+            valor = tarea['funcion']()
+        except Exception:
+            # Se sigue sirviendo el último valor bueno
+            logger.warning("No se pudo refrescar %s", clave, exc_info=True)
+            return
+        with self._lock:
+            self._valores[clave] = (valor, time.time())
+
+    def _ciclo(self):
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                vencidas = [(clave, tarea) for clave, tarea in self._tareas.items() if tarea['proximo'] <= ahora]
+                for _, tarea in vencidas:
+                    tarea['proximo'] = ahora + tarea['intervalo']
+
+            for clave, tarea in vencidas:
+                self._refrescar(clave, tarea)
+
+            with self._lock:
+                proximo = min((tarea['proximo'] for tarea in self._tareas.values()), default=None)
+            espera = None if proximo is None else max(0.0, proximo - time.monotonic())
+            self._despertar.wait(espera)
+            self._despertar.clear()
+
+
+def formatear_edad(segundos):
+    """Texto legible para la antigüedad de un dato"""
+    if segundos is None:
+        return "recién obtenido"
+    if segundos < 60:
+        return "hace menos de 1 min"
+    if segundos < 3600:
+        return f"hace {segundos / 60:.0f} min"
+    return f"hace {segundos / 3600:.1f} h"
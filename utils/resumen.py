@@ -0,0 +1,154 @@
+"""
+Resumen estadístico incremental de una serie
+
+Guarda lo necesario para responder en O(1) las métricas que muestra la
+aplicación (cantidad, media, desviación, mínimo, máximo, primer y último
+valor, variación del período y cuartiles) y se actualiza al agregar nuevas
+observaciones sin volver a recorrer la serie completa.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Elementos por nivel del sketch de cuantiles; con hasta esta cantidad de
+# observaciones los cuantiles son exactos
+CAPACIDAD_SKETCH = 256
+
+
+class SketchCuantiles:
+    """Sketch compacto de cuantiles (estilo KLL)
+
+    Cada nivel k guarda elementos de peso 2^k. Cuando un nivel se llena, se
+    ordena y la mitad de sus elementos (alternados) sube al nivel siguiente.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_SKETCH, niveles=None):
+        self.capacidad = capacidad
+        self.niveles = niveles if niveles is not None else [[]]
+
+    def agregar(self, valores):
+        self.niveles[0].extend(float(v) for v in valores)
+        self._compactar()
+
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveles):
+            if len(self.niveles[nivel]) > self.capacidad:
+                elementos = sorted(self.niveles[nivel])
+                # Con un número impar, el último elemento se queda en el nivel
+                sobrante = elementos.pop() if len(elementos) % 2 else None
+                if nivel + 1 == len(self.niveles):
+                    self.niveles.append([])
+                self.niveles[nivel + 1].extend(elementos[nivel % 2::2])
+                self.niveles[nivel] = [] if sobrante is None else [sobrante]
+            nivel += 1
+
+    def cuantil(self, q):
+        """Cuantil aproximado (exacto, con interpolación lineal, mientras no haya compactación)"""
+        if len(self.niveles) == 1:
+            return float(np.quantile(self.niveles[0], q)) if self.niveles[0] else float('nan')
+
+        valores = np.concatenate([np.asarray(elementos, dtype=np.float64) for elementos in self.niveles])
+        pesos = np.concatenate([np.full(len(elementos), 2.0 ** k) for k, elementos in enumerate(self.niveles)])
+        orden = np.argsort(valores)
+        acumulado = np.cumsum(pesos[orden])
+        posicion = np.searchsorted(acumulado, q * acumulado[-1])
+        return float(valores[orden][min(posicion, len(valores) - 1)])
+
+
+class ResumenSerie:
+    """Estadísticas de una serie ordenada en el tiempo, actualizables incrementalmente
+
+    La varianza se mantiene con el algoritmo de Chan/Welford (suma de
+    cuadrados de las desviaciones), que es numéricamente estable.
+    """
+
+    def __init__(self):
+        self.cantidad = 0
+        self.suma = 0.0
+        self.m2 = 0.0
+        self.minimo = float('nan')
+        self.maximo = float('nan')
+        self.primero = float('nan')
+        self.ultimo = float('nan')
+        self.sketch = SketchCuantiles()
+
+    @classmethod
+    def desde_valores(cls, valores):
+        resumen = cls()
+        resumen.agregar(valores)
+        return resumen
+
+    def agregar(self, valores):
+        """Agrega nuevas observaciones (posteriores a las ya resumidas)"""
+        valores = np.asarray(valores, dtype=np.float64)
+        valores = valores[~np.isnan(valores)]
+        if len(valores) == 0:
+            return self
+
+        # Combinación de (cantidad, media, m2) del bloque nuevo con la acumulada
+        n_nuevo = len(valores)
+        media_nueva = valores.mean()
+        m2_nuevo = float(((valores - media_nueva) ** 2).sum())
+        if self.cantidad:
+            delta = media_nueva - self.media
+            total = self.cantidad + n_nuevo
+            self.m2 += m2_nuevo + delta ** 2 * self.cantidad * n_nuevo / total
+        else:
+            self.m2 = m2_nuevo
+            self.primero = float(valores[0])
+            self.minimo, self.maximo = float('inf'), float('-inf')
+
+        self.cantidad += n_nuevo
+        self.suma += float(valores.sum())
+        self.minimo = min(self.minimo, float(valores.min()))
+        self.maximo = max(self.maximo, float(valores.max()))
+        self.ultimo = float(valores[-1])
+        self.sketch.agregar(valores)
+        return self
+
+    @property
+    def media(self):
+        return self.suma / self.cantidad if self.cantidad else float('nan')
+
+    @property
+    def desviacion(self):
+        """Desviación estándar muestral (ddof=1, igual que pandas)"""
+        return (self.m2 / (self.cantidad - 1)) ** 0.5 if self.cantidad > 1 else float('nan')
+
+    @property
+    def variacion_porcentual(self):
+        """Variación entre el primer y el último valor del período"""
+        return (self.ultimo - self.primero) / self.primero * 100 if self.primero else float('nan')
+
+    def cuantil(self, q):
+        return self.sketch.cuantil(q)
+
+    def describe(self):
+        """Equivalente a Series.describe() sin recorrer la serie"""
+        return pd.Series({
+            'count': float(self.cantidad),
+            'mean': self.media,
+            'std': self.desviacion,
+            'min': self.minimo,
+            '25%': self.cuantil(0.25),
+            '50%': self.cuantil(0.5),
+            '75%': self.cuantil(0.75),
+            'max': self.maximo,
+        }, name='valor')
+
+    def a_dict(self):
+        """Representación serializable en JSON (para los metadatos de la cache)"""
+        datos = {nombre: valor for nombre, valor in vars(self).items() if nombre != 'sketch'}
+        datos['sketch'] = {'capacidad': self.sketch.capacidad, 'niveles': self.sketch.niveles}
+        return datos
+
+    @classmethod
+    def desde_dict(cls, datos):
+        resumen = cls()
+        for nombre, valor in datos.items():
+            # Se ignoran campos que ya no existen (metadatos guardados por versiones anteriores)
+            if nombre != 'sketch' and nombre in vars(resumen):
+                setattr(resumen, nombre, valor)
+        resumen.sketch = SketchCuantiles(datos['sketch']['capacidad'], datos['sketch']['niveles'])
+        return resumen
@@ -0,0 +1,341 @@
+"""
+Servidor local que simula mindicador.cl y Gael Cloud (sin conexión a internet)
+
+Responde las mismas rutas que usa la aplicación:
+
+    /api/{indicador}/{año}    serie de un año
+    /api/{indicador}          últimos 30 valores
+    /general/public/sismos    sismos recientes
+
+Si existe una respuesta grabada en el directorio de fixtures (misma ruta con
+extensión .json, p. ej. fixtures/api/uf/2024.json) se entrega tal cual; si no,
+se genera una respuesta sintética determinista a partir de la ruta y de la
+fecha de referencia (por defecto el día en que se inicia el servidor, fija con
+--fecha), de modo que dos ejecuciones con la misma configuración y la misma
+fecha reciben los mismos datos. /api/{indicador} entrega los últimos valores
+de las mismas series anuales que /api/{indicador}/{año}.
+
+La latencia, la tasa de errores y el tamaño de las respuestas son
+configurables. Para usarlo, la aplicación se apunta al servidor con las
+variables MINDICADOR_API_URL y SISMOS_API_URL (y, para no mezclar datos
+simulados con la cache real, DATA_DIR):
+
+    python -m utils.servidor_simulado --puerto 8765 --latencia 50 --tasa-error 0.05
+    MINDICADOR_API_URL=http://127.0.0.1:8765/api \\
+    SISMOS_API_URL=http://127.0.0.1:8765/general/public/sismos \\
+    DATA_DIR=/tmp/dataviz streamlit run app.py
+
+Las fixtures se graban desde las APIs reales con --grabar.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+URL_MINDICADOR_REAL = 'https://mindicador.cl/api'
+URL_SISMOS_REAL = 'https://api.gael.cloud/general/public/sismos'
+
+RUTA_INDICADORES = '/api'
+RUTA_SISMOS = '/general/public/sismos'
+
+DIRECTORIO_FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   'ejemplos', 'fixtures')
+
+# Valor inicial y variación diaria típica de cada indicador sintético
+PERFILES_INDICADORES = {
+    'uf': ('Unidad de fomento (UF)', 'Pesos', 35000.0, 0.0002),
+    'dolar': ('Dólar observado', 'Pesos', 900.0, 0.006),
+    'euro': ('Euro', 'Pesos', 980.0, 0.006),
+    'ipc': ('Indice de Precios al Consumidor (IPC)', 'Porcentaje', 0.4, 0.3),
+    'utm': ('Unidad Tributaria Mensual (UTM)', 'Pesos', 63000.0, 0.003),
+    'tpm': ('Tasa Política Monetaria (TPM)', 'Porcentaje', 8.0, 0.01),
+    'bitcoin': ('Bitcoin', 'Dólar', 40000.0, 0.03),
+}
+
+# Indicadores que se publican una vez al mes
+INDICADORES_MENSUALES = {'ipc', 'utm'}
+
+LUGARES = ['Arica', 'Iquique', 'Calama', 'Antofagasta', 'Copiapó', 'La Serena', 'Ovalle',
+           'Valparaíso', 'Santiago', 'Rancagua', 'Talca', 'Concepción', 'Temuco', 'Valdivia']
+
+
+class Configuracion:
+    """Comportamiento simulado del servidor"""
+
+    def __init__(self, latencia_ms=0, variacion_ms=0, tasa_error=0.0, puntos_por_dia=1, cantidad_sismos=100,
+                 directorio_fixtures=DIRECTORIO_FIXTURES, solo_fixtures=False, semilla=0, fecha_referencia=None):
+        self.latencia_ms = latencia_ms
+        self.variacion_ms = variacion_ms
+        self.tasa_error = tasa_error
+        self.puntos_por_dia = puntos_por_dia
+        self.cantidad_sismos = cantidad_sismos
+        self.directorio_fixtures = directorio_fixtures
+        self.solo_fixtures = solo_fixtures
+        self.semilla = semilla
+        # "Hoy" de los datos sintéticos; queda fija mientras el servidor esté en marcha
+        self.fecha_referencia = fecha_referencia or date.today()
+        # Los errores se sortean con un generador propio para que la secuencia sea reproducible
+        self._azar = random.Random(semilla)
+        self._lock = threading.Lock()
+
+    def sortear_error(self):
+        with self._lock:
+            return self._azar.random() < self.tasa_error
+
+    def sortear_latencia(self):
+        with self._lock:
+            variacion = self._azar.uniform(-self.variacion_ms, self.variacion_ms) if self.variacion_ms else 0
+        return max(0.0, self.latencia_ms + variacion) / 1000
+
+
+def _generador(ruta, semilla):
+    """Generador aleatorio determinado por la ruta pedida"""
+    return random.Random(zlib.crc32(ruta.encode()) ^ semilla)
+
+
+def serie_sintetica(indicador, año, puntos_por_dia=1, semilla=0, hoy=None):
+    """Respuesta con el formato de mindicador.cl; año=None entrega los últimos 30 valores
+
+    Los últimos valores se toman de las series anuales (la del año de `hoy` y,
+    si no alcanzan, las anteriores), así que coinciden con /api/{indicador}/{año}.
+    """
+    hoy = hoy or date.today()
+    if año is None:
+        registros = []
+        año_serie = hoy.year
+        while len(registros) < 30 and año_serie >= hoy.year - 5:
+            registros.extend(_registros_año(indicador, año_serie, puntos_por_dia, semilla, hoy))
+            año_serie -= 1
+        registros = registros[:30]
+    else:
+        registros = _registros_año(indicador, int(año), puntos_por_dia, semilla, hoy)
+
+    nombre, unidad, _, _ = PERFILES_INDICADORES.get(indicador, (indicador, 'Pesos', 1000.0, 0.005))
+    return {
+        'version': '1.7.0',
+        'autor': 'servidor_simulado',
+        'codigo': indicador,
+        'nombre': nombre,
+        'unidad_medida': unidad,
+        'serie': registros,
+    }
+
+
+def _registros_año(indicador, año, puntos_por_dia, semilla, hoy):
+    """Valores de un año (hasta `hoy`), del más reciente al más antiguo como mindicador.cl"""
+    _, _, inicial, variacion = PERFILES_INDICADORES.get(indicador, (indicador, 'Pesos', 1000.0, 0.005))
+    azar = _generador(f'{indicador}/{año}', semilla)
+    desde = date(año, 1, 1)
+    hasta = min(date(año, 12, 31), hoy)
+
+    registros = []
+    valor = inicial * (1 + variacion) ** ((desde.year - 2020) * 12)
+    dia = desde
+    while dia <= hasta:
+        if indicador not in INDICADORES_MENSUALES or dia.day == 1:
+            for paso in range(puntos_por_dia):
+                instante = datetime(dia.year, dia.month, dia.day, 3) + timedelta(days=paso / puntos_por_dia)
+                if indicador == 'ipc':
+                    valor = round(azar.gauss(0.4, variacion), 1)
+                else:
+                    valor *= 1 + azar.gauss(variacion / 10, variacion)
+                registros.append({'fecha': instante.strftime('%Y-%m-%dT%H:%M:%S.000Z'), 'valor': round(valor, 2)})
+        dia += timedelta(days=1)
+
+    registros.reverse()
+    return registros
+
+
+def sismos_sinteticos(cantidad=100, semilla=0, hoy=None):
+    """Respuesta con el formato de Gael Cloud: los sismos más recientes primero
+
+    El sismo más reciente es anterior al inicio del día `hoy` (por defecto la
+    fecha actual), de modo que la respuesta no cambia durante el día.
+    """
+    azar = _generador(f'sismos/{cantidad}', semilla)
+    instante = datetime.combine(hoy or date.today(), datetime.min.time())
+    sismos = []
+    for _ in range(cantidad):
+        instante -= timedelta(minutes=azar.randint(20, 600))
+        latitud = azar.uniform(-45.0, -18.0)
+        longitud = azar.uniform(-74.0, -68.0)
+        magnitud = round(min(8.5, 2.5 + azar.expovariate(1.2)), 1)
+        sismos.append({
+            'Fecha': instante.strftime('%Y-%m-%d %H:%M:%S'),
+            'Profundidad': str(azar.randint(5, 250)),
+            'Magnitud': f'{magnitud:.1f}',
+            'RefGeografica': f'{azar.randint(5, 120)} km al O de {azar.choice(LUGARES)}',
+            'FechaUpdate': (instante + timedelta(minutes=azar.randint(5, 60))).strftime('%Y-%m-%d %H:%M:%S'),
+            'Latitud': f'{latitud:.3f}',
+            'Longitud': f'{longitud:.3f}',
+        })
+    return sismos
+
+
+def ruta_fixture(directorio, ruta):
+    """Archivo de la respuesta grabada para una ruta (p. ej. /api/uf/2024 -> api/uf/2024.json)"""
+    partes = [parte for parte in ruta.strip('/').split('/') if parte not in ('', '.', '..')]
+    return os.path.join(directorio, *partes[:-1], f'{partes[-1]}.json') if partes else None
+
+
+def respuesta_sintetica(ruta, configuracion):
+    """Payload generado para la ruta, o None si la ruta no existe"""
+    if ruta.rstrip('/') == RUTA_SISMOS:
+        return sismos_sinteticos(configuracion.cantidad_sismos, configuracion.semilla, configuracion.fecha_referencia)
+    partes = ruta.strip('/').split('/')
+    if ruta.startswith(RUTA_INDICADORES + '/') and len(partes) in (2, 3):
+        año = partes[2] if len(partes) == 3 else None
+        if año is not None and not año.isdigit():
+            return None
+        return serie_sintetica(partes[1], año, configuracion.puntos_por_dia, configuracion.semilla,
+                               configuracion.fecha_referencia)
+    return None
+
+
+class ManejadorSimulado(BaseHTTPRequestHandler):
+    """Responde GET con fixtures o datos sintéticos según la configuración del servidor"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        configuracion = self.server.configuracion
+        ruta = self.path.split('?', 1)[0]
+
+        espera = configuracion.sortear_latencia()
+        if espera:
+            time.sleep(espera)
+
+        if configuracion.sortear_error():
+            self._responder(503, {'error': 'error simulado'})
+            return
+
+        archivo = ruta_fixture(configuracion.directorio_fixtures, ruta)
+        if archivo and os.path.isfile(archivo):
+            with open(archivo, 'rb') as f:
+                self._responder_bytes(200, f.read())
+            return
+
+        datos = None if configuracion.solo_fixtures else respuesta_sintetica(ruta, configuracion)
+        if datos is None:
+            self._responder(404, {'error': f'ruta no encontrada: {ruta}'})
+        else:
+            self._responder(200, datos)
+
+    def _responder(self, estado, datos):
+        self._responder_bytes(estado, json.dumps(datos, ensure_ascii=False).encode('utf-8'))
+
+    def _responder_bytes(self, estado, cuerpo):
+        self.send_response(estado)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        if self.server.verboso:
+            super().log_message(formato, *args)
+
+
+def crear_servidor(host='127.0.0.1', puerto=0, verboso=False, **configuracion):
+    """Crea el servidor (puerto=0 elige uno libre) sin iniciarlo"""
+    servidor = ThreadingHTTPServer((host, puerto), ManejadorSimulado)
+    servidor.daemon_threads = True
+    servidor.configuracion = Configuracion(**configuracion)
+    servidor.verboso = verboso
+    return servidor
+
+
+def urls(servidor):
+    """Variables de entorno que apuntan la aplicación al servidor"""
+    host, puerto = servidor.server_address[:2]
+    base = f'http://{host}:{puerto}'
+    return {
+        'MINDICADOR_API_URL': base + RUTA_INDICADORES,
+        'SISMOS_API_URL': base + RUTA_SISMOS,
+    }
+
+
+def iniciar_en_segundo_plano(**argumentos):
+    """Inicia el servidor en un hilo daemon; retorna (servidor, urls)
+
+    Se detiene con servidor.shutdown().
+    """
+    servidor = crear_servidor(**argumentos)
+    threading.Thread(target=servidor.serve_forever, name='servidor-simulado', daemon=True).start()
+    return servidor, urls(servidor)
+
+
+def grabar(indicadores, años, directorio=DIRECTORIO_FIXTURES, timeout=15):
+    """Graba en `directorio` las respuestas reales de los indicadores/años y de los sismos"""
+    rutas = [(f'{URL_MINDICADOR_REAL}/{indicador}/{año}', f'{RUTA_INDICADORES}/{indicador}/{año}')
+             for indicador in indicadores for año in años]
+    rutas.append((URL_SISMOS_REAL, RUTA_SISMOS))
+
+    for url, ruta in rutas:
+        try:
+            respuesta = requests.get(url, timeout=timeout)
+            respuesta.raise_for_status()
+        except requests.RequestException as e:
+            print(f"   ❌ {ruta}: {e}")
+            continue
+        archivo = ruta_fixture(directorio, ruta)
+        os.makedirs(os.path.dirname(archivo), exist_ok=True)
+        temporal = f'{archivo}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            f.write(respuesta.content)
+        os.replace(temporal, archivo)
+        print(f"   ✅ {ruta} ({hashlib.sha1(respuesta.content).hexdigest()[:8]}, {len(respuesta.content):,} bytes)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor local que simula mindicador.cl y Gael Cloud")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('-p', '--puerto', type=int, default=8765)
+    parser.add_argument('--latencia', type=float, default=0, help="latencia media por respuesta (ms)")
+    parser.add_argument('--variacion', type=float, default=0, help="variación uniforme de la latencia (± ms)")
+    parser.add_argument('--tasa-error', type=float, default=0.0, help="proporción de respuestas 503 (0 a 1)")
+    parser.add_argument('--puntos-por-dia', type=int, default=1, help="tamaño de las series sintéticas")
+    parser.add_argument('--sismos', type=int, default=100, help="sismos por respuesta sintética")
+    parser.add_argument('--fixtures', default=DIRECTORIO_FIXTURES, help="directorio de respuestas grabadas")
+    parser.add_argument('--solo-fixtures', action='store_true', help="responde 404 si no hay respuesta grabada")
+    parser.add_argument('--semilla', type=int, default=0, help="semilla de los datos sintéticos y de los errores")
+    parser.add_argument('--fecha', type=date.fromisoformat,
+                        help="fecha de referencia de los datos sintéticos (AAAA-MM-DD, por defecto hoy)")
+    parser.add_argument('-v', '--verboso', action='store_true', help="registra cada solicitud")
+    parser.add_argument('--grabar', nargs='+', metavar='INDICADOR',
+                        help="graba las respuestas reales de estos indicadores (y de los sismos) y termina")
+    parser.add_argument('--años', nargs='+', default=[str(date.today().year)], help="años a grabar con --grabar")
+    args = parser.parse_args(argv)
+
+    if args.grabar:
+        print(f"🎙️  Grabando respuestas en {args.fixtures}...")
+        grabar(args.grabar, args.años, args.fixtures)
+        return
+
+    servidor = crear_servidor(args.host, args.puerto, verboso=args.verboso, latencia_ms=args.latencia,
+                              variacion_ms=args.variacion, tasa_error=args.tasa_error,
+                              puntos_por_dia=args.puntos_por_dia, cantidad_sismos=args.sismos,
+                              directorio_fixtures=args.fixtures, solo_fixtures=args.solo_fixtures,
+                              semilla=args.semilla, fecha_referencia=args.fecha)
+    print(f"🧪 Servidor simulado en http://{args.host}:{servidor.server_address[1]}")
+    for variable, valor in urls(servidor).items():
+        print(f"   {variable}={valor}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
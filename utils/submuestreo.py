@@ -0,0 +1,93 @@
+"""
+Submuestreo de series de tiempo para gráficos (LTTB y min-max)
+
+Reduce la cantidad de puntos que se envían al navegador en los gráficos de
+línea/área conservando su forma visual. La cantidad de puntos se calcula a
+partir del ancho del gráfico en píxeles.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Ancho aproximado de un gráfico a todo el ancho en layout "wide"
+ANCHO_GRAFICO_PX = 1200
+
+# Puntos por píxel: sobre ~2 puntos por píxel la diferencia no es visible
+PUNTOS_POR_PX = 2
+
+
+def puntos_para_ancho(ancho_px=ANCHO_GRAFICO_PX, puntos_por_px=PUNTOS_POR_PX):
+    """Cantidad de puntos a dibujar para un gráfico de `ancho_px` píxeles"""
+    return max(3, int(ancho_px * puntos_por_px))
+
+
+def indices_lttb(x, y, n):
+    """Índices de los puntos elegidos por Largest-Triangle-Three-Buckets"""
+    largo = len(x)
+    if n >= largo or n < 3:
+        return np.arange(largo)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # El primer y el último punto siempre se conservan; el resto se reparte en n-2 grupos
+    limites = np.linspace(1, largo - 1, n - 1).astype(np.int64)
+    indices = np.empty(n, dtype=np.int64)
+    indices[0], indices[-1] = 0, largo - 1
+
+    anterior = 0
+    for i in range(n - 2):
+        inicio, fin = limites[i], limites[i + 1]
+        siguiente_fin = limites[i + 2] if i + 2 < len(limites) else largo
+        promedio_x = x[fin:siguiente_fin].mean()
+        promedio_y = y[fin:siguiente_fin].mean()
+
+        # Se elige el punto del grupo que forma el triángulo de mayor área con
+        # el punto elegido anterior y el promedio del grupo siguiente
+        areas = np.abs((x[anterior] - promedio_x) * (y[inicio:fin] - y[anterior])
+                       - (x[anterior] - x[inicio:fin]) * (promedio_y - y[anterior]))
+        anterior = inicio + int(np.argmax(areas))
+        indices[i + 1] = anterior
+
+    return indices
+
+
+def indices_minmax(y, n):
+    """Índices del mínimo y el máximo de cada grupo (conserva los picos exactos)"""
+    largo = len(y)
+    if n >= largo or n < 2:
+        return np.arange(largo)
+
+    y = np.asarray(y, dtype=np.float64)
+    limites = np.linspace(0, largo, n // 2 + 1).astype(np.int64)
+    indices = []
+    for inicio, fin in zip(limites[:-1], limites[1:]):
+        if fin > inicio:
+            grupo = y[inicio:fin]
+            indices.extend(sorted((inicio + int(np.argmin(grupo)), inicio + int(np.argmax(grupo)))))
+    return np.unique(indices)
+
+
+def submuestrear(df, columna_y, columna_x=None, ancho_px=ANCHO_GRAFICO_PX, metodo='lttb'):
+    """Retorna las filas de `df` necesarias para dibujar `columna_y` en `ancho_px` píxeles
+
+    El eje x es el índice (fechas) salvo que se indique `columna_x`. Las filas
+    con valores nulos en y se descartan.
+    """
+    n = puntos_para_ancho(ancho_px)
+    if len(df) <= n:
+        return df
+
+    df = df[df[columna_y].notna()]
+    eje_x = df.index if columna_x is None else df[columna_x]
+    if isinstance(eje_x.dtype, pd.DatetimeTZDtype) or eje_x.dtype.kind == 'M':
+        x = pd.DatetimeIndex(eje_x).asi8
+    else:
+        x = eje_x.to_numpy()
+    y = df[columna_y].to_numpy()
+
+    if metodo == 'minmax':
+        indices = indices_minmax(y, n)
+    else:
+        indices = indices_lttb(x, y, n)
+    return df.iloc[indices]